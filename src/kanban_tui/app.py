@@ -1,6 +1,7 @@
 from __future__ import annotations
 from pathlib import Path
 from importlib.metadata import version
+from collections.abc import Iterator
 
 from textual import on, work
 from textual.app import App
@@ -20,6 +21,7 @@ from kanban_tui.config import (
     Settings,
 )
 from kanban_tui.backends import SqliteBackend
+from kanban_tui.backends.base import merge_task_page
 from kanban_tui.classes.task import Task
 from kanban_tui.classes.board import Board
 from kanban_tui.classes.column import Column
@@ -54,6 +56,7 @@ class KanbanTui(App[str | None]):
     task_list: reactive[list[Task]] = reactive([], init=False)
     board_list: reactive[list[Board]] = reactive([], init=False)
     column_list: reactive[list[Column]] = reactive([], init=False)
+    loading_tasks: reactive[bool] = reactive(False, init=False)
     active_board: reactive[Board | None] = reactive(None, init=False)
 
     def __init__(
@@ -73,6 +76,12 @@ class KanbanTui(App[str | None]):
         self.auth_only = auth_only
         self.backend = self.get_backend()
         self.auto_refresh_timer: Timer | None = None
+        self.last_event_id: int = 0
+        self.task_list_board_id: int | None = None
+        self.loading_task_pages: Iterator[list[Task]] | None = None
+        # lookups built from the loaded lists, rebuilt once the list is replaced
+        self._column_name_index: tuple[list[Column], dict[int, str]] | None = None
+        self._task_index: tuple[list[Task], dict[int, Task]] | None = None
 
     def get_backend(self):
         match self.config.backend.mode:
@@ -93,23 +102,48 @@ class KanbanTui(App[str | None]):
 
         return backend
 
-    @work()
     async def on_mount(self) -> None:
         self.theme = self.config.board.theme
         self.configure_auto_refresh()
 
         if self.auth_only:
-            await self.show_auth_screen_only()
+            self.show_auth_screen_only()
             return
 
+        # the initial board is loaded before it is shown
+        self.last_event_id = await self.backend.get_latest_event_id_async()
+        self.board_list = await self.backend.get_boards_async()
+        # the active board, its columns and the first task page load in turn
+        for group in ("active-board", "column-list", "task-list"):
+            await self.wait_for_worker_group(group)
+
         if self.demo_mode:
             self.show_demo_notification()
 
-        self.update_board_list()
-
-        screen = self.get_screen("board").data_bind(KanbanTui.active_board)
+        screen = self.get_screen("board").data_bind(
+            KanbanTui.active_board, KanbanTui.loading_tasks
+        )
         await self.push_screen(screen)
 
+        if self.config.backend.mode == Backends.SQLITE:
+            retention = self.config.backend.sqlite_settings.audit_retention
+            if retention.auto_compact and (
+                retention.max_age_days or retention.max_rows
+            ):
+                self.compact_audits()
+
+    def on_unmount(self) -> None:
+        self.backend.close()
+
+    @work(thread=True, exclusive=True, exit_on_error=False, group="audit-compaction")
+    def compact_audits(self) -> None:
+        """Applies the audit retention without blocking the backend I/O thread
+
+        Changes the app has not refreshed yet are kept for the change tracking.
+        """
+        self.backend.compact_audits(max_event_id=self.last_event_id)
+
+    @work()
     async def show_auth_screen_only(self):
         await self.push_screen_wait(ModalAuthScreen())
         self.exit(self.backend.api_key)
@@ -177,6 +211,7 @@ class KanbanTui(App[str | None]):
                     message="Read-only mode: viewing Claude Code tasks from ~/.claude/tasks/",
                     severity="information",
                 )
+        self.backend.close()
         self.backend = self.get_backend()
         # This make the checkmark on the new backend
         event.select.update_values()
@@ -186,7 +221,11 @@ class KanbanTui(App[str | None]):
         self.board_list = self.backend.get_boards()
 
     def watch_board_list(self):
-        self.active_board = self.backend.active_board
+        self.load_active_board()
+
+    @work(exclusive=True, group="active-board")
+    async def load_active_board(self) -> None:
+        self.active_board = await self.backend.get_active_board_async()
 
     def watch_active_board(self, old_board: Board | None, new_board: Board):
         if self.active_board:
@@ -202,13 +241,13 @@ class KanbanTui(App[str | None]):
                 case Backends.JIRA:
                     self.config.set_active_jql(new_jql=self.active_board.board_id)
 
-        self.update_column_list()
+        self.load_column_list()
         # If updating Board, refresh setting screen
         if old_board:
             self.get_screen("settings", SettingsScreen).needs_refresh = True
 
     def watch_column_list(self):
-        self.update_task_list()
+        self.load_task_list()
 
     def watch_theme(self, new_theme: str):
         self.config.set_theme(new_theme)
@@ -246,23 +285,169 @@ class KanbanTui(App[str | None]):
 
     def handle_auto_refresh_tick(self) -> None:
         if isinstance(self.screen, BoardScreen) and not self.needs_refresh:
+            self.refresh_changes()
+
+    @work(exclusive=True, group="refresh-changes")
+    async def refresh_changes(self) -> None:
+        """Reloads only what changed since the last refresh
+
+        Falls back to a full refresh for backends without change tracking.
+        """
+        changes = await self.backend.get_changes_since_async(self.last_event_id)
+        if changes is None:
+            self.action_refresh()
+            return
+        if not changes:
+            return
+
+        self.last_event_id = changes[-1].event_id
+        if any(event.object_type != "task" for event in changes):
             self.action_refresh()
+            return
+
+        # Only tasks changed, boards and columns can be kept
+        active_board_id = self.active_board.board_id if self.active_board else None
+        if (
+            self.loading_task_pages is not None
+            or self.task_list_board_id != active_board_id
+        ):
+            self.load_task_list()
+            return
+
+        changed_ids = sorted({event.object_id for event in changes})
+        changed_tasks = await self.backend.get_tasks_by_ids_async(changed_ids)
+        self.task_list = self.patch_task_list(set(changed_ids), changed_tasks)
+        await self.get_screen("board", BoardScreen).show_loaded_tasks()
+
+    def patch_task_list(
+        self, changed_ids: set[int], changed_tasks: list[Task]
+    ) -> list[Task]:
+        """Task list with the changed tasks replaced, deleted tasks and tasks
+        moved to other boards are dropped
+
+        Changed tasks are inserted at their position, the other tasks of a
+        column keep their order.
+        """
+        tasks_by_column: dict[int, list[Task]] = {
+            column.column_id: [] for column in self.column_list
+        }
+        for task in self.task_list:
+            if task.task_id not in changed_ids and task.column in tasks_by_column:
+                tasks_by_column[task.column].append(task)
+
+        for task in sorted(changed_tasks, key=lambda task: task.position):
+            if task.column in tasks_by_column:
+                tasks_by_column[task.column].insert(task.position, task)
+        return [task for tasks in tasks_by_column.values() for task in tasks]
 
     def action_refresh(self):
         if self.needs_refresh:
             return
-        self.update_board_list()
-        self.watch_column_list()
-        # used a worker here, so no await
         self.needs_refresh = True
+        self.reload_board()
+
+    @work(exclusive=True, group="board-reload")
+    async def reload_board(self) -> None:
+        """Reloads boards, columns and tasks without blocking the app"""
+        # changes made while reloading are picked up by the next refresh
+        self.last_event_id = await self.backend.get_latest_event_id_async()
+        self.backend.clear_cache()
+        self.board_list = await self.backend.get_boards_async()
+        self.column_list = await self.backend.get_columns_async()
         self.get_screen("board", BoardScreen).load_kanban_board()
 
     def update_task_list(self):
-        self.task_list = self.backend.get_tasks_on_active_board()
+        """Loads all tasks of the active board right away
+
+        Used after changes made in the app, which should be visible at once,
+        a running `load_task_list` is superseded. Async handlers use
+        `update_task_list_async` instead.
+        """
+        self.loading_task_pages = None
+        self.loading_tasks = False
+        self.task_list_board_id = (
+            self.active_board.board_id if self.active_board else None
+        )
+        tasks: list[Task] = []
+        for page in self.backend.iter_task_pages_on_active_board():
+            tasks = merge_task_page(tasks, page)
+        self.task_list = tasks
+
+    @work(exclusive=True, group="task-list")
+    async def load_task_list(self) -> None:
+        """Loads the tasks of the active board off the event loop
+
+        A newly shown board is in a loading state until the first page of
+        tasks arrived and fills in while the remaining pages arrive, reloads
+        of the shown board replace the task list once all pages are loaded.
+        """
+        pages = self.backend.iter_task_pages_on_active_board()
+        self.loading_task_pages = pages
+        board_id = self.active_board.board_id if self.active_board else None
+        board_screen = self.get_screen("board", BoardScreen)
+
+        if board_id == self.task_list_board_id:
+            tasks: list[Task] = []
+            while (
+                page := await self.backend.get_next_task_page_async(pages)
+            ) is not None:
+                tasks = merge_task_page(tasks, page)
+            # pages of a replaced task list are dropped
+            if pages is self.loading_task_pages:
+                self.loading_task_pages = None
+                self.task_list = tasks
+                await board_screen.show_loaded_tasks()
+            return
+
+        self.loading_tasks = True
+        try:
+            page = await self.backend.get_next_task_page_async(pages)
+        finally:
+            if pages is self.loading_task_pages:
+                self.loading_tasks = False
+        if pages is not self.loading_task_pages:
+            return
+
+        self.task_list_board_id = board_id
+        self.task_list = page or []
+        await board_screen.show_loaded_tasks()
+        self.load_remaining_task_pages(pages)
+
+    @work(exclusive=True, group="task-pages")
+    async def load_remaining_task_pages(self, pages: Iterator[list[Task]]) -> None:
+        while (page := await self.backend.get_next_task_page_async(pages)) is not None:
+            if pages is not self.loading_task_pages:
+                return
+            if page:
+                self.task_list = merge_task_page(self.task_list, page)
+                await self.get_screen("board", BoardScreen).show_loaded_tasks()
+        if pages is self.loading_task_pages:
+            self.loading_task_pages = None
+
+    async def update_task_list_async(self) -> None:
+        """Like `update_task_list`, but loads the tasks on the I/O thread"""
+        self.loading_task_pages = None
+        self.loading_tasks = False
+        board_id = self.active_board.board_id if self.active_board else None
+        tasks = await self.backend.get_tasks_on_active_board_async()
+        self.task_list_board_id = board_id
+        self.task_list = tasks
 
     def update_column_list(self):
         self.column_list = self.backend.get_columns()
 
+    @work(exclusive=True, group="column-list")
+    async def load_column_list(self) -> None:
+        """Loads the columns of a newly active board off the event loop"""
+        self.column_list = await self.backend.get_columns_async()
+
+    async def wait_for_worker_group(self, group: str) -> None:
+        """Waits for the running workers of `group`, others keep running"""
+        workers = [worker for worker in self.workers if worker.group == group]
+        # an empty list would wait for all workers
+        if workers:
+            await self.workers.wait_for_complete(workers)
+
     def get_possible_next_column_id(self, current_id: int) -> int:
         column_id_list = list(self.visible_column_dict.keys())
         if column_id_list[-1] == current_id:
@@ -279,6 +464,28 @@ class KanbanTui(App[str | None]):
     def visible_column_dict(self) -> dict[int, str]:
         return {col.column_id: col.name for col in self.column_list if col.visible}
 
+    @property
+    def column_name_dict(self) -> dict[int, str]:
+        """Names of all columns of the active board by column id"""
+        if self._column_name_index is None or (
+            self._column_name_index[0] is not self.column_list
+        ):
+            self._column_name_index = (
+                self.column_list,
+                {col.column_id: col.name for col in self.column_list},
+            )
+        return self._column_name_index[1]
+
+    @property
+    def task_dict(self) -> dict[int, Task]:
+        """Loaded tasks of the active board by task id"""
+        if self._task_index is None or self._task_index[0] is not self.task_list:
+            self._task_index = (
+                self.task_list,
+                {task.task_id: task for task in self.task_list},
+            )
+        return self._task_index[1]
+
     @property
     def visible_task_list(self) -> list[Task]:
         return [
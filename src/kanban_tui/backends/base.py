@@ -1,5 +1,33 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+
+
+def merge_task_page(tasks: list, page: list) -> list:
+    """Tasks with the tasks of the next page merged in
+
+    Pages may repeat tasks of earlier pages with updated fields, e.g. links
+    to issues of later pages, these replace the earlier ones in place.
+    """
+    tasks_by_id = {task.task_id: task for task in tasks}
+    tasks_by_id.update((task.task_id, task) for task in page)
+    return list(tasks_by_id.values())
+
+
 class Backend:
-    """Base Backend Class"""
+    """Base Backend Class
+
+    Next to the blocking interface every backend offers `*_async` variants,
+    which run the blocking calls on a dedicated I/O thread, so the event
+    loop of the app keeps handling input while a backend is busy.
+
+    Backends create a `_cache_lock` in `__post_init__`, which guards their
+    caches, as they are used from the app and from the I/O thread.
+    """
+
+    _io_executor: ThreadPoolExecutor | None = None
+    _cache_lock: threading.RLock
 
     def get_boards(self):
         raise NotImplementedError("This is required")
@@ -10,6 +38,15 @@ class Backend:
     def get_tasks_on_active_board(self):
         raise NotImplementedError("This is required")
 
+    def iter_task_pages_on_active_board(self):
+        """Tasks of the active board in pages, backends loading pages lazily
+        yield them as they arrive, all others return a single page
+
+        Yielded tasks are never changed afterwards, later pages can repeat
+        tasks with updated fields instead, see `merge_task_page`.
+        """
+        yield self.get_tasks_on_active_board()
+
     def update_task_status(
         self,
         new_task,
@@ -17,3 +54,67 @@ class Backend:
         append_mode=None,
     ):
         raise NotImplementedError("This is required")
+
+    def get_latest_event_id(self):
+        """Latest change event id, used as starting point for `get_changes_since`"""
+        return 0
+
+    def get_changes_since(self, event_id):
+        """Changes after `event_id`, None if the backend does not track changes
+        or can not tell all of them, the app then reloads everything
+        """
+
+    def clear_cache(self):
+        """Drop cached lookups, so they are loaded fresh on next access"""
+
+    def close(self):
+        """Release held resources like open connections"""
+        if self._io_executor is not None:
+            self._io_executor.shutdown(wait=True, cancel_futures=True)
+            self._io_executor = None
+
+    # Async interface
+    async def run_io(self, func, *args, **kwargs):
+        """Run a blocking backend call on the I/O thread of the backend
+
+        Calls run one after another in the order they were issued, so a
+        read issued after a write sees its result.
+        """
+        if self._io_executor is None:
+            self._io_executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix=f"{type(self).__name__}-io"
+            )
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._io_executor, partial(func, *args, **kwargs)
+        )
+
+    async def get_boards_async(self):
+        return await self.run_io(self.get_boards)
+
+    async def get_active_board_async(self):
+        return await self.run_io(lambda: self.active_board)
+
+    async def get_columns_async(self):
+        return await self.run_io(self.get_columns)
+
+    async def get_tasks_on_active_board_async(self):
+        return await self.run_io(self.get_tasks_on_active_board)
+
+    async def get_tasks_by_ids_async(self, task_ids):
+        return await self.run_io(self.get_tasks_by_ids, task_ids)
+
+    async def get_next_task_page_async(self, pages):
+        """Next page of an `iter_task_pages_on_active_board` iterator, None
+        once all pages were loaded
+        """
+        return await self.run_io(next, pages, None)
+
+    async def get_board_infos_async(self):
+        return await self.run_io(self.get_board_infos)
+
+    async def get_latest_event_id_async(self):
+        return await self.run_io(self.get_latest_event_id)
+
+    async def get_changes_since_async(self, event_id):
+        return await self.run_io(self.get_changes_since, event_id)
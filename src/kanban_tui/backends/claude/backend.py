@@ -1,7 +1,9 @@
 from __future__ import annotations
+import copy
 import os
 import json
 import shutil
+import threading
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
@@ -15,6 +17,17 @@ from kanban_tui.classes.task import Task
 from kanban_tui.config import ClaudeBackendSettings
 
 
+def _copy_task(task: Task) -> Task:
+    """Copies the task and its mutable fields, cheaper than a deep copy"""
+    return task.model_copy(
+        update={
+            "blocked_by": task.blocked_by.copy(),
+            "blocking": task.blocking.copy(),
+            "metadata": copy.deepcopy(task.metadata),
+        }
+    )
+
+
 @dataclass
 class ClaudeBackend(Backend):
     """Read-only backend for Claude Code task lists.
@@ -47,14 +60,41 @@ class ClaudeBackend(Backend):
         self._column_id_to_status = {
             column_id: status for status, column_id in self._status_to_column_id.items()
         }
+        self._cache_lock = threading.RLock()
+        # Board/session registry, rebuilt after `clear_cache` or when sessions
+        # are added/removed (changes the mtime of the base directory)
+        self._boards: list[Board] | None = None
+        self._boards_signature: int | None = None
+        self._session_ids_by_board: dict[int, str] = {}
+        # Per session: task file name -> ((st_mtime_ns, st_size), parsed task)
+        self._task_index: dict[
+            Path, dict[str, tuple[tuple[int, int], Task | None]]
+        ] = {}
 
     # === Board Management ===
 
     def get_boards(self) -> list[Board]:
         """Get all boards (one per Claude session directory)."""
-        if not self._tasks_base_path.exists():
+        return list(self._get_board_registry())
+
+    def _get_board_registry(self) -> list[Board]:
+        """Returns the memoized boards, scanning the sessions only if needed."""
+        try:
+            signature = self._tasks_base_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            self.clear_cache()
             return []
 
+        with self._cache_lock:
+            if self._boards is None or signature != self._boards_signature:
+                self._boards = self._scan_boards()
+                self._boards_signature = signature
+                self._session_ids_by_board = {
+                    board.board_id: board.name for board in self._boards
+                }
+            return self._boards
+
+    def _scan_boards(self) -> list[Board]:
         boards = []
         for idx, session_dir in enumerate(
             sorted(self._tasks_base_path.iterdir()), start=1
@@ -75,10 +115,17 @@ class ClaudeBackend(Backend):
                 )
         return boards
 
+    def clear_cache(self):
+        """Forgets the board registry, sessions are scanned again on next access."""
+        with self._cache_lock:
+            self._boards = None
+            self._boards_signature = None
+            self._session_ids_by_board = {}
+
     @property
     def active_board(self) -> Board:
         """Get the currently active board based on settings."""
-        boards = self.get_boards()
+        boards = self._get_board_registry()
         if not boards:
             raise Exception("No Claude task sessions found")
 
@@ -157,11 +204,10 @@ class ClaudeBackend(Backend):
 
     def _get_session_id_for_board(self, board_id: int) -> str:
         """Get session ID for a board ID."""
-        boards = self.get_boards()
-        for board in boards:
-            if board.board_id == board_id:
-                return board.name
-        return ""
+        with self._cache_lock:
+            if board_id not in self._session_ids_by_board:
+                self._get_board_registry()
+            return self._session_ids_by_board.get(board_id, "")
 
     def _get_session_path(self, board_id: int) -> Path:
         """Get the file system path for a session/board."""
@@ -174,17 +220,53 @@ class ClaudeBackend(Backend):
 
     def get_tasks_by_board(self, board_id: int) -> list[Task]:
         """Get all tasks for a specific board/session."""
+        # validate the registry once, the task conversion reuses it
+        self._get_board_registry()
         session_path = self._get_session_path(board_id)
-        if not session_path.exists():
-            return []
+        with self._cache_lock:
+            if not session_path.is_dir():
+                self._task_index.pop(session_path, None)
+                return []
+            index = self._update_task_index(session_path, board_id)
+        # copies, so changes on returned tasks do not leak into the index
+        return [
+            _copy_task(task)
+            for _file_name, (_signature, task) in sorted(index.items())
+            if task is not None
+        ]
 
-        tasks = []
-        for task_file in sorted(session_path.glob("*.json")):
-            claude_task = self._read_task_file(task_file)
-            if claude_task:
-                tasks.append(self._claude_task_to_kanban(claude_task, board_id))
+    def _update_task_index(
+        self, session_path: Path, board_id: int
+    ) -> dict[str, tuple[tuple[int, int], Task | None]]:
+        """Re-parses only task files which changed since the last call
+
+        Files are compared by modification time and size, removed files are
+        dropped from the index.
+        """
+        previous_index = self._task_index.get(session_path, {})
+        index = {}
+        with os.scandir(session_path) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                signature = (stat.st_mtime_ns, stat.st_size)
+
+                indexed = previous_index.get(entry.name)
+                if indexed is not None and indexed[0] == signature:
+                    index[entry.name] = indexed
+                    continue
+
+                claude_task = self._read_task_file(Path(entry.path))
+                task = (
+                    self._claude_task_to_kanban(claude_task, board_id)
+                    if claude_task
+                    else None
+                )
+                index[entry.name] = (signature, task)
 
-        return tasks
+        self._task_index[session_path] = index
+        return index
 
     def get_task_by_id(self, task_id: int) -> Task | None:
         """Get a specific task by ID."""
@@ -220,6 +302,7 @@ class ClaudeBackend(Backend):
     def delete_board(self, board_id: int):
         board_path = self._get_session_path(board_id)
         shutil.rmtree(board_path)
+        self.clear_cache()
 
     def update_board(self, board_id: int, name: str, icon: str):
         raise NotImplementedError("Claude backend is read-only. Cannot update boards.")
@@ -1,10 +1,14 @@
+from collections import defaultdict
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import UTC, datetime
+import threading
+import time
 
 from atlassian import Jira
 
 from kanban_tui.backends.auth import AuthSettings
-from kanban_tui.backends.base import Backend
+from kanban_tui.backends.base import Backend, merge_task_page
 from kanban_tui.classes.board import Board
 from kanban_tui.classes.category import Category
 from kanban_tui.classes.column import Column
@@ -12,11 +16,15 @@ from kanban_tui.classes.task import Task
 from kanban_tui.config import JiraBackendSettings, JqlEntry
 from kanban_tui.backends.auth import init_auth_file
 from kanban_tui.backends.jira.jira_api import (
-    get_jql,
+    iter_jql_pages,
+    get_issues_by_ids,
+    get_jqls_stats,
+    sync_jql_issues,
     authenticate_to_jira,
     get_transitions,
     set_issue_status,
 )
+from kanban_tui.backends.jira.issue_cache import JiraIssueCache
 from kanban_tui.backends.jira.models import JiraIssue
 
 
@@ -30,6 +38,18 @@ class JiraBackend(Backend):
         init_auth_file(self.settings.auth_file_path)
         self.auth_settings = AuthSettings()
         self.get_authentication()
+        self._cache_lock = threading.RLock()
+        # (queried jqls, monotonic load time, board infos)
+        self._board_info_cache: tuple[tuple, float, list[dict]] | None = None
+        # board_id -> (column mapping, issue id -> (updated, converted task))
+        self._task_index: dict[
+            int, tuple[dict[str, int], dict[str, tuple[str | None, Task]]]
+        ] = {}
+        self._issue_cache: JiraIssueCache | None = None
+
+    def clear_cache(self):
+        with self._cache_lock:
+            self._board_info_cache = None
 
     def get_authentication(self):
         self.auth = authenticate_to_jira(
@@ -65,27 +85,42 @@ class JiraBackend(Backend):
         return []
 
     def get_board_infos(self) -> list[dict]:
-        """Return info about the virtual Jira boards"""
+        """Return info about the virtual Jira boards
+
+        Only issue totals and the next due date are queried, for all boards in
+        parallel. Results are cached for `board_info_ttl` seconds.
+        """
         boards = self.get_boards()
         if not boards:
             return []
 
-        board_infos = []
-
-        for board in boards:
-            board_tasks = self.get_tasks_by_board_id(board_id=board.board_id)
+        jqls = {entry.id: entry.jql for entry in self.settings.jqls}
+        cache_key = tuple((board.board_id, jqls[board.board_id]) for board in boards)
+        with self._cache_lock:
+            board_info_cache = self._board_info_cache
+        if board_info_cache is not None:
+            cached_key, loaded_at, board_infos = board_info_cache
+            if (
+                cached_key == cache_key
+                and time.monotonic() - loaded_at < self.settings.board_info_ttl
+            ):
+                return [board_info.copy() for board_info in board_infos]
 
-            board_info_dict = {
+        board_stats = get_jqls_stats(
+            self.auth, [jqls[board.board_id] for board in boards]
+        )
+        board_infos = [
+            {
                 "board_id": board.board_id,
-                "amount_tasks": len(board_tasks),
+                "amount_tasks": amount_tasks,
                 "amount_columns": len(self.get_columns(board_id=board.board_id)),
-                "next_due": min(
-                    (t.due_date for t in board_tasks if t.due_date), default=None
-                ),
+                "next_due": next_due,
             }
-            board_infos.append(board_info_dict)
-
-        return board_infos
+            for board, (amount_tasks, next_due) in zip(boards, board_stats)
+        ]
+        with self._cache_lock:
+            self._board_info_cache = (cache_key, time.monotonic(), board_infos)
+        return [board_info.copy() for board_info in board_infos]
 
     def get_columns(self, board_id: int | None = None) -> list[Column]:
         """Return columns based on status mapping"""
@@ -118,22 +153,136 @@ class JiraBackend(Backend):
         )
 
     def get_tasks_by_board_id(self, board_id: int) -> list[Task]:
-        """Execute active JQL query and convert issues to Tasks"""
+        """Execute the board JQL query and convert all result pages to Tasks"""
+        tasks: list[Task] = []
+        for page in self.iter_task_pages_by_board_id(board_id=board_id):
+            tasks = merge_task_page(tasks, page)
+        return tasks
 
+    def iter_task_pages_by_board_id(self, board_id: int) -> Iterator[list[Task]]:
+        """Yield the tasks of the board JQL query page by page as pages arrive
+
+        If the query was cached before, only changed issues are fetched and
+        all tasks are returned as a single page.
+        """
         board_jql_entry = [
             entry for entry in self.settings.jqls if entry.id == board_id
         ][0]
 
-        jql_result = get_jql(self.auth, board_jql_entry.jql)
-        issues = jql_result.get("issues", [])
+        issue_cache = self.issue_cache
+        if issue_cache is not None:
+            cached = issue_cache.load(board_jql_entry.jql)
+            if cached is not None:
+                last_sync, cached_issues = cached
+                yield self._get_synced_tasks(
+                    board_id, board_jql_entry.jql, issue_cache, last_sync, cached_issues
+                )
+                return
+
+        yield from self._iter_jql_task_pages(board_id, board_jql_entry.jql, issue_cache)
+
+    def _iter_jql_task_pages(
+        self, board_id: int, jql: str, issue_cache: JiraIssueCache | None
+    ) -> Iterator[list[Task]]:
+        """Yield the tasks of all query pages and cache the issues at the end
 
+        Dependencies are resolved against all issues received so far, tasks
+        of earlier pages which got links to issues of a later page are yielded
+        again as updated copies with that page.
+        """
+        synced_at = datetime.now(UTC)
+        issues: list[dict] = []
+        task_index: dict[str, tuple[str | None, Task]] = {}
+        id_to_task: dict[str, Task] = {}
+        # linked issue id -> already received issues waiting for it
+        waiting_links: dict[str, list[tuple[dict, Task]]] = defaultdict(list)
+        for page in iter_jql_pages(
+            self.auth,
+            jql,
+            page_size=self.settings.page_size,
+            max_concurrent_requests=self.settings.max_concurrent_requests,
+        ):
+            issues.extend(page)
+            page_tasks = [
+                self._jira_issue_to_task(issue_data, board_id=board_id)
+                for issue_data in page
+            ]
+            for issue_data, task in zip(page, page_tasks):
+                id_to_task[issue_data["id"]] = task
+                task_index[issue_data["id"]] = (
+                    issue_data["fields"].get("updated"),
+                    task.model_copy(deep=True),
+                )
+
+            # Resolve dependencies of the new issues and of issues linking to them
+            linking_tasks: dict[str, tuple[dict, Task]] = {}
+            for issue_data in page:
+                for linking_issue, linking_task in waiting_links.pop(
+                    issue_data["id"], []
+                ):
+                    linking_tasks[linking_issue["id"]] = (linking_issue, linking_task)
+            for issue_data, task in [*zip(page, page_tasks), *linking_tasks.values()]:
+                self._resolve_issue_links(issue_data, task, id_to_task)
+
+            for issue_data, task in zip(page, page_tasks):
+                for linked_id in self._linked_issue_ids(issue_data):
+                    if linked_id not in id_to_task:
+                        waiting_links[linked_id].append((issue_data, task))
+            # consumers get copies, the tasks above keep collecting links
+            yield [
+                task.model_copy(deep=True)
+                for task in [
+                    *page_tasks,
+                    *(task for _, task in linking_tasks.values()),
+                ]
+            ]
+
+        if issue_cache is not None:
+            issue_cache.store(jql, issues, synced_at, changed_issues=issues)
+            column_mapping = dict(self._get_column_mapping_for_board(board_id))
+            with self._cache_lock:
+                self._task_index[board_id] = (column_mapping, task_index)
+
+    def _get_synced_tasks(
+        self,
+        board_id: int,
+        jql: str,
+        issue_cache: JiraIssueCache,
+        last_sync: datetime,
+        cached_issues: list[dict],
+    ) -> list[Task]:
+        """Merge changed issues into the cached ones and convert them to Tasks"""
+        synced_at = datetime.now(UTC)
+        issues, changed_issues = sync_jql_issues(
+            self.auth,
+            jql,
+            cached_issues,
+            last_sync,
+            page_size=self.settings.page_size,
+            max_concurrent_requests=self.settings.max_concurrent_requests,
+        )
+        issue_cache.store(jql, issues, synced_at, changed_issues=changed_issues)
+
+        # Only issues with a new updated timestamp are converted again
+        column_mapping = self._get_column_mapping_for_board(board_id)
+        with self._cache_lock:
+            indexed_mapping, indexed_tasks = self._task_index.get(board_id, ({}, {}))
+        if indexed_mapping != column_mapping:
+            indexed_tasks = {}
+
+        task_index = {}
         tasks = []
         for issue_data in issues:
-            try:
-                task = self._jira_issue_to_task(issue_data, board_id=board_id)
-                tasks.append(task)
-            except Exception as e:
-                raise e
+            updated = issue_data["fields"].get("updated")
+            indexed = indexed_tasks.get(issue_data["id"])
+            if indexed is None or indexed[0] != updated:
+                indexed = (updated, self._jira_issue_to_task(issue_data, board_id))
+            task_index[issue_data["id"]] = indexed
+            tasks.append(
+                indexed[1].model_copy(update={"blocked_by": [], "blocking": []})
+            )
+        with self._cache_lock:
+            self._task_index[board_id] = (dict(column_mapping), task_index)
 
         # Resolve dependencies
         self._resolve_issue_dependencies(tasks, issues)
@@ -143,6 +292,10 @@ class JiraBackend(Backend):
         """Execute active JQL query and convert issues to Tasks"""
         return self.get_tasks_by_board_id(board_id=self.settings.active_jql)
 
+    def iter_task_pages_on_active_board(self) -> Iterator[list[Task]]:
+        """Yield the tasks of the active JQL query page by page"""
+        return self.iter_task_pages_by_board_id(board_id=self.settings.active_jql)
+
     def get_task_by_id(self, task_id: int) -> Task | None:
         """Fetch a single Jira issue by ID"""
         tasks = self.get_tasks_by_ids([task_id])
@@ -153,21 +306,16 @@ class JiraBackend(Backend):
         if not task_ids:
             return []
 
-        # Fetch from Jira API
-        tasks = []
-        for task_id in task_ids:
-            try:
-                jql = f'id = "{task_id}"'
-                result = get_jql(self.auth, jql)
-                issues = result.get("issues", [])
-                if issues:
-                    task = self._jira_issue_to_task(issues[0])
-                    tasks.append(task)
-            except Exception as e:
-                print(f"Error fetching task {task_id}: {e}")
-                continue
-
-        return tasks
+        # Fetch from Jira API in chunks
+        issues_by_id = {
+            int(issue["id"]): issue
+            for issue in get_issues_by_ids(self.auth, list(dict.fromkeys(task_ids)))
+        }
+        return [
+            self._jira_issue_to_task(issues_by_id[task_id])
+            for task_id in task_ids
+            if task_id in issues_by_id
+        ]
 
     # Helper methods
 
@@ -263,61 +411,68 @@ class JiraBackend(Backend):
 
     def _resolve_issue_dependencies(self, tasks: list[Task], issues: list[dict]):
         """Resolve Jira issue links to task dependencies"""
-        # Build lookup for issue keys/IDs to tasks
-        key_to_task = {}
-        id_to_task = {}
+        # Build lookup for issue IDs to tasks
+        id_to_task = {issue["id"]: task for issue, task in zip(issues, tasks)}
 
         for issue, task in zip(issues, tasks):
-            key_to_task[issue["key"]] = task
-            id_to_task[issue["id"]] = task
-
-        # Process issue links
-        for issue, task in zip(issues, tasks):
-            issue_links = issue.get("fields", {}).get("issuelinks", [])
-
-            for link in issue_links:
-                link_type = link.get("type", {})
-                link_type_name = link_type.get("name", "").lower()
-
-                # Handle outward links (current issue blocks/depends on other)
-                if "outwardIssue" in link:
-                    outward_issue = link["outwardIssue"]
-                    # outward_key = outward_issue.get("key")
-                    outward_id = outward_issue.get("id")
-
-                    # Check if it's a "blocks" or "depends on" relationship
-                    if "block" in link_type_name:
-                        # Current issue blocks the outward issue
-                        if outward_id and outward_id in id_to_task:
-                            outward_task = id_to_task[outward_id]
-                            if int(outward_task.task_id) not in task.blocking:
-                                task.blocking.append(int(outward_task.task_id))
-                    elif "depend" in link_type_name:
-                        # Current issue depends on the outward issue
-                        if outward_id and outward_id in id_to_task:
-                            outward_task = id_to_task[outward_id]
-                            if int(outward_task.task_id) not in task.blocked_by:
-                                task.blocked_by.append(int(outward_task.task_id))
-
-                # Handle inward links (other issue blocks/depends on current)
-                if "inwardIssue" in link:
-                    inward_issue = link["inwardIssue"]
-                    # inward_key = inward_issue.get("key")
-                    inward_id = inward_issue.get("id")
-
-                    # Check if it's a "blocks" or "depends on" relationship
-                    if "block" in link_type_name:
-                        # Inward issue blocks current issue
-                        if inward_id and inward_id in id_to_task:
-                            inward_task = id_to_task[inward_id]
-                            if int(inward_task.task_id) not in task.blocked_by:
-                                task.blocked_by.append(int(inward_task.task_id))
-                    elif "depend" in link_type_name:
-                        # Inward issue depends on current issue
-                        if inward_id and inward_id in id_to_task:
-                            inward_task = id_to_task[inward_id]
-                            if int(inward_task.task_id) not in task.blocking:
-                                task.blocking.append(int(inward_task.task_id))
+            self._resolve_issue_links(issue, task, id_to_task)
+
+    def _resolve_issue_links(self, issue: dict, task: Task, id_to_task: dict):
+        """Add the links of one issue to already known tasks as dependencies"""
+        issue_links = issue.get("fields", {}).get("issuelinks", [])
+
+        for link in issue_links:
+            link_type = link.get("type", {})
+            link_type_name = link_type.get("name", "").lower()
+
+            # Handle outward links (current issue blocks/depends on other)
+            if "outwardIssue" in link:
+                outward_issue = link["outwardIssue"]
+                # outward_key = outward_issue.get("key")
+                outward_id = outward_issue.get("id")
+
+                # Check if it's a "blocks" or "depends on" relationship
+                if "block" in link_type_name:
+                    # Current issue blocks the outward issue
+                    if outward_id and outward_id in id_to_task:
+                        outward_task = id_to_task[outward_id]
+                        if int(outward_task.task_id) not in task.blocking:
+                            task.blocking.append(int(outward_task.task_id))
+                elif "depend" in link_type_name:
+                    # Current issue depends on the outward issue
+                    if outward_id and outward_id in id_to_task:
+                        outward_task = id_to_task[outward_id]
+                        if int(outward_task.task_id) not in task.blocked_by:
+                            task.blocked_by.append(int(outward_task.task_id))
+
+            # Handle inward links (other issue blocks/depends on current)
+            if "inwardIssue" in link:
+                inward_issue = link["inwardIssue"]
+                # inward_key = inward_issue.get("key")
+                inward_id = inward_issue.get("id")
+
+                # Check if it's a "blocks" or "depends on" relationship
+                if "block" in link_type_name:
+                    # Inward issue blocks current issue
+                    if inward_id and inward_id in id_to_task:
+                        inward_task = id_to_task[inward_id]
+                        if int(inward_task.task_id) not in task.blocked_by:
+                            task.blocked_by.append(int(inward_task.task_id))
+                elif "depend" in link_type_name:
+                    # Inward issue depends on current issue
+                    if inward_id and inward_id in id_to_task:
+                        inward_task = id_to_task[inward_id]
+                        if int(inward_task.task_id) not in task.blocking:
+                            task.blocking.append(int(inward_task.task_id))
+
+    @staticmethod
+    def _linked_issue_ids(issue: dict) -> set[str]:
+        return {
+            linked_issue["id"]
+            for link in issue.get("fields", {}).get("issuelinks", [])
+            for linked_issue in (link.get("outwardIssue"), link.get("inwardIssue"))
+            if linked_issue and linked_issue.get("id")
+        }
 
     @property
     def active_board(self) -> Board | None:
@@ -329,6 +484,23 @@ class JiraBackend(Backend):
         # Default to first board
         return boards[0]
 
+    @property
+    def issue_cache(self) -> JiraIssueCache | None:
+        """Issue cache of the configured file, created once on first access"""
+        if not self.settings.issue_cache_path:
+            return None
+        with self._cache_lock:
+            # the base url is entered after the backend was created
+            if self._issue_cache is None or (
+                self._issue_cache.path,
+                self._issue_cache.base_url,
+            ) != (self.settings.issue_cache_path, self.settings.base_url):
+                self._issue_cache = JiraIssueCache(
+                    path=self.settings.issue_cache_path,
+                    base_url=self.settings.base_url,
+                )
+            return self._issue_cache
+
     @property
     def api_key(self) -> str:
         return self.auth_settings.jira.api_key
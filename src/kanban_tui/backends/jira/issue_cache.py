@@ -0,0 +1,135 @@
+import json
+import sqlite3
+from collections.abc import Generator, Iterable
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from kanban_tui.backends.sqlite.database import create_connection
+
+CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS issues (
+    base_url TEXT NOT NULL,
+    issue_id TEXT NOT NULL,
+    updated TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (base_url, issue_id)
+);
+
+CREATE TABLE IF NOT EXISTS jql_syncs (
+    base_url TEXT NOT NULL,
+    jql TEXT NOT NULL,
+    last_sync TEXT NOT NULL,
+    issue_ids TEXT NOT NULL,
+    PRIMARY KEY (base_url, jql)
+);
+"""
+
+
+@dataclass
+class JiraIssueCache:
+    """Issue JSON of JQL queries stored in a local sqlite file
+
+    Issues are keyed by their id and `updated` timestamp and shared between
+    all queries of a Jira instance, each query remembers its last sync and
+    the ids of its result in order.
+    """
+
+    path: str
+    base_url: str
+    _schema_created: bool = field(default=False, init=False, repr=False)
+
+    @contextmanager
+    def _connection(self) -> Generator[sqlite3.Connection, None, None]:
+        """Connection to the cache file, the tables are created on first use"""
+        with create_connection(database=self.path) as con:
+            if not self._schema_created:
+                con.executescript(CACHE_SCHEMA)
+                self._schema_created = True
+            yield con
+
+    def load(self, jql: str) -> tuple[datetime, list[dict]] | None:
+        """Last sync and cached issues of the query, None if never synced"""
+        with self._connection() as con:
+            sync = con.execute(
+                "SELECT last_sync, issue_ids FROM jql_syncs WHERE base_url = ? AND jql = ?",
+                (self.base_url, jql),
+            ).fetchone()
+            if sync is None:
+                return None
+
+            last_sync, issue_ids = sync
+            issues_by_id = {
+                issue_id: data
+                for issue_id, data in con.execute(
+                    """
+                    SELECT issue_id, data FROM issues
+                    WHERE base_url = ?
+                    AND issue_id IN (SELECT value FROM json_each(?))
+                    """,
+                    (self.base_url, issue_ids),
+                )
+            }
+
+        issues = [
+            json.loads(issues_by_id[issue_id])
+            for issue_id in json.loads(issue_ids)
+            if issue_id in issues_by_id
+        ]
+        return datetime.fromisoformat(last_sync), issues
+
+    def store(
+        self,
+        jql: str,
+        issues: list[dict],
+        synced_at: datetime,
+        changed_issues: Iterable[dict],
+    ):
+        """Stores the query result and the changed issues in one transaction
+
+        Issues no query refers to anymore are removed.
+        """
+        with self._connection() as con:
+            con.executemany(
+                """
+                INSERT INTO issues (base_url, issue_id, updated, data)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (base_url, issue_id) DO UPDATE
+                SET updated = excluded.updated, data = excluded.data
+                """,
+                (
+                    (
+                        self.base_url,
+                        issue["id"],
+                        issue.get("fields", {}).get("updated"),
+                        json.dumps(issue),
+                    )
+                    for issue in changed_issues
+                ),
+            )
+            con.execute(
+                """
+                INSERT INTO jql_syncs (base_url, jql, last_sync, issue_ids)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (base_url, jql) DO UPDATE
+                SET last_sync = excluded.last_sync, issue_ids = excluded.issue_ids
+                """,
+                (
+                    self.base_url,
+                    jql,
+                    synced_at.isoformat(),
+                    json.dumps([issue["id"] for issue in issues]),
+                ),
+            )
+            con.execute(
+                """
+                DELETE FROM issues
+                WHERE base_url = :base_url
+                AND issue_id NOT IN (
+                    SELECT ids.value FROM jql_syncs, json_each(jql_syncs.issue_ids) AS ids
+                    WHERE jql_syncs.base_url = :base_url
+                )
+                """,
+                {"base_url": self.base_url},
+            )
+            con.commit()
@@ -1,6 +1,42 @@
 from atlassian.jira import Jira
 import asyncio
+import logging
+import re
+from collections.abc import Coroutine, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
 from functools import partial
+from math import ceil
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+# Issue fields read by JiraBackend._jira_issue_to_task and the dependency resolution
+ISSUE_FIELDS = [
+    "summary",
+    "description",
+    "status",
+    "assignee",
+    "reporter",
+    "priority",
+    "issuetype",
+    "created",
+    "updated",
+    "duedate",
+    "labels",
+    "components",
+    "issuelinks",
+    "resolution",
+    "resolutiondate",
+]
+ISSUE_ID_CHUNK_SIZE = 50
+JQL_PAGE_SIZE = 100
+MAX_CONCURRENT_REQUESTS = 4
+# Jira caps pages at 1000 issues if only few fields are requested
+LISTING_PAGE_SIZE = 1000
+ORDER_BY_PATTERN = re.compile(r"\s*\bORDER\s+BY\b.*$", re.IGNORECASE | re.DOTALL)
 
 
 def authenticate_to_jira(base_url: str, api_token: str, cert_path: str) -> Jira:
@@ -8,15 +44,244 @@ def authenticate_to_jira(base_url: str, api_token: str, cert_path: str) -> Jira:
     return auth
 
 
-def get_jql(auth: Jira, jql: str):
-    """Execute JQL query - blocking call"""
-    return auth.jql(jql)
+def run_async(coroutine: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine from sync code, also if an event loop is already running"""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coroutine)
 
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coroutine).result()
 
-async def get_jql_async(auth: Jira, jql: str):
-    """Get available transitions asynchronously in thread pool"""
+
+def get_jql(auth: Jira, jql: str, **kwargs):
+    """Execute JQL query - blocking call
+
+    kwargs are passed to `Jira.jql`, e.g. fields, start, limit or validate_query
+    """
+    return auth.jql(jql, **kwargs)
+
+
+async def get_jql_async(auth: Jira, jql: str, **kwargs):
+    """Execute JQL query asynchronously in thread pool"""
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, partial(get_jql, auth, jql, **kwargs))
+
+
+def iter_jql_pages(
+    auth: Jira,
+    jql: str,
+    fields: list[str] = ISSUE_FIELDS,
+    page_size: int = JQL_PAGE_SIZE,
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+) -> Iterator[list[dict]]:
+    """Yield the issues of a JQL search page by page in result order
+
+    On Jira Server/DC the first page reports the total, the remaining
+    `startAt` pages are then fetched with up to `max_concurrent_requests`
+    requests in flight. Jira Cloud only returns a `nextPageToken` per page,
+    so cloud pages are fetched one after another.
+    """
+    if auth.cloud:
+        yield from _iter_jql_token_pages(auth, jql, fields, page_size)
+        return
+
+    first_page = get_jql(auth, jql, fields=fields, start=0, limit=page_size)
+    issues = first_page.get("issues", [])
+    yield issues
+
+    # Jira may cap maxResults below the requested page size
+    step = len(issues)
+    total = first_page.get("total", step)
+    if not step or step >= total:
+        return
+
+    with ThreadPoolExecutor(max_workers=max_concurrent_requests) as executor:
+        futures = [
+            executor.submit(get_jql, auth, jql, fields=fields, start=start, limit=step)
+            for start in range(step, total, step)
+        ]
+        try:
+            for future in futures:
+                yield future.result().get("issues", [])
+        finally:
+            # stop pending requests if the consumer stops early
+            for future in futures:
+                future.cancel()
+
+
+def _iter_jql_token_pages(
+    auth: Jira, jql: str, fields: list[str], page_size: int
+) -> Iterator[list[dict]]:
+    next_page_token = None
+    while True:
+        page = auth.enhanced_jql(
+            jql, fields=fields, nextPageToken=next_page_token, limit=page_size
+        )
+        yield page.get("issues", [])
+        next_page_token = page.get("nextPageToken")
+        if page.get("isLast", True) or not next_page_token:
+            return
+
+
+def sync_jql_issues(
+    auth: Jira,
+    jql: str,
+    cached_issues: list[dict],
+    last_sync: datetime,
+    fields: list[str] = ISSUE_FIELDS,
+    page_size: int = JQL_PAGE_SIZE,
+    max_concurrent_requests: int = MAX_CONCURRENT_REQUESTS,
+) -> tuple[list[dict], list[dict]]:
+    """Current issues of a JQL query, reusing cached issues which did not change
+
+    Issues updated since `last_sync` are fetched with all fields, next to a
+    listing of the ids and `updated` timestamps of all matching issues.
+    The listing drops issues which left the query and listed issues missing
+    from the cache or with another timestamp are fetched by id afterwards.
+    The `updated` filter is relative to the server time, so it does not
+    depend on the user's timezone.
+
+    Returns the issues in query order and the fetched issues.
+    """
+    minutes = ceil((datetime.now(UTC) - last_sync).total_seconds() / 60) + 1
+    query = ORDER_BY_PATTERN.sub("", jql)
+    changed_jql = f'({query}) AND updated >= "-{minutes}m"'
+
+    def collect(query: str, fields: list[str], page_size: int) -> list[dict]:
+        return [
+            issue
+            for page in iter_jql_pages(
+                auth,
+                query,
+                fields=fields,
+                page_size=page_size,
+                max_concurrent_requests=max_concurrent_requests,
+            )
+            for issue in page
+        ]
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        listing_future = executor.submit(
+            collect, jql, ["updated"], max(page_size, LISTING_PAGE_SIZE)
+        )
+        changed_future = executor.submit(collect, changed_jql, fields, page_size)
+        listing = listing_future.result()
+        fetched_issues = changed_future.result()
+
+    issues_by_id = {issue["id"]: issue for issue in cached_issues}
+    issues_by_id.update((issue["id"], issue) for issue in fetched_issues)
+    stale_ids = [
+        int(listed["id"])
+        for listed in listing
+        if listed["id"] not in issues_by_id
+        or issues_by_id[listed["id"]]["fields"].get("updated")
+        != listed["fields"].get("updated")
+    ]
+    if stale_ids:
+        stale_issues = get_issues_by_ids(auth, stale_ids, fields=fields)
+        issues_by_id.update((issue["id"], issue) for issue in stale_issues)
+        fetched_issues.extend(stale_issues)
+
+    issues = [
+        issues_by_id[listed["id"]] for listed in listing if listed["id"] in issues_by_id
+    ]
+    return issues, fetched_issues
+
+
+def get_jql_total(auth: Jira, jql: str) -> int:
+    """Amount of issues matching the JQL query without loading any issue"""
+    if auth.cloud:
+        # cloud search pages do not report a total
+        return auth.approximate_issue_count(jql).get("count", 0)
+    return get_jql(auth, jql, fields=["id"], limit=0).get("total", 0)
+
+
+def get_jql_next_due_date(auth: Jira, jql: str) -> str | None:
+    """Earliest due date (YYYY-MM-DD) of the issues matching the JQL query"""
+    query = ORDER_BY_PATTERN.sub("", jql)
+    result = get_jql(
+        auth,
+        f"({query}) AND duedate IS NOT EMPTY ORDER BY duedate ASC",
+        fields=["duedate"],
+        limit=1,
+    )
+    issues = result.get("issues", [])
+    return issues[0]["fields"].get("duedate") if issues else None
+
+
+async def get_jql_stats_async(auth: Jira, jql: str) -> tuple[int, str | None]:
+    """Issue total and next due date of a JQL query, both queried concurrently"""
     loop = asyncio.get_event_loop()
-    return await loop.run_in_executor(None, partial(get_jql, auth, jql))
+    total, next_due = await asyncio.gather(
+        loop.run_in_executor(None, partial(get_jql_total, auth, jql)),
+        loop.run_in_executor(None, partial(get_jql_next_due_date, auth, jql)),
+    )
+    return total, next_due
+
+
+async def get_jqls_stats_async(
+    auth: Jira, jqls: list[str]
+) -> list[tuple[int, str | None]]:
+    """Issue totals and next due dates of multiple JQL queries in parallel"""
+    return list(await asyncio.gather(*(get_jql_stats_async(auth, jql) for jql in jqls)))
+
+
+def get_jqls_stats(auth: Jira, jqls: list[str]) -> list[tuple[int, str | None]]:
+    """Issue totals and next due dates - blocking call, see `get_jqls_stats_async`"""
+    return run_async(get_jqls_stats_async(auth, jqls))
+
+
+async def get_issues_by_ids_async(
+    auth: Jira,
+    issue_ids: list[int],
+    chunk_size: int = ISSUE_ID_CHUNK_SIZE,
+    fields: list[str] = ISSUE_FIELDS,
+) -> list[dict]:
+    """Fetch issues with one `id in (...)` query per chunk, chunks run concurrently
+
+    Unknown ids only produce warnings instead of failing the whole chunk.
+    Chunks that fail anyway are skipped.
+    """
+    chunks = [
+        issue_ids[start : start + chunk_size]
+        for start in range(0, len(issue_ids), chunk_size)
+    ]
+    results = await asyncio.gather(
+        *(
+            get_jql_async(
+                auth,
+                f"id in ({', '.join(str(issue_id) for issue_id in chunk)})",
+                fields=fields,
+                limit=len(chunk),
+                validate_query="warn",
+            )
+            for chunk in chunks
+        ),
+        return_exceptions=True,
+    )
+
+    issues = []
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, BaseException):
+            # not printed, output would end up inside the TUI
+            logger.warning("Could not fetch issues %s: %s", chunk, result)
+            continue
+        issues.extend(result.get("issues", []))
+    return issues
+
+
+def get_issues_by_ids(
+    auth: Jira,
+    issue_ids: list[int],
+    chunk_size: int = ISSUE_ID_CHUNK_SIZE,
+    fields: list[str] = ISSUE_FIELDS,
+) -> list[dict]:
+    """Fetch issues by id - blocking call, see `get_issues_by_ids_async`"""
+    return run_async(
+        get_issues_by_ids_async(auth, issue_ids, chunk_size=chunk_size, fields=fields)
+    )
 
 
 def get_transitions(auth: Jira, issue_key: str):
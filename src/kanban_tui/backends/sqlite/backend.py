@@ -1,18 +1,21 @@
+import threading
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Any
 
 from kanban_tui.backends.base import Backend
 from kanban_tui.classes.board import Board
 from kanban_tui.classes.category import Category
 from kanban_tui.classes.column import Column
 from kanban_tui.classes.task import Task
-from kanban_tui.classes.logevent import LogEvent
+from kanban_tui.classes.logevent import AuditCompaction, AuditSummary, LogEvent
 from kanban_tui.config import SqliteBackendSettings, TaskAppendModes
 from kanban_tui.backends.sqlite.database import (
     create_new_board_db,
     create_new_category_db,
     create_new_column_db,
     create_new_task_db,
+    create_new_tasks_db,
     delete_board_db,
     delete_category_db,
     delete_column_db,
@@ -21,25 +24,34 @@ from kanban_tui.backends.sqlite.database import (
     get_all_categories_db,
     get_all_tasks_on_board_db,
     get_all_columns_on_board_db,
-    get_category_by_id_db,
     get_task_by_id_db,
     get_tasks_by_ids_db,
     get_task_by_column_db,
     get_column_by_id_db,
     init_new_db,
+    open_connection_pool,
+    close_connection_pool,
     update_board_entry_db,
     update_column_name_db,
     update_category_entry_db,
     update_column_visibility_db,
     update_task_entry_db,
     update_task_status_db,
+    update_tasks_status_db,
     move_task_position_db,
     get_board_info_dict,
     get_ordered_tasks_db,
     get_filtered_events_db,
+    get_filtered_event_count_db,
+    get_filtered_event_summaries_db,
+    compact_audits_db,
+    get_events_since_db,
+    get_latest_event_id_db,
     create_task_dependency_db,
     delete_task_dependency_db,
     would_create_cycle,
+    get_blocked_by_closure_db,
+    get_cycle_creating_dependencies_db,
     get_task_dependencies_db,
 )
 
@@ -50,6 +62,29 @@ class SqliteBackend(Backend):
 
     def __post_init__(self):
         self.create_database()
+        self._pooled_database: str | None = self.database_path
+        open_connection_pool(
+            database=self._pooled_database,
+            performance=self.settings.performance,
+        )
+        self._cache_lock = threading.RLock()
+        self._category_map: dict[int, Category] | None = None
+        # ids not found after a reload, e.g. of deleted categories
+        self._missing_category_ids: set[int] = set()
+
+    def close(self):
+        """Releases the pooled database connections"""
+        # the I/O thread has to finish before its connection is closed
+        super().close()
+        if self._pooled_database is not None:
+            close_connection_pool(database=self._pooled_database)
+            self._pooled_database = None
+
+    def clear_cache(self):
+        """Drops the cached categories, they are reloaded on next access"""
+        with self._cache_lock:
+            self._category_map = None
+            self._missing_category_ids = set()
 
     # Queries
     def get_boards(self) -> list[Board]:
@@ -121,6 +156,18 @@ class SqliteBackend(Backend):
             database=self.database_path,
         )
 
+    def create_new_tasks(self, tasks: list[dict[str, Any]]) -> list[Task]:
+        """Create several tasks and their dependencies in one transaction.
+
+        Args:
+            tasks: Arguments of `create_new_task` per task, `blocked_by` optionally
+                lists the existing tasks the new task depends on
+
+        Returns:
+            The created tasks in the given order
+        """
+        return create_new_tasks_db(tasks=tasks, database=self.database_path)
+
     def update_task_status(
         self,
         new_task: Task,
@@ -134,6 +181,26 @@ class SqliteBackend(Backend):
             database=self.database_path,
         )
 
+    def update_tasks_status(
+        self,
+        new_tasks: list[Task],
+        append_mode: TaskAppendModes | None = None,
+    ) -> list[Task]:
+        """Move several tasks to their new columns in one transaction.
+
+        Args:
+            new_tasks: Tasks with their target column and updated dates
+            append_mode: Put moved tasks at the top or bottom of their new column
+
+        Returns:
+            The updated tasks in the given order
+        """
+        return update_tasks_status_db(
+            tasks=new_tasks,
+            append_mode=append_mode,
+            database=self.database_path,
+        )
+
     def move_task_position(self, task_id: int, target_position: int) -> Task | None:
         return move_task_position_db(
             task_id=task_id,
@@ -166,26 +233,47 @@ class SqliteBackend(Backend):
 
     # Category Management
     def create_new_category(self, name: str, color: str) -> Category:
+        self.clear_cache()
         return create_new_category_db(
             name=name, color=color, database=self.database_path
         )
 
     def update_category(self, category_id: int, name: str, color: str) -> Category:
+        self.clear_cache()
         return update_category_entry_db(
             category_id=category_id, name=name, color=color, database=self.database_path
         )
 
     def delete_category(self, category_id: int):
+        self.clear_cache()
         return delete_category_db(category_id=category_id, database=self.database_path)
 
     def get_all_categories(self) -> list[Category]:
-        return get_all_categories_db(database=self.database_path)
+        return list(self.category_map.values())
 
-    def get_category_by_id(self, category_id: int) -> Category:
-        category = get_category_by_id_db(
-            category_id=category_id, database=self.database_path
-        )
-        return category
+    @property
+    def category_map(self) -> dict[int, Category]:
+        """Categories by category_id, cached until categories are changed"""
+        with self._cache_lock:
+            if self._category_map is None:
+                self._category_map = {
+                    category.category_id: category
+                    for category in get_all_categories_db(database=self.database_path)
+                }
+            return self._category_map
+
+    def get_category_by_id(self, category_id: int) -> Category | None:
+        with self._cache_lock:
+            if category_id in self._missing_category_ids:
+                return None
+            if self._category_map is not None and category_id not in self._category_map:
+                # category might have been created by another process, reload
+                # once and remember the id if it is still unknown
+                self.clear_cache()
+            category = self.category_map.get(category_id)
+            if category is None:
+                self._missing_category_ids.add(category_id)
+            return category
 
     def get_task_by_id(self, task_id: int) -> Task | None:
         task = get_task_by_id_db(task_id=task_id, database=self.database_path)
@@ -247,15 +335,106 @@ class SqliteBackend(Backend):
             database=self.database_path,
         )
 
-    def get_filtered_events(self, filter: dict) -> list[LogEvent]:
+    def get_filtered_events(
+        self,
+        filter: dict,
+        before_event_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[LogEvent]:
+        """Audit events matching the filter, newest first
+
+        Args:
+            filter: Dict with the `events`, `objects` and minimum `time` to show
+            before_event_id: Only return events older than this event, used to
+                load the page following the last event of the previous page
+            limit: Maximum amount of events to return
+
+        Returns:
+            List of matching events ordered by descending event_id
+        """
         return get_filtered_events_db(
+            filter=filter,
+            before_event_id=before_event_id,
+            limit=limit,
+            database=self.database_path,
+        )
+
+    def get_filtered_event_count(self, filter: dict) -> int:
+        return get_filtered_event_count_db(
             filter=filter,
             database=self.database_path,
         )
 
+    def get_filtered_event_summaries(
+        self,
+        filter: dict,
+        before_event_id: int | None = None,
+        limit: int | None = None,
+    ) -> list[AuditSummary]:
+        """Daily summaries of compacted audit events matching the filter
+
+        Args:
+            filter: Dict with the `events`, `objects` and minimum `time` to show
+            before_event_id: Only return summaries whose last event is older
+            limit: Maximum amount of summaries to return
+
+        Returns:
+            List of matching summaries ordered by descending last_event_id
+        """
+        return get_filtered_event_summaries_db(
+            filter=filter,
+            before_event_id=before_event_id,
+            limit=limit,
+            database=self.database_path,
+        )
+
+    # Audit Retention
+    def compact_audits(
+        self,
+        max_age_days: int | None = None,
+        max_rows: int | None = None,
+        archive_dir: str | None = None,
+        max_event_id: int | None = None,
+    ) -> AuditCompaction:
+        """Rolls audit events exceeding the retention up into daily summaries
+
+        Args:
+            max_age_days: Compact events older than this, defaults to the config
+            max_rows: Only keep this many newest events, defaults to the config
+            archive_dir: Also write the compacted events as gzipped JSON lines
+                into this directory, defaults to the config
+            max_event_id: Keep all events after this event_id
+
+        Returns:
+            Amount of compacted events and the written archive files
+        """
+        retention = self.settings.audit_retention
+        return compact_audits_db(
+            max_age_days=retention.max_age_days
+            if max_age_days is None
+            else max_age_days,
+            max_rows=retention.max_rows if max_rows is None else max_rows,
+            archive_dir=retention.archive_dir if archive_dir is None else archive_dir,
+            max_event_id=max_event_id,
+            database=self.database_path,
+        )
+
+    # Change Tracking
+    def get_latest_event_id(self) -> int:
+        return get_latest_event_id_db(database=self.database_path)
+
+    def get_changes_since(self, event_id: int) -> list[LogEvent] | None:
+        """Audit events logged after `event_id`, oldest first, None if some
+        of them were compacted, e.g. by `ktui audit compact`
+        """
+        return get_events_since_db(event_id=event_id, database=self.database_path)
+
     def create_database(self):
         """Creates database if not exists"""
-        init_new_db(database=self.database_path)
+        init_new_db(
+            database=self.database_path,
+            performance=self.settings.performance,
+        )
 
     @property
     def active_board(self) -> Board:
@@ -328,3 +507,35 @@ class SqliteBackend(Backend):
             True if adding this dependency would create a cycle, False otherwise
         """
         return would_create_cycle(task_id, depends_on_task_id, self.database_path)
+
+    def get_blocked_by_closure(self, task_id: int) -> list[int]:
+        """Get all tasks the given task depends on directly or transitively.
+
+        Args:
+            task_id: The task ID
+
+        Returns:
+            Sorted list of all task IDs blocking this task
+        """
+        return get_blocked_by_closure_db(
+            task_id=task_id,
+            database=self.database_path,
+        )
+
+    def get_cycle_creating_dependencies(
+        self, task_id: int, depends_on_task_ids: list[int]
+    ) -> list[int]:
+        """Check several new dependencies for cycles in a single query.
+
+        Args:
+            task_id: The task that would depend on the other tasks
+            depends_on_task_ids: The tasks that would be depended upon
+
+        Returns:
+            Sorted list of the given task IDs that would create a cycle
+        """
+        return get_cycle_creating_dependencies_db(
+            task_id=task_id,
+            depends_on_task_ids=depends_on_task_ids,
+            database=self.database_path,
+        )
@@ -1,5 +1,9 @@
+import gzip
 import json
 import sqlite3
+import threading
+import weakref
+from collections import defaultdict
 from pathlib import Path
 from typing import Any, Generator, Sequence
 from contextlib import contextmanager
@@ -10,13 +14,21 @@ from kanban_tui.constants import DATABASE_FILE, DEFAULT_COLUMN_DICT
 from kanban_tui.classes.task import Task
 from kanban_tui.classes.board import Board
 from kanban_tui.classes.column import Column
-from kanban_tui.classes.logevent import LogEvent
-from kanban_tui.config import TaskAppendModes
+from kanban_tui.classes.logevent import AuditCompaction, AuditSummary, LogEvent
+from kanban_tui.config import (
+    JournalModes,
+    SqlitePerformanceSettings,
+    TaskAppendModes,
+)
 from kanban_tui.backends.sqlite.migrations import (
     CURRENT_SCHEMA_VERSION,
     apply_migration_v1_to_v2,
     apply_migration_v2_to_v3,
     apply_migration_v3_to_v4,
+    apply_migration_v4_to_v5,
+    apply_migration_v5_to_v6,
+    apply_migration_v6_to_v7,
+    apply_migration_v7_to_v8,
     increment_schema_version,
 )
 
@@ -36,63 +48,245 @@ def convert_datetime(val: bytes) -> datetime.datetime:
 
 sqlite3.register_converter("datetime", convert_datetime)
 
+# Audit events rolled up into summaries per transaction of a compaction
+AUDIT_COMPACTION_BATCH_SIZE = 50_000
+
+# Tasks are ordered by sparse keys with this gap between neighbours,
+# the dense `Task.position` is derived from the key order when loading
+TASK_SORT_KEY_GAP = 65536
+# Position of task `t` for queries loading whole columns
+TASK_POSITION_WINDOW_STR = """
+    ROW_NUMBER() OVER (PARTITION BY t.column ORDER BY t.sort_key, t.task_id) - 1
+    AS position"""
+# Position of task `t` for queries loading a single task, queries loading
+# several tasks number their columns once with the window above instead
+TASK_POSITION_STR = """
+    (SELECT COUNT(*)
+     FROM tasks o
+     WHERE o.column = t.column
+       AND (o.sort_key, o.task_id) < (t.sort_key, t.task_id)
+    ) AS position"""
+
+
+def apply_journal_mode(con: sqlite3.Connection, journal_mode: JournalModes) -> str:
+    """Sets the journal mode, which is persisted in the database file itself"""
+    mode = JournalModes(journal_mode)
+    return con.execute(f"PRAGMA journal_mode = {mode}").fetchone()[0]
+
+
+def apply_connection_pragmas(
+    con: sqlite3.Connection, performance: SqlitePerformanceSettings
+):
+    """Sets the pragmas which only live as long as the connection"""
+    con.execute(f"PRAGMA busy_timeout = {int(performance.busy_timeout)}")
+    con.execute(f"PRAGMA synchronous = {performance.synchronous.upper()}")
+    con.execute(f"PRAGMA cache_size = {int(performance.cache_size)}")
+    con.execute(f"PRAGMA mmap_size = {int(performance.mmap_size)}")
+
+
+def open_connection(
+    database: str = DATABASE_FILE.as_posix(),
+    check_same_thread: bool = True,
+    performance: SqlitePerformanceSettings | None = None,
+) -> sqlite3.Connection:
+    con = sqlite3.connect(
+        database=Path(database),
+        detect_types=sqlite3.PARSE_DECLTYPES,
+        check_same_thread=check_same_thread,
+    )
+    con.execute("PRAGMA foreign_keys = ON")
+    if performance is not None:
+        apply_connection_pragmas(con, performance)
+    return con
+
+
+class ConnectionPool:
+    """Keeps one long-lived connection per thread for a database file.
+
+    Connections are handed out by `create_connection` while the pool is
+    registered, so consecutive `*_db` calls skip the connect/pragma setup.
+    Nested `create_connection` contexts of a thread share the connection,
+    only the outermost one rolls back uncommitted writes on exit.
+    """
+
+    def __init__(
+        self, database: str, performance: SqlitePerformanceSettings | None = None
+    ):
+        self.database = database
+        self.performance = performance
+        self.users = 0
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._lock = threading.Lock()
+
+    def get_connection(self) -> sqlite3.Connection:
+        con = getattr(self._local, "connection", None)
+        if con is None:
+            # Each thread only touches its own connection, but closing
+            # happens from whichever thread shuts the pool down
+            con = open_connection(
+                self.database, check_same_thread=False, performance=self.performance
+            )
+            self._local.connection = con
+            with self._lock:
+                self._connections.append(con)
+        return con
+
+    def close(self):
+        with self._lock:
+            for con in self._connections:
+                con.close()
+            self._connections.clear()
+        self._local = threading.local()
+
+
+_CONNECTION_POOLS: dict[str, ConnectionPool] = {}
+
+
+def open_connection_pool(
+    database: str = DATABASE_FILE.as_posix(),
+    performance: SqlitePerformanceSettings | None = None,
+) -> ConnectionPool:
+    """Registers a pool for the database, shared between all its users"""
+    pool = _CONNECTION_POOLS.get(database)
+    if pool is None:
+        pool = _CONNECTION_POOLS[database] = ConnectionPool(database, performance)
+    pool.users += 1
+    return pool
+
+
+def close_connection_pool(database: str = DATABASE_FILE.as_posix()):
+    """Closes the pooled connections once the last user released the pool"""
+    pool = _CONNECTION_POOLS.get(database)
+    if pool is None:
+        return
+    pool.users -= 1
+    if pool.users <= 0:
+        del _CONNECTION_POOLS[database]
+        pool.close()
+
 
 @contextmanager
 def create_connection(
     database: str = DATABASE_FILE.as_posix(),
+    performance: SqlitePerformanceSettings | None = None,
 ) -> Generator[sqlite3.Connection, None, None]:
-    con = sqlite3.connect(database=Path(database), detect_types=sqlite3.PARSE_DECLTYPES)
-    con.execute("PRAGMA foreign_keys = ON")
-    yield con
-    con.close()
+    pool = _CONNECTION_POOLS.get(database)
+    if pool is None:
+        con = open_connection(database, performance=performance)
+        try:
+            yield con
+        finally:
+            con.close()
+        return
+
+    con = pool.get_connection()
+    # helpers opened inside a caller's context share its connection
+    depth = getattr(pool._local, "depth", 0)
+    pool._local.depth = depth + 1
+    outer_row_factory = con.row_factory
+    con.row_factory = None
+    try:
+        yield con
+    finally:
+        pool._local.depth = depth
+        if depth:
+            # the caller's transaction stays open, only its row factory returns
+            con.row_factory = outer_row_factory
+        else:
+            # Leave the shared connection clean for the next caller
+            if con.in_transaction:
+                con.rollback()
+            con.row_factory = None
+
+
+def delete_database_files(database: str = DATABASE_FILE.as_posix()):
+    """Deletes the database including its WAL and shared-memory files"""
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{database}{suffix}").unlink(missing_ok=True)
+
+
+_ROW_LAYOUTS: weakref.WeakKeyDictionary[sqlite3.Cursor, tuple[Any, tuple[str, ...]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def row_fields(cursor: sqlite3.Cursor) -> tuple[str, ...]:
+    """Returns the field names of the current cursor rows
+
+    The layout is cached per cursor and only rebuilt if the cursor executed
+    a new statement, instead of being derived again for every row.
+    """
+    description = cursor.description
+    layout = _ROW_LAYOUTS.get(cursor)
+    if layout is None or layout[0] is not description:
+        layout = (description, tuple(column[0] for column in description))
+        _ROW_LAYOUTS[cursor] = layout
+    return layout[1]
 
 
 def task_factory(cursor, row):
-    fields = [column[0] for column in cursor.description]
-    data = dict(zip(fields, row))
+    return task_from_row_dict(dict(zip(row_fields(cursor), row)))
+
 
-    # Parse JSON arrays for dependency fields
-    if "blocked_by" in data and isinstance(data["blocked_by"], str):
+def task_from_row_dict(data: dict[str, Any]) -> Task:
+    # Parse JSON arrays for dependency fields, rows without them have none loaded
+    if isinstance(data.setdefault("blocked_by", []), str):
         data["blocked_by"] = json.loads(data["blocked_by"])
-    if "blocking" in data and isinstance(data["blocking"], str):
+    if isinstance(data.setdefault("blocking", []), str):
         data["blocking"] = json.loads(data["blocking"])
 
     # Parse JSON for metadata field
     if "metadata" in data:
         if isinstance(data["metadata"], str):
-            data["metadata"] = json.loads(data["metadata"]) if data["metadata"] else {}
+            data["metadata"] = (
+                json.loads(data["metadata"])
+                if data["metadata"] not in ("", "{}")
+                else {}
+            )
         elif data["metadata"] is None:
             data["metadata"] = {}
 
+    # Only the derived position is part of the model
+    data.pop("sort_key", None)
     if "position" in data and data["position"] is None:
         data["position"] = 0
+    if "description" in data and data["description"] is None:
+        data["description"] = ""
 
-    return Task(**data)
+    # Rows come from our own schema, no need to validate them again
+    return Task.from_trusted(data)
 
 
 def board_factory(cursor, row):
-    fields = [column[0] for column in cursor.description]
-    return Board(**{k: v for k, v in zip(fields, row)})
+    data = dict(zip(row_fields(cursor), row))
+    if data.get("icon") is None:
+        data["icon"] = ""
+    return Board.from_trusted(data)
 
 
 def category_factory(cursor, row):
-    fields = [column[0] for column in cursor.description]
-    return Category(**{k: v for k, v in zip(fields, row)})
+    return Category.from_trusted(dict(zip(row_fields(cursor), row)))
 
 
 def column_factory(cursor, row):
-    fields = [column[0] for column in cursor.description]
-    return Column(**{k: v for k, v in zip(fields, row)})
+    data = dict(zip(row_fields(cursor), row))
+    # sqlite stores BOOLEAN as 0/1
+    if "visible" in data:
+        data["visible"] = bool(data["visible"])
+    return Column.from_trusted(data)
 
 
 def logevent_factory(cursor, row):
-    fields = [column[0] for column in cursor.description]
-    return LogEvent(**{k: v for k, v in zip(fields, row)})
+    return LogEvent.from_trusted(dict(zip(row_fields(cursor), row)))
+
+
+def auditsummary_factory(cursor, row):
+    return AuditSummary.from_trusted(dict(zip(row_fields(cursor), row)))
 
 
 def board_info_factory(cursor, row):
-    fields = [column[0] for column in cursor.description]
-    return {k: v for k, v in zip(fields, row)}
+    return dict(zip(row_fields(cursor), row))
 
 
 def get_schema_version(database: str = DATABASE_FILE.as_posix()) -> int:
@@ -108,13 +302,21 @@ def get_schema_version(database: str = DATABASE_FILE.as_posix()) -> int:
             return 1
 
 
-def run_migrations(database: str = DATABASE_FILE.as_posix()):
+def run_migrations(
+    database: str = DATABASE_FILE.as_posix(),
+    performance: SqlitePerformanceSettings | None = None,
+):
+    if performance is not None:
+        # Also switches databases created before the profile existed
+        with create_connection(database=database, performance=performance) as con:
+            apply_journal_mode(con, performance.journal_mode)
+
     current_version = get_schema_version(database)
 
     if current_version >= CURRENT_SCHEMA_VERSION:
         return
 
-    with create_connection(database=database) as con:
+    with create_connection(database=database, performance=performance) as con:
         con.row_factory = sqlite3.Row
         try:
             # first migration to v2
@@ -132,6 +334,26 @@ def run_migrations(database: str = DATABASE_FILE.as_posix()):
                 apply_migration_v3_to_v4(con)
                 increment_schema_version(con, 4)
 
+            # migration to v5
+            if current_version < 5:
+                apply_migration_v4_to_v5(con)
+                increment_schema_version(con, 5)
+
+            # migration to v6
+            if current_version < 6:
+                apply_migration_v5_to_v6(con)
+                increment_schema_version(con, 6)
+
+            # migration to v7
+            if current_version < 7:
+                apply_migration_v6_to_v7(con)
+                increment_schema_version(con, 7)
+
+            # migration to v8
+            if current_version < 8:
+                apply_migration_v7_to_v8(con)
+                increment_schema_version(con, 8)
+
             con.commit()
 
         except sqlite3.Error as e:
@@ -139,9 +361,12 @@ def run_migrations(database: str = DATABASE_FILE.as_posix()):
             raise e
 
 
-def init_new_db(database: str = DATABASE_FILE.as_posix()):
+def init_new_db(
+    database: str = DATABASE_FILE.as_posix(),
+    performance: SqlitePerformanceSettings | None = None,
+):
     if Path(database).exists():
-        run_migrations(database)
+        run_migrations(database, performance)
         return
 
     task_table_creation_str = """
@@ -582,15 +807,12 @@ def init_new_db(database: str = DATABASE_FILE.as_posix()):
     END;
     """
 
-    # indexes_creation_str = """
-    # CREATE INDEX IF NOT EXISTS idx_task_title ON tasks(title);
-    # CREATE INDEX IF NOT EXISTS idx_board_name ON boards(name);
-    # CREATE INDEX IF NOT EXISTS idx_column_name ON boards(name);
-    # """
-
-    with create_connection(database=database) as con:
+    with create_connection(database=database, performance=performance) as con:
         con.row_factory = sqlite3.Row
         try:
+            if performance is not None:
+                apply_journal_mode(con, performance.journal_mode)
+
             con.execute(audit_table_creation_str)
             con.execute(category_table_creation_str)
 
@@ -613,8 +835,8 @@ def init_new_db(database: str = DATABASE_FILE.as_posix()):
 
             con.commit()
 
-            # con.executescript(indexes_creation_str)
-            run_migrations(database)
+            # Secondary indexes are created by the migrations
+            run_migrations(database, performance)
             # Don't run migrations on brand new database - it's already at current version
         except sqlite3.Error as e:
             con.rollback()
@@ -741,14 +963,9 @@ def create_new_task_db(
         "metadata": json.dumps(metadata if metadata is not None else {}),
     }
 
-    position_query_str = """
-    SELECT COALESCE(MAX(position), -1) + 1
-    FROM tasks
-    WHERE column = :column
-    ;
-    """
-
-    transaction_str = """
+    # sort_key is computed inside the INSERT, so concurrent writers
+    # appending to the same column cannot pick the same slot
+    transaction_str = f"""
     INSERT INTO tasks (
         title,
         column,
@@ -759,7 +976,7 @@ def create_new_task_db(
         finish_date,
         due_date,
         metadata,
-        position
+        sort_key
     )
     VALUES (
         :title,
@@ -771,20 +988,26 @@ def create_new_task_db(
         :finish_date,
         :due_date,
         :metadata,
-        :position
+        (
+            SELECT COALESCE(MAX(sort_key) + {TASK_SORT_KEY_GAP}, 0)
+            FROM tasks WHERE column = :column
+        )
     )
-    RETURNING *
+    RETURNING task_id
+    ;
+    """
+    query_str = f"""
+    SELECT t.*, {TASK_POSITION_STR}
+    FROM tasks t
+    WHERE t.task_id = :task_id
     ;
     """
 
     with create_connection(database=database) as con:
         try:
-            con.row_factory = sqlite3.Row
-            next_position = con.execute(position_query_str, task_dict).fetchone()[0]
-            task_dict["position"] = next_position
-
+            task_id = con.execute(transaction_str, task_dict).fetchone()[0]
             con.row_factory = task_factory
-            new_task = con.execute(transaction_str, task_dict).fetchone()
+            new_task = con.execute(query_str, {"task_id": task_id}).fetchone()
             con.commit()
             return new_task
         except sqlite3.Error as e:
@@ -792,6 +1015,102 @@ def create_new_task_db(
             con.rollback()
 
 
+def create_new_tasks_db(
+    tasks: list[dict[str, Any]],
+    database: str = DATABASE_FILE.as_posix(),
+) -> list[Task]:
+    """Creates several tasks and their dependencies in one transaction
+
+    Each entry holds the arguments of `create_new_task_db` and optionally
+    `blocked_by`, the ids of existing tasks the new task depends on. New tasks
+    cannot be depended upon yet, so these dependencies never close a cycle.
+
+    Returns:
+        The created tasks in the order of `tasks`
+    """
+    if not tasks:
+        return []
+
+    creation_date = datetime.datetime.now().replace(microsecond=0)
+    task_rows = [
+        {
+            "title": task["title"],
+            "column": task["column"],
+            "creation_date": creation_date,
+            "start_date": task.get("start_date"),
+            "finish_date": task.get("finish_date"),
+            "category": task.get("category"),
+            "due_date": task.get("due_date"),
+            "description": task.get("description", ""),
+            "metadata": json.dumps(task.get("metadata") or {}),
+        }
+        for task in tasks
+    ]
+
+    transaction_str = f"""
+    INSERT INTO tasks (
+        title,
+        column,
+        category,
+        description,
+        creation_date,
+        start_date,
+        finish_date,
+        due_date,
+        metadata,
+        sort_key
+    )
+    VALUES (
+        :title,
+        :column,
+        :category,
+        :description,
+        :creation_date,
+        :start_date,
+        :finish_date,
+        :due_date,
+        :metadata,
+        (
+            SELECT COALESCE(MAX(sort_key) + {TASK_SORT_KEY_GAP}, 0)
+            FROM tasks WHERE column = :column
+        )
+    )
+    RETURNING task_id
+    ;
+    """
+    dependency_str = """
+    INSERT INTO dependencies
+    VALUES (
+        NULL,
+        :task_id,
+        :depends_on_task_id
+    )
+    ;
+    """
+
+    with create_connection(database=database) as con:
+        try:
+            # executemany cannot return rows, ids are taken from each insert
+            task_ids = [
+                con.execute(transaction_str, task_row).fetchone()[0]
+                for task_row in task_rows
+            ]
+            con.executemany(
+                dependency_str,
+                (
+                    {"task_id": task_id, "depends_on_task_id": depends_on_task_id}
+                    for task_id, task in zip(task_ids, tasks)
+                    for depends_on_task_id in dict.fromkeys(task.get("blocked_by", []))
+                ),
+            )
+            con.commit()
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+    return get_tasks_by_ids_db(task_ids=task_ids, database=database)
+
+
 def create_new_column_db(
     name: str,
     position: int,
@@ -928,38 +1247,77 @@ def delete_category_db(
             raise e
 
 
+def collect_task_dependencies(
+    con: sqlite3.Connection,
+    task_ids_query: str,
+    parameters: dict[str, Any] | Sequence[Any],
+) -> tuple[dict[int, list[int]], dict[int, list[int]]]:
+    """Collects `blocked_by` and `blocking` lists for the tasks selected by
+    `task_ids_query` in one pass over the dependencies table, instead of two
+    correlated json subqueries per task row.
+    """
+    dependency_query_str = f"""
+    WITH loaded_tasks AS ({task_ids_query})
+    SELECT d.task_id, d.depends_on_task_id
+    FROM dependencies d
+    WHERE d.task_id IN loaded_tasks
+       OR d.depends_on_task_id IN loaded_tasks
+    ;
+    """
+    blocked_by: defaultdict[int, list[int]] = defaultdict(list)
+    blocking: defaultdict[int, list[int]] = defaultdict(list)
+    con.row_factory = None
+    edges = con.execute(dependency_query_str, parameters).fetchall()
+    for task_id, depends_on_task_id in edges:
+        blocked_by[task_id].append(depends_on_task_id)
+        blocking[depends_on_task_id].append(task_id)
+
+    # Sorting the short lists is cheaper than sorting all edges in sql
+    for dependency_ids in (*blocked_by.values(), *blocking.values()):
+        dependency_ids.sort()
+    return blocked_by, blocking
+
+
+def task_with_dependencies_factory(
+    blocked_by: dict[int, list[int]], blocking: dict[int, list[int]]
+):
+    """Row factory for task rows without dependency columns"""
+
+    def factory(cursor, row):
+        data = dict(zip(row_fields(cursor), row))
+        data["blocked_by"] = blocked_by.get(data["task_id"], [])
+        data["blocking"] = blocking.get(data["task_id"], [])
+        return task_from_row_dict(data)
+
+    return factory
+
+
 def get_all_tasks_on_board_db(
     board_id: int,
     database: str = DATABASE_FILE.as_posix(),
 ) -> list[Task]:
     board_id_dict = {"board_id": board_id}
 
-    query_str = """
-    SELECT
-        t.*,
-        COALESCE(
-            (SELECT json_group_array(d.depends_on_task_id)
-             FROM dependencies d
-             WHERE d.task_id = t.task_id),
-            '[]'
-        ) as blocked_by,
-        COALESCE(
-            (SELECT json_group_array(d.task_id)
-             FROM dependencies d
-             WHERE d.depends_on_task_id = t.task_id),
-            '[]'
-        ) as blocking
-    FROM tasks t
-    LEFT JOIN columns c ON c.column_id = t.column
-    LEFT JOIN boards b ON b.board_id = c.board_id
-    WHERE b.board_id = :board_id
-    ORDER BY c.position, t.position, t.task_id
+    query_str = f"""
+    SELECT t.*, {TASK_POSITION_WINDOW_STR}
+    FROM columns c
+    INNER JOIN tasks t ON t.column = c.column_id
+    WHERE c.board_id = :board_id
+    ORDER BY c.position, t.sort_key, t.task_id
     ;
     """
+    task_ids_query_str = """
+    SELECT t.task_id
+    FROM columns c
+    INNER JOIN tasks t ON t.column = c.column_id
+    WHERE c.board_id = :board_id
+    """
 
     with create_connection(database=database) as con:
-        con.row_factory = task_factory
         try:
+            con.row_factory = task_with_dependencies_factory(
+                *collect_task_dependencies(con, task_ids_query_str, board_id_dict)
+            )
             tasks = con.execute(query_str, board_id_dict).fetchall()
             con.commit()
             return tasks
@@ -1094,9 +1452,10 @@ def get_task_by_id_db(
     task_id: int,
     database: str = DATABASE_FILE.as_posix(),
 ) -> Task | None:
-    query_str = """
+    query_str = f"""
     SELECT
         t.*,
+        {TASK_POSITION_STR},
         COALESCE(
             (SELECT json_group_array(d.depends_on_task_id)
              FROM dependencies d
@@ -1145,30 +1504,32 @@ def get_tasks_by_ids_db(
     # Create placeholders for the IN clause
     placeholders = ",".join("?" * len(task_ids))
 
+    # positions are numbered once per column holding one of the tasks
     query_str = f"""
-    SELECT
-        t.*,
-        COALESCE(
-            (SELECT json_group_array(d.depends_on_task_id)
-             FROM dependencies d
-             WHERE d.task_id = t.task_id),
-            '[]'
-        ) as blocked_by,
-        COALESCE(
-            (SELECT json_group_array(d.task_id)
-             FROM dependencies d
-             WHERE d.depends_on_task_id = t.task_id),
-            '[]'
-        ) as blocking
+    SELECT t.*, p.position
     FROM tasks t
+    INNER JOIN (
+        SELECT t.task_id, {TASK_POSITION_WINDOW_STR}
+        FROM tasks t
+        WHERE t.column IN (
+            SELECT column FROM tasks WHERE task_id IN ({placeholders})
+        )
+    ) p ON p.task_id = t.task_id
     WHERE t.task_id IN ({placeholders})
     ;
     """
+    task_ids_query_str = f"""
+    SELECT t.task_id
+    FROM tasks t
+    WHERE t.task_id IN ({placeholders})
+    """
 
     with create_connection(database=database) as con:
-        con.row_factory = task_factory
         try:
-            tasks = con.execute(query_str, task_ids).fetchall()
+            con.row_factory = task_with_dependencies_factory(
+                *collect_task_dependencies(con, task_ids_query_str, task_ids)
+            )
+            tasks = con.execute(query_str, [*task_ids, *task_ids]).fetchall()
             con.commit()
 
             # Create a mapping for fast lookup and preserve order
@@ -1183,34 +1544,28 @@ def get_task_by_column_db(
     column_id: int,
     database: str = DATABASE_FILE.as_posix(),
 ) -> list[Task] | None:
-    query_str = """
-    SELECT
-        t.*,
-        COALESCE(
-            (SELECT json_group_array(d.depends_on_task_id)
-             FROM dependencies d
-             WHERE d.task_id = t.task_id),
-            '[]'
-        ) as blocked_by,
-        COALESCE(
-            (SELECT json_group_array(d.task_id)
-             FROM dependencies d
-             WHERE d.depends_on_task_id = t.task_id),
-            '[]'
-        ) as blocking
+    query_str = f"""
+    SELECT t.*, {TASK_POSITION_WINDOW_STR}
     FROM tasks t
     WHERE t.column = :column_id
-    ORDER BY t.position, t.task_id
+    ORDER BY t.sort_key, t.task_id
     ;
     """
+    task_ids_query_str = """
+    SELECT t.task_id
+    FROM tasks t
+    WHERE t.column = :column_id
+    """
     column_id_dict = {"column_id": column_id}
 
     with create_connection(database=database) as con:
-        con.row_factory = task_factory
         try:
-            task = con.execute(query_str, column_id_dict).fetchall()
+            con.row_factory = task_with_dependencies_factory(
+                *collect_task_dependencies(con, task_ids_query_str, column_id_dict)
+            )
+            tasks = con.execute(query_str, column_id_dict).fetchall()
             con.commit()
-            return task
+            return tasks
         except sqlite3.Error as e:
             con.rollback()
             raise (e)
@@ -1239,6 +1594,78 @@ def get_column_by_id_db(
             raise (e)
 
 
+def rebalance_sort_keys(con: sqlite3.Connection, column_id: int):
+    """Spreads the sort keys of a column evenly, keeping the order"""
+    rebalance_str = f"""
+    UPDATE tasks
+    SET sort_key = ranked.pos * {TASK_SORT_KEY_GAP}
+    FROM (
+        SELECT
+            task_id,
+            ROW_NUMBER() OVER (ORDER BY sort_key, task_id) - 1 AS pos
+        FROM tasks
+        WHERE column = :column
+    ) AS ranked
+    WHERE tasks.task_id = ranked.task_id
+    ;
+    """
+    con.execute(rebalance_str, {"column": column_id})
+
+
+def get_sort_key_for_position(
+    con: sqlite3.Connection,
+    column_id: int,
+    task_id: int,
+    position: int | None = None,
+) -> int:
+    """Sort key which puts the task at `position` of the column
+
+    Positions count the other tasks of the column, `None` or positions past
+    the last task append the task. The key lies between the keys of the new
+    neighbours, so no other task has to move, the column is only rebalanced
+    once two neighbours have no gap left.
+    """
+    neighbours_str = """
+    SELECT sort_key
+    FROM tasks
+    WHERE column = :column
+      AND task_id != :task_id
+    ORDER BY sort_key, task_id
+    LIMIT :limit OFFSET :offset
+    ;
+    """
+    last_key_str = """
+    SELECT MAX(sort_key)
+    FROM tasks
+    WHERE column = :column
+      AND task_id != :task_id
+    ;
+    """
+    params: dict[str, Any] = {"column": column_id, "task_id": task_id}
+    if position is not None and position <= 0:
+        first = con.execute(
+            neighbours_str, {**params, "limit": 1, "offset": 0}
+        ).fetchone()
+        return first[0] - TASK_SORT_KEY_GAP if first else 0
+
+    if position is not None:
+        neighbours = [
+            row[0]
+            for row in con.execute(
+                neighbours_str, {**params, "limit": 2, "offset": position - 1}
+            )
+        ]
+        if len(neighbours) == 2:
+            previous_key, next_key = neighbours
+            if next_key - previous_key > 1:
+                return (previous_key + next_key) // 2
+            rebalance_sort_keys(con, column_id)
+            return get_sort_key_for_position(con, column_id, task_id, position)
+
+    last_key = con.execute(last_key_str, params).fetchone()[0]
+    return 0 if last_key is None else last_key + TASK_SORT_KEY_GAP
+
+
 # After column Movement
 def update_task_status_db(
     task: Task,
@@ -1254,84 +1681,52 @@ def update_task_status_db(
         "metadata": json.dumps(task.metadata),
     }
     select_current_str = """
-    SELECT column, position
+    SELECT column, sort_key
     FROM tasks
     WHERE task_id = :task_id
     ;
     """
-    max_position_str = """
-    SELECT COALESCE(MAX(position), -1) + 1
-    FROM tasks
-    WHERE column = :column
-    ;
-    """
-    close_gap_str = """
-    UPDATE tasks
-    SET position = position - 1
-    WHERE column = :old_column
-      AND position > :old_position
-    ;
-    """
-    open_gap_str = """
-    UPDATE tasks
-    SET position = position + 1
-    WHERE column = :column
-      AND position >= :target_position
-    ;
-    """
     transaction_str = """
     UPDATE tasks
     SET start_date = :start_date,
         finish_date = :finish_date,
         column = :column,
         metadata = :metadata,
-        position = :position
+        sort_key = :sort_key
     WHERE task_id = :task_id
-    RETURNING *;
+    ;
+    """
+    query_str = f"""
+    SELECT t.*, {TASK_POSITION_STR}
+    FROM tasks t
+    WHERE t.task_id = :task_id
+    ;
     """
     with create_connection(database=database) as con:
         try:
             con.row_factory = sqlite3.Row
+            # Take the write lock before reading the neighbours,
+            # so concurrent moves cannot pick the same key
+            con.execute("BEGIN IMMEDIATE")
             current_row = con.execute(select_current_str, update_task_dict).fetchone()
             if current_row is None:
                 raise sqlite3.Error(f"Task {task.task_id} not found")
 
-            old_column = current_row["column"]
-            old_position = (
-                current_row["position"] if current_row["position"] is not None else 0
-            )
-            new_column = update_task_dict["column"]
-
-            if new_column != old_column:
-                con.execute(
-                    close_gap_str,
-                    {"old_column": old_column, "old_position": old_position},
+            if task.column != current_row["column"]:
+                if target_position is None and append_mode == TaskAppendModes.TOP:
+                    target_position = 0
+                update_task_dict["sort_key"] = get_sort_key_for_position(
+                    con,
+                    column_id=task.column,
+                    task_id=task.task_id,
+                    position=target_position,
                 )
-                max_new_position = con.execute(
-                    max_position_str, {"column": new_column}
-                ).fetchone()[0]
-                if target_position is None:
-                    if append_mode == TaskAppendModes.TOP:
-                        new_position = 0
-                        con.execute(
-                            open_gap_str,
-                            {"column": new_column, "target_position": new_position},
-                        )
-                    else:
-                        new_position = max_new_position
-                else:
-                    new_position = max(0, min(target_position, max_new_position))
-                    con.execute(
-                        open_gap_str,
-                        {"column": new_column, "target_position": new_position},
-                    )
             else:
-                new_position = old_position
-
-            update_task_dict["position"] = new_position
+                update_task_dict["sort_key"] = current_row["sort_key"]
 
+            con.execute(transaction_str, update_task_dict)
             con.row_factory = task_factory
-            moved_task = con.execute(transaction_str, update_task_dict).fetchone()
+            moved_task = con.execute(query_str, update_task_dict).fetchone()
             con.commit()
             return moved_task
         except sqlite3.Error as e:
@@ -1339,48 +1734,116 @@ def update_task_status_db(
             raise e
 
 
-def move_task_position_db(
-    task_id: int,
-    target_position: int,
+def update_tasks_status_db(
+    tasks: list[Task],
+    append_mode: TaskAppendModes | None = None,
     database: str = DATABASE_FILE.as_posix(),
-) -> Task | None:
-    select_current_str = """
-    SELECT column, position
-    FROM tasks
-    WHERE task_id = :task_id
-    ;
+) -> list[Task]:
+    """Moves several tasks in one transaction
+
+    Like `update_task_status_db` for each task, tasks changing their column are
+    put behind (or before with `TaskAppendModes.TOP`) all tasks of their new
+    column in the given order. Only the rows of the moved tasks are written.
+
+    Returns:
+        The updated tasks in the order of `tasks`
     """
-    max_position_str = """
-    SELECT COALESCE(MAX(position), -1)
+    if not tasks:
+        return []
+
+    task_ids = [task.task_id for task in tasks]
+    select_bounds_str = """
+    SELECT column, MIN(sort_key), MAX(sort_key)
     FROM tasks
-    WHERE column = :column
+    WHERE column IN (SELECT value FROM json_each(:columns))
+    GROUP BY column
     ;
     """
-    move_down_str = """
+    # SET expressions see the values before the update,
+    # tasks staying in their column keep their key
+    transaction_str = """
     UPDATE tasks
-    SET position = position - 1
-    WHERE column = :column
-      AND position > :current_position
-      AND position <= :target_position
+    SET start_date = :start_date,
+        finish_date = :finish_date,
+        sort_key = CASE
+            WHEN column = :column THEN sort_key
+            ELSE :sort_key
+        END,
+        column = :column,
+        metadata = :metadata
+    WHERE task_id = :task_id
     ;
     """
-    move_up_str = """
-    UPDATE tasks
-    SET position = position + 1
-    WHERE column = :column
-      AND position >= :target_position
-      AND position < :current_position
+    with create_connection(database=database) as con:
+        try:
+            # Take the write lock before reading the column bounds,
+            # so concurrent moves cannot pick the same keys
+            con.execute("BEGIN IMMEDIATE")
+            target_columns = {task.column for task in tasks}
+            bounds = {
+                column: (min_key, max_key)
+                for column, min_key, max_key in con.execute(
+                    select_bounds_str, {"columns": json.dumps(list(target_columns))}
+                )
+            }
+
+            update_task_dicts = []
+            moved_per_column = {
+                column: [task for task in tasks if task.column == column]
+                for column in target_columns
+            }
+            for column, column_tasks in moved_per_column.items():
+                min_key, max_key = bounds.get(column, (0, -TASK_SORT_KEY_GAP))
+                for index, task in enumerate(column_tasks):
+                    if append_mode == TaskAppendModes.TOP:
+                        sort_key = min_key - (len(column_tasks) - index) * (
+                            TASK_SORT_KEY_GAP
+                        )
+                    else:
+                        sort_key = max_key + (index + 1) * TASK_SORT_KEY_GAP
+                    update_task_dicts.append(
+                        {
+                            "task_id": task.task_id,
+                            "start_date": task.start_date,
+                            "column": task.column,
+                            "finish_date": task.finish_date,
+                            "metadata": json.dumps(task.metadata),
+                            "sort_key": sort_key,
+                        }
+                    )
+            con.executemany(transaction_str, update_task_dicts)
+            con.commit()
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+    return get_tasks_by_ids_db(task_ids=task_ids, database=database)
+
+
+def move_task_position_db(
+    task_id: int,
+    target_position: int,
+    database: str = DATABASE_FILE.as_posix(),
+) -> Task | None:
+    select_current_str = f"""
+    SELECT
+        t.column,
+        (SELECT COUNT(*) FROM tasks o WHERE o.column = t.column) AS amount,
+        {TASK_POSITION_STR}
+    FROM tasks t
+    WHERE t.task_id = :task_id
     ;
     """
-    update_position_str = """
+    update_sort_key_str = """
     UPDATE tasks
-    SET position = :target_position
+    SET sort_key = :sort_key
     WHERE task_id = :task_id
     ;
     """
-    query_str = """
+    query_str = f"""
     SELECT
         t.*,
+        {TASK_POSITION_STR},
         COALESCE(
             (SELECT json_group_array(d.depends_on_task_id)
              FROM dependencies d
@@ -1400,6 +1863,7 @@ def move_task_position_db(
     with create_connection(database=database) as con:
         try:
             con.row_factory = sqlite3.Row
+            con.execute("BEGIN IMMEDIATE")
             current_row = con.execute(
                 select_current_str, {"task_id": task_id}
             ).fetchone()
@@ -1407,45 +1871,16 @@ def move_task_position_db(
                 return None
 
             column_id = current_row["column"]
-            current_position = (
-                current_row["position"] if current_row["position"] is not None else 0
-            )
-
-            max_position = con.execute(
-                max_position_str, {"column": column_id}
-            ).fetchone()[0]
-            if max_position is None or max_position < 0:
-                return None
-
-            clamped_target = max(0, min(target_position, max_position))
-            if clamped_target == current_position:
-                con.row_factory = task_factory
-                return con.execute(query_str, {"task_id": task_id}).fetchone()
-
-            if clamped_target > current_position:
-                con.execute(
-                    move_down_str,
-                    {
-                        "column": column_id,
-                        "current_position": current_position,
-                        "target_position": clamped_target,
-                    },
+            clamped_target = max(0, min(target_position, current_row["amount"] - 1))
+            if clamped_target != current_row["position"]:
+                # Only the moved task gets a new key between its new neighbours
+                sort_key = get_sort_key_for_position(
+                    con, column_id=column_id, task_id=task_id, position=clamped_target
                 )
-            else:
                 con.execute(
-                    move_up_str,
-                    {
-                        "column": column_id,
-                        "current_position": current_position,
-                        "target_position": clamped_target,
-                    },
+                    update_sort_key_str, {"task_id": task_id, "sort_key": sort_key}
                 )
 
-            con.execute(
-                update_position_str,
-                {"task_id": task_id, "target_position": clamped_target},
-            )
-
             con.row_factory = task_factory
             moved_task = con.execute(query_str, {"task_id": task_id}).fetchone()
             con.commit()
@@ -1595,9 +2030,10 @@ def update_task_entry_db(
         """
 
     # Query to get the updated task with dependencies
-    query_str = """
+    query_str = f"""
     SELECT
         t.*,
+        {TASK_POSITION_STR},
         COALESCE(
             (SELECT json_group_array(d.depends_on_task_id)
              FROM dependencies d
@@ -1665,35 +2101,15 @@ def delete_column_db(
 
 
 def delete_task_db(task_id: int, database: str = DATABASE_FILE.as_posix()) -> int | str:
-    select_position_str = """
-    SELECT column, position
-    FROM tasks
-    WHERE task_id = ?
-    ;
-    """
+    # Positions are derived from the sort keys, the gap needs no closing
     delete_str = """
     DELETE FROM tasks
     WHERE task_id = ?
     """
-    close_gap_str = """
-    UPDATE tasks
-    SET position = position - 1
-    WHERE column = ?
-      AND position > ?
-    ;
-    """
     with create_connection(database=database) as con:
         con.row_factory = sqlite3.Row
         try:
-            current_row = con.execute(select_position_str, (task_id,)).fetchone()
-            if current_row is None:
-                return 0
             con.execute(delete_str, (task_id,))
-            old_column = current_row["column"]
-            old_position = (
-                current_row["position"] if current_row["position"] is not None else 0
-            )
-            con.execute(close_gap_str, (old_column, old_position))
             con.commit()
             return 0
         except sqlite3.Error as e:
@@ -1822,34 +2238,58 @@ def get_board_info_dict(
             raise Exception(e)
 
 
+def _get_event_filter_conditions(
+    filter: dict[str, Sequence[Any]] | None = None,
+    timestamp_condition: str = "event_timestamp >= ?",
+) -> tuple[list[str], list[Any]]:
+    if not filter:
+        return [], []
+
+    events_placeholder = ",".join(["?"] * len(filter["events"]))
+    objects_placeholder = ",".join(["?"] * len(filter["objects"]))
+    conditions = [
+        f"event_type in ({events_placeholder})",
+        f"object_type in ({objects_placeholder})",
+        timestamp_condition,
+    ]
+    return conditions, [*filter["events"], *filter["objects"], filter["time"]]
+
+
 def get_filtered_events_db(
     database: str = DATABASE_FILE.as_posix(),
     filter: dict[str, Sequence[Any]] | None = None,
+    before_event_id: int | None = None,
+    limit: int | None = None,
 ) -> list[LogEvent]:
-    if not filter:
-        query_str = """
-        SELECT
-            *
-        FROM
-            audits;
-        """
-    else:
-        params = *filter["events"], *filter["objects"], filter["time"]
-        events_placeholder = ",".join(["?"] * len(filter["events"]))
-        objects_placeholder = ",".join(["?"] * len(filter["objects"]))
-        query_str = f"""
-        SELECT
-            *
-        FROM
-            audits
-        WHERE
-            event_type in ({events_placeholder})
-            AND
-            object_type in ({objects_placeholder})
-            AND
-            event_timestamp >= ?
-            ;
-        """
+    """Events matching `filter`, newest first
+
+    Pages are fetched by passing the `event_id` of the last event of the
+    previous page as `before_event_id`, so every page only reads its rows.
+    """
+    # the unary + keeps sqlite walking event_id backwards instead of
+    # collecting and sorting all events matching the timestamp
+    conditions, params = _get_event_filter_conditions(
+        filter=filter, timestamp_condition="+event_timestamp >= ?"
+    )
+    if before_event_id is not None:
+        conditions.append("event_id < ?")
+        params.append(before_event_id)
+    where_str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    limit_str = ""
+    if limit is not None:
+        limit_str = "LIMIT ?"
+        params.append(limit)
+
+    query_str = f"""
+    SELECT
+        *
+    FROM
+        audits
+    {where_str}
+    ORDER BY event_id DESC
+    {limit_str}
+    ;
+    """
 
     with create_connection(database=database) as con:
         con.row_factory = logevent_factory
@@ -1862,6 +2302,271 @@ def get_filtered_events_db(
             raise Exception(e)
 
 
+def get_filtered_event_summaries_db(
+    database: str = DATABASE_FILE.as_posix(),
+    filter: dict[str, Sequence[Any]] | None = None,
+    before_event_id: int | None = None,
+    limit: int | None = None,
+) -> list[AuditSummary]:
+    """Daily summaries of compacted events matching `filter`, newest first
+
+    Paged like `get_filtered_events_db` by the `last_event_id` of the
+    last summary of the previous page.
+    """
+    conditions, params = _get_event_filter_conditions(
+        filter=filter, timestamp_condition="summary_date >= date(?)"
+    )
+    if before_event_id is not None:
+        conditions.append("last_event_id < ?")
+        params.append(before_event_id)
+    where_str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    limit_str = ""
+    if limit is not None:
+        limit_str = "LIMIT ?"
+        params.append(limit)
+
+    query_str = f"""
+    SELECT
+        *
+    FROM
+        audit_summaries
+    {where_str}
+    ORDER BY last_event_id DESC
+    {limit_str}
+    ;
+    """
+
+    with create_connection(database=database) as con:
+        con.row_factory = auditsummary_factory
+        try:
+            return con.execute(query_str, params).fetchall()
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
+def get_filtered_event_count_db(
+    database: str = DATABASE_FILE.as_posix(),
+    filter: dict[str, Sequence[Any]] | None = None,
+) -> int:
+    """Amount of events matching `filter`, including compacted events"""
+    conditions, params = _get_event_filter_conditions(filter=filter)
+    summary_conditions, summary_params = _get_event_filter_conditions(
+        filter=filter, timestamp_condition="summary_date >= date(?)"
+    )
+    where_str = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    summary_where_str = (
+        f"WHERE {' AND '.join(summary_conditions)}" if summary_conditions else ""
+    )
+    query_str = f"""
+    SELECT
+        (SELECT COUNT(*) FROM audits {where_str})
+        +
+        (SELECT COALESCE(SUM(amount), 0) FROM audit_summaries {summary_where_str})
+    ;
+    """
+
+    with create_connection(database=database) as con:
+        try:
+            return con.execute(query_str, [*params, *summary_params]).fetchone()[0]
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
+def _get_audit_cutoff_id(
+    con: sqlite3.Connection,
+    max_age_days: int,
+    max_rows: int,
+    max_event_id: int | None,
+) -> int:
+    """Newest event_id which exceeds the retention limits, 0 if none does
+
+    The age limit is mapped to an event_id, this assumes event_ids and
+    timestamps increase together, which holds as long as the system clock
+    is not turned back between writes.
+    """
+    cutoff_id = 0
+    if max_age_days:
+        # triggers store the audit timestamps in UTC
+        (age_cutoff_id,) = con.execute(
+            """
+            SELECT COALESCE(MAX(event_id), 0) FROM audits
+            WHERE event_timestamp < datetime('now', ?)
+            """,
+            (f"-{max_age_days} days",),
+        ).fetchone()
+        cutoff_id = max(cutoff_id, age_cutoff_id)
+    if max_rows:
+        row = con.execute(
+            "SELECT event_id FROM audits ORDER BY event_id DESC LIMIT 1 OFFSET ?",
+            (max_rows,),
+        ).fetchone()
+        if row is not None:
+            cutoff_id = max(cutoff_id, row[0])
+    if max_event_id is not None:
+        cutoff_id = min(cutoff_id, max_event_id)
+
+    # sqlite reuses the ids of deleted rows at the end of the table, keeping
+    # the newest event keeps event_ids increasing for change tracking
+    (latest_event_id,) = con.execute(
+        "SELECT COALESCE(MAX(event_id), 0) FROM audits"
+    ).fetchone()
+    return min(cutoff_id, latest_event_id - 1)
+
+
+def _archive_audits(
+    con: sqlite3.Connection, first_event_id: int, last_event_id: int, archive_dir: str
+) -> str:
+    archive_path = Path(archive_dir).expanduser()
+    archive_path.mkdir(parents=True, exist_ok=True)
+    archive_file = archive_path / f"audits_{first_event_id}_{last_event_id}.jsonl.gz"
+
+    cursor = con.execute(
+        """
+        SELECT * FROM audits
+        WHERE event_id BETWEEN ? AND ?
+        ORDER BY event_id
+        """,
+        (first_event_id, last_event_id),
+    )
+    cursor.row_factory = logevent_factory
+    with gzip.open(archive_file, "wt", encoding="utf-8") as archive:
+        for event in cursor:
+            archive.write(event.model_dump_json() + "\n")
+    return archive_file.as_posix()
+
+
+def compact_audits_db(
+    max_age_days: int = 0,
+    max_rows: int = 0,
+    archive_dir: str = "",
+    max_event_id: int | None = None,
+    batch_size: int = AUDIT_COMPACTION_BATCH_SIZE,
+    database: str = DATABASE_FILE.as_posix(),
+) -> AuditCompaction:
+    """Rolls audit events exceeding the retention limits up into daily summaries
+
+    Events are compacted oldest first in transactions of `batch_size` events,
+    so other writers only wait for one batch. The newest event is always kept,
+    as are events after `max_event_id`, if given, e.g. changes a running app
+    has not picked up yet.
+    """
+    compaction = AuditCompaction()
+    with create_connection(database=database) as con:
+        try:
+            cutoff_id = _get_audit_cutoff_id(
+                con,
+                max_age_days=max_age_days,
+                max_rows=max_rows,
+                max_event_id=max_event_id,
+            )
+            while True:
+                batch = con.execute(
+                    """
+                    SELECT MIN(event_id), MAX(event_id), COUNT(*) FROM (
+                        SELECT event_id FROM audits
+                        WHERE event_id <= ?
+                        ORDER BY event_id
+                        LIMIT ?
+                    )
+                    """,
+                    (cutoff_id, batch_size),
+                ).fetchone()
+                first_event_id, last_event_id, amount = batch
+                if not amount:
+                    break
+
+                if archive_dir:
+                    compaction.archive_files.append(
+                        _archive_audits(con, first_event_id, last_event_id, archive_dir)
+                    )
+                con.execute(
+                    """
+                    INSERT INTO audit_summaries (
+                        summary_date,
+                        event_type,
+                        object_type,
+                        object_field,
+                        amount,
+                        first_event_id,
+                        last_event_id
+                    )
+                    SELECT
+                        date(event_timestamp),
+                        event_type,
+                        object_type,
+                        COALESCE(object_field, ''),
+                        COUNT(*),
+                        MIN(event_id),
+                        MAX(event_id)
+                    FROM audits
+                    WHERE event_id BETWEEN :first_event_id AND :last_event_id
+                    GROUP BY 1, 2, 3, 4
+                    ON CONFLICT (summary_date, event_type, object_type, object_field)
+                    DO UPDATE SET
+                        amount = amount + excluded.amount,
+                        first_event_id = MIN(first_event_id, excluded.first_event_id),
+                        last_event_id = MAX(last_event_id, excluded.last_event_id)
+                    ;
+                    """,
+                    {"first_event_id": first_event_id, "last_event_id": last_event_id},
+                )
+                con.execute(
+                    "DELETE FROM audits WHERE event_id BETWEEN ? AND ?",
+                    (first_event_id, last_event_id),
+                )
+                con.commit()
+                compaction.compacted_events += amount
+            return compaction
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
+def get_latest_event_id_db(database: str = DATABASE_FILE.as_posix()) -> int:
+    query_str = """
+    SELECT COALESCE(MAX(event_id), 0)
+    FROM audits
+    ;
+    """
+    with create_connection(database=database) as con:
+        try:
+            return con.execute(query_str).fetchone()[0]
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
+def get_events_since_db(
+    event_id: int,
+    database: str = DATABASE_FILE.as_posix(),
+) -> list[LogEvent] | None:
+    """Events after `event_id`, None if some of them were compacted already"""
+    compacted_str = """
+    SELECT EXISTS (
+        SELECT 1 FROM audit_summaries WHERE last_event_id > :event_id
+    )
+    ;
+    """
+    query_str = """
+    SELECT *
+    FROM audits
+    WHERE event_id > :event_id
+    ORDER BY event_id
+    ;
+    """
+    with create_connection(database=database) as con:
+        try:
+            if con.execute(compacted_str, {"event_id": event_id}).fetchone()[0]:
+                return None
+            con.row_factory = logevent_factory
+            return con.execute(query_str, {"event_id": event_id}).fetchall()
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
 # Task Dependencies Management
 
 
@@ -1953,6 +2658,71 @@ def get_task_dependencies_db(
             raise e
 
 
+def get_blocked_by_closure_db(
+    task_id: int,
+    database: str = DATABASE_FILE.as_posix(),
+) -> list[int]:
+    """All tasks the given task depends on directly or transitively"""
+    query_str = """
+    WITH RECURSIVE blockers(task_id) AS (
+        SELECT depends_on_task_id FROM dependencies WHERE task_id = :task_id
+        UNION
+        SELECT d.depends_on_task_id
+        FROM dependencies d
+        INNER JOIN blockers b ON d.task_id = b.task_id
+    )
+    SELECT task_id FROM blockers
+    ORDER BY task_id
+    ;
+    """
+
+    with create_connection(database=database) as con:
+        try:
+            results = con.execute(query_str, {"task_id": task_id}).fetchall()
+            return [row[0] for row in results]
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
+def get_cycle_creating_dependencies_db(
+    task_id: int,
+    depends_on_task_ids: list[int],
+    database: str = DATABASE_FILE.as_posix(),
+) -> list[int]:
+    """Tasks of depends_on_task_ids the given task cannot depend on
+
+    A new dependency closes a cycle if the depended upon task is the task
+    itself or already depends on it transitively. All candidates are checked
+    against the dependents of the task, collected in a single recursive query.
+    """
+    query_str = """
+    WITH RECURSIVE dependents(task_id) AS (
+        SELECT :task_id
+        UNION
+        SELECT d.task_id
+        FROM dependencies d
+        INNER JOIN dependents dep ON d.depends_on_task_id = dep.task_id
+    )
+    SELECT task_id FROM dependents
+    WHERE task_id IN (SELECT value FROM json_each(:depends_on_task_ids))
+    ORDER BY task_id
+    ;
+    """
+    query_dict = {
+        "task_id": task_id,
+        "depends_on_task_ids": json.dumps(depends_on_task_ids),
+    }
+
+    with create_connection(database=database) as con:
+        try:
+            results = con.execute(query_str, query_dict).fetchall()
+            return [row[0] for row in results]
+        except sqlite3.Error:
+            con.rollback()
+            raise
+
+
 def would_create_cycle(
     task_id: int,
     depends_on_task_id: int,
@@ -1962,23 +2732,12 @@ def would_create_cycle(
     if task_id == depends_on_task_id:
         return True
 
-    # Check if depends_on_task_id eventually depends on task_id
-    # If so, creating task_id -> depends_on_task_id would create a cycle
-    visited = set()
-    stack = [depends_on_task_id]
-
-    while stack:
-        current = stack.pop()
-        if current == task_id:
-            return True
-
-        if current in visited:
-            continue
-
-        visited.add(current)
-
-        # Get all tasks that current depends on
-        dependencies = get_task_dependencies_db(current, database)
-        stack.extend(dependencies)
-
-    return False
+    # Creating task_id -> depends_on_task_id closes a cycle
+    # if depends_on_task_id eventually depends on task_id
+    return bool(
+        get_cycle_creating_dependencies_db(
+            task_id=task_id,
+            depends_on_task_ids=[depends_on_task_id],
+            database=database,
+        )
+    )
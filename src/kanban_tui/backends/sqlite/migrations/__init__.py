@@ -2,7 +2,7 @@ from sqlite3 import Connection
 
 from importlib.resources import files
 
-CURRENT_SCHEMA_VERSION = 4
+CURRENT_SCHEMA_VERSION = 8
 
 
 def read_migration_file(migration_file_name: str) -> str:
@@ -46,5 +46,51 @@ def apply_migration_v3_to_v4(con: Connection):
     con.executescript(sql)
 
 
+def apply_migration_v4_to_v5(con: Connection):
+    """Migrates to v5 in version v0.22.0
+    Changes:
+    - Index Creation: tasks(column, position), columns(board_id, position)
+    - Index Creation: dependencies(depends_on_task_id, task_id)
+    - Index Creation: audits(event_timestamp)
+    """
+    sql = read_migration_file("migration_v0_22_0.sql")
+
+    con.executescript(sql)
+
+
+def apply_migration_v5_to_v6(con: Connection):
+    """Migrates to v6 in version v0.22.0
+    Changes:
+    - Trigger Creation: audit task category and column visibility updates
+    - Trigger Creation: audit dependency creation/deletion as task updates
+    - Trigger Creation: audit category creation/update/deletion
+    """
+    sql = read_migration_file("migration_v0_22_0_change_tracking.sql")
+
+    con.executescript(sql)
+
+
+def apply_migration_v6_to_v7(con: Connection):
+    """Migrates to v7 in version v0.22.0
+    Changes:
+    - Column Rename: tasks.position to tasks.sort_key, backfilled with gapped keys
+    - Index Creation: tasks(column, sort_key) replaces tasks(column, position)
+    """
+    sql = read_migration_file("migration_v0_22_0_sparse_positions.sql")
+
+    con.executescript(sql)
+
+
+def apply_migration_v7_to_v8(con: Connection):
+    """Migrates to v8 in version v0.22.0
+    Changes:
+    - Table Creation: audit_summaries table for compacted audit events
+    - Index Creation: audit_summaries(last_event_id)
+    """
+    sql = read_migration_file("migration_v0_22_0_audit_summaries.sql")
+
+    con.executescript(sql)
+
+
 def increment_schema_version(con: Connection, version: int):
     con.execute(f"INSERT INTO schema_versions VALUES ({version}, datetime('now'))")
@@ -0,0 +1,17 @@
+-- Migration v0.22.0: Add secondary indexes for hot query paths
+
+-- Board loading, per-column listing and position gap handling
+CREATE INDEX IF NOT EXISTS idx_tasks_column_position ON tasks("column", position);
+
+-- Column listing per board
+CREATE INDEX IF NOT EXISTS idx_columns_board_id_position ON columns(board_id, position);
+
+-- Reverse dependency lookups (`blocking`),
+-- `task_id` lookups are covered by the UNIQUE(task_id, depends_on_task_id) index
+CREATE INDEX IF NOT EXISTS idx_dependencies_depends_on_task_id
+ON dependencies(depends_on_task_id, task_id);
+
+-- Time filtered audit log
+CREATE INDEX IF NOT EXISTS idx_audits_event_timestamp ON audits(event_timestamp);
+
+ANALYZE;
@@ -0,0 +1,16 @@
+-- Migration v0.22.0: Daily summaries of compacted audit events
+-- Audit events removed by the retention policy are counted per day, event
+-- type, object type and field, so the audit history keeps its totals
+CREATE TABLE IF NOT EXISTS audit_summaries (
+    summary_date DATETIME NOT NULL,
+    event_type TEXT NOT NULL,
+    object_type TEXT NOT NULL,
+    object_field TEXT NOT NULL DEFAULT '',
+    amount INTEGER NOT NULL,
+    first_event_id INTEGER NOT NULL,
+    last_event_id INTEGER NOT NULL,
+    PRIMARY KEY (summary_date, event_type, object_type, object_field)
+);
+
+-- Summaries are paged newest first like the audit events
+CREATE INDEX IF NOT EXISTS idx_audit_summaries_last_event_id ON audit_summaries(last_event_id);
@@ -0,0 +1,184 @@
+-- Migration v0.22.0: Audit all changes visible on the board
+-- Together with the existing triggers every change creates an audit event,
+-- so clients can refresh incrementally by polling for new event_ids
+
+-- Task category
+CREATE TRIGGER IF NOT EXISTS task_category_update
+AFTER UPDATE OF category ON tasks
+FOR EACH ROW
+WHEN OLD.category IS NOT NEW.category
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id,
+        object_field,
+        value_old,
+        value_new
+        )
+    VALUES (
+        datetime('now'),
+        'UPDATE',
+        'task',
+        OLD.task_id,
+        'category',
+        OLD.category,
+        NEW.category
+    );
+END;
+
+-- Column visibility
+CREATE TRIGGER IF NOT EXISTS column_visibility_update
+AFTER UPDATE OF visible ON columns
+FOR EACH ROW
+WHEN OLD.visible IS NOT NEW.visible
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id,
+        object_field,
+        value_old,
+        value_new
+        )
+    VALUES (
+        datetime('now'),
+        'UPDATE',
+        'column',
+        OLD.column_id,
+        'visible',
+        OLD.visible,
+        NEW.visible
+    );
+END;
+
+-- Dependencies are logged as change of the dependent task
+CREATE TRIGGER IF NOT EXISTS dependency_creation
+AFTER INSERT ON dependencies
+FOR EACH ROW
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id,
+        object_field,
+        value_old,
+        value_new
+        )
+    VALUES (
+        datetime('now'),
+        'UPDATE',
+        'task',
+        NEW.task_id,
+        'blocked_by',
+        NULL,
+        NEW.depends_on_task_id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS dependency_deletion
+AFTER DELETE ON dependencies
+FOR EACH ROW
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id,
+        object_field,
+        value_old,
+        value_new
+        )
+    VALUES (
+        datetime('now'),
+        'UPDATE',
+        'task',
+        OLD.task_id,
+        'blocked_by',
+        OLD.depends_on_task_id,
+        NULL
+    );
+END;
+
+-- Categories
+CREATE TRIGGER IF NOT EXISTS category_creation
+AFTER INSERT ON categories
+FOR EACH ROW
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id
+        )
+    VALUES (
+        datetime('now'),
+        'CREATE',
+        'category',
+        NEW.category_id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS category_deletion
+AFTER DELETE ON categories
+FOR EACH ROW
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id
+        )
+    VALUES (
+        datetime('now'),
+        'DELETE',
+        'category',
+        OLD.category_id
+    );
+END;
+
+CREATE TRIGGER IF NOT EXISTS category_update
+AFTER UPDATE ON categories
+FOR EACH ROW
+BEGIN
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id,
+        object_field,
+        value_old,
+        value_new
+        )
+    SELECT
+        datetime('now'),
+        'UPDATE',
+        'category',
+        OLD.category_id,
+        'name',
+        OLD.name,
+        NEW.name
+    WHERE OLD.name IS NOT NEW.name;
+
+    INSERT INTO audits (
+        event_timestamp,
+        event_type,
+        object_type,
+        object_id,
+        object_field,
+        value_old,
+        value_new
+        )
+    SELECT
+        datetime('now'),
+        'UPDATE',
+        'category',
+        OLD.category_id,
+        'color',
+        OLD.color,
+        NEW.color
+    WHERE OLD.color IS NOT NEW.color;
+END;
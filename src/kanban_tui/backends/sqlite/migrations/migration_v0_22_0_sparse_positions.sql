@@ -0,0 +1,10 @@
+-- Migration v0.22.0: Order tasks by a sparse sort key
+-- Keys leave gaps of 65536 between neighbours, so moving a task only updates
+-- its own row, the dense position is derived from the key order when loading
+ALTER TABLE tasks RENAME COLUMN position TO sort_key;
+
+-- Spread the dense positions, ties keep being ordered by task_id
+UPDATE tasks SET sort_key = sort_key * 65536;
+
+DROP INDEX IF EXISTS idx_tasks_column_position;
+CREATE INDEX IF NOT EXISTS idx_tasks_column_sort_key ON tasks("column", sort_key);
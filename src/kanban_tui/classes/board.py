@@ -1,9 +1,9 @@
 from datetime import datetime
 
-from pydantic import BaseModel
+from kanban_tui.classes.trusted import TrustedModel
 
 
-class Board(BaseModel):
+class Board(TrustedModel):
     board_id: int
     name: str
     icon: str = ""
@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from kanban_tui.classes.trusted import TrustedModel
 
 
-class Category(BaseModel):
+class Category(TrustedModel):
     category_id: int
     name: str
     color: str
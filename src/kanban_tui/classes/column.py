@@ -1,7 +1,7 @@
-from pydantic import BaseModel
+from kanban_tui.classes.trusted import TrustedModel
 
 
-class Column(BaseModel):
+class Column(TrustedModel):
     column_id: int
     name: str
     visible: bool
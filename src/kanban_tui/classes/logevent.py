@@ -1,15 +1,36 @@
 from datetime import datetime
 from typing import Literal
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
+from kanban_tui.classes.trusted import TrustedModel
 
-class LogEvent(BaseModel):
+
+class LogEvent(TrustedModel):
     event_id: int
     event_timestamp: datetime
     event_type: Literal["CREATE", "UPDATE", "DELETE"] | None = None
-    object_type: Literal["task", "board", "column"] | None = None
+    object_type: Literal["task", "board", "column", "category"] | None = None
     object_id: int | None = None
     object_field: str | None = None
     value_old: str | None = None
     value_new: str | None = None
+
+
+class AuditSummary(TrustedModel):
+    """Amount of compacted audit events of one day, event type, object type
+    and field, `object_field` is empty for events without a field
+    """
+
+    summary_date: datetime
+    event_type: Literal["CREATE", "UPDATE", "DELETE"]
+    object_type: Literal["task", "board", "column", "category"]
+    object_field: str = ""
+    amount: int
+    first_event_id: int
+    last_event_id: int
+
+
+class AuditCompaction(BaseModel):
+    compacted_events: int = 0
+    archive_files: list[str] = Field(default_factory=list)
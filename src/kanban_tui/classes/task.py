@@ -1,10 +1,12 @@
 from datetime import datetime, timedelta
 from typing import Any
 
-from pydantic import BaseModel, Field, computed_field
+from pydantic import Field, computed_field
 
+from kanban_tui.classes.trusted import TrustedModel
 
-class Task(BaseModel):
+
+class Task(TrustedModel):
     task_id: int
     title: str
     column: int
@@ -15,8 +17,9 @@ class Task(BaseModel):
     category: int | None = None
     due_date: datetime | None = None
     description: str = ""
-    blocked_by: list[int] = []  # Task IDs this task depends on
-    blocking: list[int] = []  # Task IDs that depend on this task
+    # Task IDs this task depends on and task IDs that depend on this task
+    blocked_by: list[int] = Field(default_factory=list)
+    blocking: list[int] = Field(default_factory=list)
     metadata: dict[str, Any] = Field(default_factory=dict)  # Backend-specific extras
 
     def get_days_since_creation(self) -> int:
@@ -0,0 +1,28 @@
+from typing import Any, ClassVar, Self
+
+from pydantic import BaseModel
+
+
+class TrustedModel(BaseModel):
+    """BaseModel which can be built from already valid data without validation
+
+    Used for rows coming from our own database schema, where every value
+    already has the correct type.
+    """
+
+    _field_names: ClassVar[frozenset[str]] = frozenset()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls._field_names = frozenset(cls.__pydantic_fields__)
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> Self:
+        """Builds the model from a dict containing exactly the model fields
+
+        Falls back to regular validation if fields are missing or unknown.
+        """
+        if data.keys() != cls._field_names:
+            return cls.model_validate(data)
+        return cls.model_construct(**data)
@@ -8,6 +8,7 @@ from collections import OrderedDict
 from kanban_tui.cli.column_commands import column
 from kanban_tui.cli.task_commands import task
 from kanban_tui.cli.category_commands import category
+from kanban_tui.cli.audit_commands import audit
 
 import click
 
@@ -16,6 +17,7 @@ from kanban_tui.cli.board_commands import board
 from kanban_tui.cli.demo_commands import demo
 from kanban_tui.cli.skills_commands import skill
 from kanban_tui.cli.mcp_commands import mcp
+from kanban_tui.cli.serve_commands import serve
 from kanban_tui.cli.general_commands import info, clear, auth
 from kanban_tui.utils import print_to_console
 from kanban_tui.constants import (
@@ -32,12 +34,14 @@ COMMAND_DICT = {
         "clear",
         "skill",
         "mcp",
+        "serve",
     ],
     "CLI Interface Commands": [
         "board",
         "category",
         "column",
         "task",
+        "audit",
     ],
     # "Not yet implemented": [
     #     "auth",
@@ -109,7 +113,11 @@ def cli(ctx: click.Context, web: bool):
                 demo_mode=True,
             )
             ctx.obj = app
-        elif ctx.invoked_subcommand in ["info", "clear"]:
+            ctx.call_on_close(app.backend.close)
+        elif ctx.invoked_subcommand in ["info", "clear", "serve"]:
+            pass
+        elif ctx.obj is not None:
+            # command forwarded to `ktui serve`, which owns the app
             pass
         else:
             app = KanbanTui(
@@ -119,6 +127,7 @@ def cli(ctx: click.Context, web: bool):
                 ),
             )
             ctx.obj = app
+            ctx.call_on_close(app.backend.close)
 
 
 cli.add_command(demo)
@@ -128,9 +137,11 @@ cli.add_command(board)
 cli.add_command(category)
 cli.add_command(task)
 cli.add_command(column)
+cli.add_command(audit)
 cli.add_command(auth)
 cli.add_command(skill)
 cli.add_command(mcp)
+cli.add_command(serve)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,65 @@
+"""CLI commands for kanban-tui audit log retention"""
+
+import click
+
+from kanban_tui.app import KanbanTui
+from kanban_tui.config import Backends
+from kanban_tui.utils import print_to_console
+
+
+@click.group()
+@click.pass_obj
+def audit(app: KanbanTui):
+    """
+    Commands to manage the audit log via the CLI
+    """
+    if app.config.backend.mode != Backends.SQLITE:
+        raise click.exceptions.UsageError(
+            f"""
+            Currently using `{app.config.backend.mode}` backend.
+            Please change the backend to `{Backends.SQLITE}` before using the `audit` command.
+            """
+        )
+
+
+@audit.command("compact")
+@click.pass_obj
+@click.option(
+    "--max-age-days",
+    default=None,
+    type=click.IntRange(min=0),
+    help="compact events older than this many days, defaults to the config",
+)
+@click.option(
+    "--max-rows",
+    default=None,
+    type=click.IntRange(min=0),
+    help="only keep this many newest events, defaults to the config",
+)
+@click.option(
+    "--archive-dir",
+    default=None,
+    type=click.Path(file_okay=False),
+    help="also write compacted events as gzipped JSON lines into this directory",
+)
+def compact_audits(
+    app: KanbanTui,
+    max_age_days: int | None,
+    max_rows: int | None,
+    archive_dir: str | None,
+):
+    """
+    Rolls old audit events up into daily summaries
+    """
+    compaction = app.backend.compact_audits(
+        max_age_days=max_age_days, max_rows=max_rows, archive_dir=archive_dir
+    )
+    if not compaction.compacted_events:
+        print_to_console("No audit events exceed the retention limits.")
+        return
+
+    print_to_console(
+        f"Compacted {compaction.compacted_events} audit events into daily summaries."
+    )
+    for archive_file in compaction.archive_files:
+        print_to_console(f"Archived events to [blue]{archive_file}[/].")
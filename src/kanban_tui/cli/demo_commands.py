@@ -3,6 +3,7 @@
 import click
 
 from kanban_tui.app import KanbanTui
+from kanban_tui.backends.sqlite.database import delete_database_files
 from kanban_tui.constants import (
     DEMO_CONFIG_FILE,
     DEMO_DATABASE_FILE,
@@ -44,4 +45,4 @@ def demo(app: KanbanTui, clean: bool, keep: bool, web: bool):
 
     if not keep:
         DEMO_CONFIG_FILE.unlink(missing_ok=True)
-        DEMO_DATABASE_FILE.unlink(missing_ok=True)
+        delete_database_files(DEMO_DATABASE_FILE.as_posix())
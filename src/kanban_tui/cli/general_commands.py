@@ -6,6 +6,7 @@ from pathlib import Path
 import click
 
 from kanban_tui.app import KanbanTui
+from kanban_tui.backends.sqlite.database import delete_database_files
 from kanban_tui.config import Backends
 from kanban_tui.utils import build_info_table
 from kanban_tui.utils import print_to_console
@@ -33,7 +34,7 @@ def clear(confirm: bool):
         Path(conf_path_str).unlink(missing_ok=True)
 
         db_path_str = os.getenv("KANBAN_TUI_DATABASE_FILE", DATABASE_FILE.as_posix())
-        Path(db_path_str).unlink(missing_ok=True)
+        delete_database_files(db_path_str)
 
         print_to_console(
             f"Config under {conf_path_str} deleted [green]successfully[/]."
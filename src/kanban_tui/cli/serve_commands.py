@@ -0,0 +1,208 @@
+"""CLI command to keep the backend warm for thin CLI clients"""
+
+import io
+import json
+import os
+import signal
+import socket
+import socketserver
+import sys
+import traceback
+from contextlib import chdir, redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import Any
+
+import click
+
+from kanban_tui.app import KanbanTui
+from kanban_tui.daemon import get_config_path, get_database_path, get_socket_path
+from kanban_tui.utils import print_to_console
+
+
+class CommandRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        line = self.rfile.readline()
+        # liveness probes connect without sending a command
+        if not line:
+            return
+        request = json.loads(line)
+        response = self.server.handle_command_request(request)  # type: ignore[attr-defined]
+        self.wfile.write(json.dumps(response).encode())
+
+
+class KanbanTuiDaemon(socketserver.UnixStreamServer):
+    """Runs forwarded CLI commands against one warm app, one at a time
+
+    The app is rebuilt once the config file changed, e.g. after another
+    process activated a different board. Backend caches are dropped before
+    every command, so edits made by other processes are picked up.
+    """
+
+    def __init__(
+        self,
+        socket_path: str,
+        command: click.Command,
+        config_path: str,
+        database_path: str,
+    ):
+        self.command = command
+        self.config_path = config_path
+        self.database_path = database_path
+        self._app: KanbanTui | None = None
+        self._config_mtime: int | None = None
+        super().__init__(socket_path, CommandRequestHandler)
+
+    def server_bind(self):
+        # the socket is only accessible by the user from the moment it exists
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+
+    def get_app(self) -> KanbanTui:
+        config_mtime = self._get_config_mtime()
+        if self._app is None or config_mtime != self._config_mtime:
+            self.close_app()
+            self._app = KanbanTui(
+                config_path=self.config_path, database_path=self.database_path
+            )
+            self._config_mtime = self._get_config_mtime()
+        return self._app
+
+    def _get_config_mtime(self) -> int | None:
+        try:
+            return os.stat(self.config_path).st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def close_app(self):
+        if self._app is not None:
+            self._app.backend.close()
+            self._app = None
+
+    def server_close(self):
+        super().server_close()
+        self.close_app()
+
+    def handle_command_request(self, request: dict[str, Any]) -> dict[str, Any]:
+        if (request["config_path"], request["database_path"]) != (
+            self.config_path,
+            self.database_path,
+        ):
+            return {"status": "unavailable"}
+
+        exit_code, stdout, stderr = self.run_command(request["argv"], request["cwd"])
+        return {
+            "status": "ok",
+            "exit_code": exit_code,
+            "stdout": stdout,
+            "stderr": stderr,
+        }
+
+    def run_command(self, argv: list[str], cwd: str) -> tuple[int, str, str]:
+        """Runs the command like the in-process CLI and captures its output
+
+        Args:
+            argv: Command line arguments without the program name
+            cwd: Working directory of the client
+
+        Returns:
+            Exit code, stdout and stderr of the command
+        """
+        app = self.get_app()
+        # other processes may have changed cached rows since the last command
+        app.backend.clear_cache()
+        stdout, stderr = io.StringIO(), io.StringIO()
+        stdin, sys.stdin = sys.stdin, io.StringIO()
+        exit_code = 0
+        try:
+            with chdir(cwd), redirect_stdout(stdout), redirect_stderr(stderr):
+                try:
+                    result = self.command.main(
+                        args=argv,
+                        prog_name="ktui",
+                        standalone_mode=False,
+                        obj=app,
+                    )
+                    # --help and --version exit early with their exit code
+                    if isinstance(result, int):
+                        exit_code = result
+                except click.ClickException as e:
+                    e.show(file=stderr)
+                    exit_code = e.exit_code
+                except click.exceptions.Abort:
+                    click.echo("Aborted!", file=stderr)
+                    exit_code = 1
+                except SystemExit as e:
+                    # sys.exit() without a code exits successfully
+                    exit_code = (
+                        0
+                        if e.code is None
+                        else (e.code if isinstance(e.code, int) else 1)
+                    )
+                except Exception:
+                    traceback.print_exc(file=stderr)
+                    exit_code = 1
+        finally:
+            sys.stdin = stdin
+        return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+def is_daemon_running(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        try:
+            client.connect(socket_path)
+        except OSError:
+            return False
+    return True
+
+
+@click.command()
+@click.option(
+    "--socket",
+    "socket_path",
+    type=click.Path(dir_okay=False),
+    default=None,
+    help="Unix socket to listen on, defaults to KANBAN_TUI_SOCKET_FILE or the data dir",
+)
+@click.pass_context
+def serve(ctx: click.Context, socket_path: str | None):
+    """
+    Keeps the backend warm to run CLI commands without startup cost
+    """
+    if not hasattr(socket, "AF_UNIX"):
+        print_to_console("[red]Unix sockets are not supported on this platform.[/]")
+        return
+
+    socket_path = socket_path or get_socket_path()
+    if is_daemon_running(socket_path):
+        print_to_console(f"[red]A daemon is already listening on {socket_path}.[/]")
+        return
+    # Left over by a daemon that did not shut down cleanly
+    Path(socket_path).unlink(missing_ok=True)
+
+    daemon = KanbanTuiDaemon(
+        socket_path=socket_path,
+        command=ctx.find_root().command,
+        config_path=get_config_path(),
+        database_path=get_database_path(),
+    )
+    # load config and database before the first command arrives
+    daemon.get_app()
+    print_to_console(
+        f"Serving CLI commands on [blue]{socket_path}[/], stop with Ctrl+C."
+    )
+
+    def signal_handler(sig, frame):
+        """Stop like on Ctrl+C, so the socket gets removed"""
+        raise KeyboardInterrupt
+
+    signal.signal(signal.SIGTERM, signal_handler)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        daemon.server_close()
+        Path(socket_path).unlink(missing_ok=True)
@@ -1,8 +1,10 @@
 """CLI commands for kanban-tui task management"""
 
-from pydantic import TypeAdapter
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 import datetime
+import json as json_lib
+import sqlite3
 
 import click
 
@@ -12,6 +14,17 @@ from kanban_tui.config import Backends
 from kanban_tui.utils import print_to_console
 
 
+class TaskImportEntry(BaseModel):
+    """A task read by `ktui task import`"""
+
+    title: str
+    description: str = ""
+    column: int | None = None
+    category: int | None = None
+    due_date: datetime.datetime | None = None
+    depends_on: list[int] = []
+
+
 @click.group()
 @click.pass_obj
 def task(app: KanbanTui):
@@ -178,39 +191,134 @@ def create_task(
 
     # Add dependencies if specified
     if depends_on:
-        for depends_on_task_id in depends_on:
-            # Check if dependency task exists
-            dep_task = app.backend.get_task_by_id(task_id=depends_on_task_id)
-            if not dep_task:
-                print_to_console(
-                    f"[yellow]Task {depends_on_task_id} does not exist, skipping dependency.[/]"
-                )
-                continue
+        add_task_dependencies(app=app, task_id=task_id, depends_on=depends_on)
 
-            # Check if dependency already exists
-            existing_deps = app.backend.get_task_dependencies(task_id=task_id)
-            if depends_on_task_id in existing_deps:
-                print_to_console(
-                    f"[yellow]Task {task_id} already depends on task {depends_on_task_id}.[/]"
-                )
-                continue
 
-            # Check if this would create a circular dependency
-            if app.backend.would_create_dependency_cycle(task_id, depends_on_task_id):
-                print_to_console(
-                    f"[red]Cannot add dependency: would create circular dependency with task {depends_on_task_id}.[/]"
-                )
-                continue
+@task.command("import")
+@click.pass_obj
+@click.argument("source", type=click.File("r"), default="-")
+@click.option(
+    "--column",
+    default=None,
+    type=click.INT,
+    help="Column for tasks without a column [default: left most visible column]",
+)
+@click.option(
+    "--json",
+    is_flag=True,
+    default=False,
+    type=click.BOOL,
+    help="Print the created tasks in JSON format",
+)
+def import_tasks(app: KanbanTui, source, column: int | None, json: bool):
+    """
+    Creates many tasks at once from a JSON array or NDJSON (one object per line),
+    read from stdin by default. Each object needs a `title` and can set
+    `description`, `column`, `category`, `due_date` and `depends_on` (list of task IDs)
+    """
+    content = source.read().strip()
+    try:
+        if content.startswith("["):
+            raw_entries = json_lib.loads(content)
+        else:
+            raw_entries = [
+                json_lib.loads(line) for line in content.splitlines() if line.strip()
+            ]
+        entries = TypeAdapter(list[TaskImportEntry]).validate_python(raw_entries)
+    except (ValueError, ValidationError) as e:
+        print_to_console(f"[red]Could not read tasks to import:[/] {e}")
+        return
 
-            # All checks passed, create the dependency
-            app.backend.create_task_dependency(
-                task_id=task_id,
-                depends_on_task_id=depends_on_task_id,
+    if not entries:
+        print_to_console("No tasks to import.")
+        return
+
+    default_column = column
+    if default_column is None:
+        default_column = next(
+            (col.column_id for col in app.backend.get_columns() if col.visible), None
+        )
+    entry_columns = [
+        default_column if entry.column is None else entry.column for entry in entries
+    ]
+    # like `task create`, columns of all boards are accepted
+    missing_columns = {
+        column_id
+        for column_id in set(entry_columns)
+        if column_id is not None
+        and app.backend.get_column_by_id(column_id=column_id) is None
+    }
+    missing_categories = {
+        entry.category
+        for entry in entries
+        if entry.category is not None
+        and app.backend.get_category_by_id(category_id=entry.category) is None
+    }
+    invalid_entries = False
+    for entry_number, (entry, entry_column) in enumerate(
+        zip(entries, entry_columns), start=1
+    ):
+        problems = []
+        if entry_column is None:
+            problems.append(
+                "no column given and the active board has no visible column"
+            )
+        elif entry_column in missing_columns:
+            problems.append(f"column {entry_column} does not exist")
+        if entry.category in missing_categories:
+            problems.append(f"category {entry.category} does not exist")
+        if problems:
+            invalid_entries = True
+            print_to_console(
+                f"[red]Task {entry_number} `{entry.title}`: {', '.join(problems)}.[/]"
             )
+    if invalid_entries:
+        print_to_console("[red]No tasks imported.[/]")
+        return
+
+    # Validate all dependencies in a single query, new tasks cannot close a cycle
+    requested_dep_ids = sorted({dep for entry in entries for dep in entry.depends_on})
+    existing_dep_ids = {
+        dep_task.task_id
+        for dep_task in app.backend.get_tasks_by_ids(task_ids=requested_dep_ids)
+    }
+    for depends_on_task_id in requested_dep_ids:
+        if depends_on_task_id not in existing_dep_ids:
             print_to_console(
-                f"[green]Added dependency: task {task_id} depends on task {depends_on_task_id}.[/]"
+                f"[yellow]Task {depends_on_task_id} does not exist, skipping dependency.[/]"
             )
 
+    try:
+        new_tasks = app.backend.create_new_tasks(
+            tasks=[
+                {
+                    "title": entry.title,
+                    "description": entry.description,
+                    "column": entry_column,
+                    "category": entry.category,
+                    "due_date": entry.due_date,
+                    "blocked_by": [
+                        dep for dep in entry.depends_on if dep in existing_dep_ids
+                    ],
+                }
+                for entry, entry_column in zip(entries, entry_columns)
+            ]
+        )
+    except sqlite3.Error as e:
+        print_to_console(f"[red]Could not import tasks, no tasks imported:[/] {e}")
+        return
+
+    if json:
+        json_str = (
+            TypeAdapter(list[Task])
+            .dump_json(new_tasks, indent=4, exclude_none=True, exclude_defaults=True)
+            .decode("utf-8")
+        )
+        print_to_console(json_str)
+    else:
+        task_ids = [new_task.task_id for new_task in new_tasks]
+        print_to_console(f"Created {len(new_tasks)} tasks with {task_ids = }.")
+
 
 @task.command("update")
 @click.pass_obj
@@ -320,48 +428,61 @@ def update_task(
 
     # Handle dependency addition
     if depends_on:
-        existing_deps = app.backend.get_task_dependencies(task_id=task_id)
-        for depends_on_task_id in depends_on:
-            # Check if dependency task exists
-            dep_task = app.backend.get_task_by_id(task_id=depends_on_task_id)
-            if not dep_task:
-                print_to_console(
-                    f"[yellow]Task {depends_on_task_id} does not exist, skipping dependency.[/]"
-                )
-                continue
-
-            # Check if dependency already exists
-            if depends_on_task_id in existing_deps:
-                print_to_console(
-                    f"[yellow]Task {task_id} already depends on task {depends_on_task_id}.[/]"
-                )
-                continue
-
-            # Check if this would create a circular dependency
-            if app.backend.would_create_dependency_cycle(task_id, depends_on_task_id):
-                print_to_console(
-                    f"[red]Cannot add dependency: would create circular dependency with task {depends_on_task_id}.[/]"
-                )
-                continue
-
-            # All checks passed, create the dependency
-            app.backend.create_task_dependency(
-                task_id=task_id,
-                depends_on_task_id=depends_on_task_id,
-            )
-            print_to_console(
-                f"[green]Added dependency: task {task_id} depends on task {depends_on_task_id}.[/]"
-            )
+        add_task_dependencies(app=app, task_id=task_id, depends_on=depends_on)
 
 
 @task.command("move")
 @click.pass_obj
-@click.argument("task_id", type=click.INT)
-@click.argument("target_column", type=click.INT)
-def move_task(app: KanbanTui, task_id: int, target_column: int):
+@click.argument("task_id", type=click.INT, required=False)
+@click.argument("target_column", type=click.INT, required=False)
+@click.option(
+    "--ids",
+    default=None,
+    type=click.STRING,
+    help="Comma separated task IDs to move together, only pass TARGET_COLUMN (e.g. `--ids 1,2,3 4`)",
+)
+@click.option(
+    "--from-column",
+    default=None,
+    type=click.INT,
+    help="Move all tasks of this column, only pass TARGET_COLUMN",
+)
+@click.option(
+    "--category",
+    default=None,
+    type=click.INT,
+    help="Only move tasks with this category ID, used with `--from-column`",
+)
+def move_task(
+    app: KanbanTui,
+    task_id: int | None,
+    target_column: int | None,
+    ids: str | None,
+    from_column: int | None,
+    category: int | None,
+):
     """
-    Moves a task to another column
+    Moves a task to another column, or many tasks at once with `--ids` or `--from-column`
     """
+    if ids is not None or from_column is not None:
+        # Only the target column is given for bulk moves
+        if target_column is not None or task_id is None:
+            raise click.UsageError(
+                "Pass only TARGET_COLUMN when moving tasks with `--ids` or `--from-column`."
+            )
+        move_tasks(
+            app=app,
+            target_column=task_id,
+            ids=ids,
+            from_column=from_column,
+            category=category,
+        )
+        return
+    if category is not None:
+        raise click.UsageError("`--category` can only be used with `--from-column`.")
+    if task_id is None or target_column is None:
+        raise click.UsageError("Missing argument 'TASK_ID' or 'TARGET_COLUMN'.")
+
     task = app.backend.get_task_by_id(task_id=task_id)
     new_column = app.backend.get_column_by_id(column_id=target_column)
     if not task:
@@ -416,6 +537,115 @@ def move_task(app: KanbanTui, task_id: int, target_column: int):
         )
 
 
+def move_tasks(
+    app: KanbanTui,
+    target_column: int,
+    ids: str | None,
+    from_column: int | None,
+    category: int | None,
+):
+    """
+    Moves the tasks given by ids or all tasks of a column (optionally only the ones
+    of a category) to the target column in one transaction
+    """
+    new_column = app.backend.get_column_by_id(column_id=target_column)
+    if not new_column:
+        print_to_console(
+            f"[red]There is no column with column_id = {target_column}.[/]"
+        )
+        return
+
+    if ids is not None:
+        try:
+            task_ids = list(dict.fromkeys(int(i) for i in ids.split(",") if i.strip()))
+        except ValueError:
+            raise click.BadParameter(
+                f"`{ids}` is not a comma separated list of task IDs.",
+                param_hint="--ids",
+            )
+        tasks = app.backend.get_tasks_by_ids(task_ids=task_ids)
+        for missing_task_id in sorted(set(task_ids) - {t.task_id for t in tasks}):
+            print_to_console(
+                f"[yellow]There is no task with task_id = {missing_task_id}.[/]"
+            )
+    else:
+        tasks = app.backend.get_tasks_by_column(column_id=from_column) or []
+    if category is not None:
+        tasks = [task for task in tasks if task.category == category]
+
+    tasks_to_move = []
+    for task in tasks:
+        if task.column == target_column:
+            print_to_console(
+                f"[yellow]Task with task_id = {task.task_id} is already in column {target_column}.[/]"
+            )
+        else:
+            tasks_to_move.append(task)
+    if not tasks_to_move:
+        print_to_console("No tasks to move.")
+        return
+
+    # Validate if tasks/column are on active board and ask for further confirmation if not
+    active_board = app.backend.active_board
+    active_column_ids = {column.column_id for column in app.backend.get_columns()}
+    if any(task.column not in active_column_ids for task in tasks_to_move):
+        click.confirm(
+            "Some tasks are not on the active board, still continue?", abort=True
+        )
+    if active_board.board_id != new_column.board_id:
+        click.confirm(
+            "Target column is not on the active board, still continue?", abort=True
+        )
+
+    # Check dependencies of all tasks in a single query
+    if target_column == active_board.start_column:
+        dependency_ids = {dep for task in tasks_to_move for dep in task.blocked_by}
+        dependency_tasks = {
+            dep_task.task_id: dep_task
+            for dep_task in app.backend.get_tasks_by_ids(task_ids=list(dependency_ids))
+        }
+        movable_tasks = []
+        for task in tasks_to_move:
+            unfinished_tasks = [
+                dependency_tasks[dep]
+                for dep in task.blocked_by
+                if dep in dependency_tasks and not dependency_tasks[dep].finished
+            ]
+            if unfinished_tasks:
+                task_titles = ", ".join(
+                    f"#{t.task_id} '{t.title}'" for t in unfinished_tasks
+                )
+                print_to_console(
+                    f"[red]Cannot move task with task_id = {task.task_id}: "
+                    f"Task is blocked by unfinished dependencies: {task_titles}[/]"
+                )
+            else:
+                movable_tasks.append(task)
+        tasks_to_move = movable_tasks
+        if not tasks_to_move:
+            return
+
+    # Update task status dates based on column transitions
+    for task in tasks_to_move:
+        task.update_task_status(
+            new_column=target_column,
+            update_column_dict={
+                "reset": active_board.reset_column,
+                "start": active_board.start_column,
+                "finish": active_board.finish_column,
+            },
+        )
+        task.column = target_column
+    moved_tasks = app.backend.update_tasks_status(
+        new_tasks=tasks_to_move,
+        append_mode=app.config.task.append_mode,
+    )
+    task_ids = [task.task_id for task in moved_tasks]
+    print_to_console(
+        f"Moved {len(moved_tasks)} tasks with {task_ids = } to column {target_column}."
+    )
+
+
 @task.command("delete")
 @click.pass_obj
 @click.argument("task_id", type=click.INT)
@@ -442,3 +672,54 @@ def delete_task(app: KanbanTui, task_id: int, no_confirm: bool):
 
     else:
         print_to_console(f"[red]There is no task with {task_id = }[/].")
+
+
+def add_task_dependencies(app: KanbanTui, task_id: int, depends_on: tuple[int, ...]):
+    """
+    Adds dependencies of a task, skipping unknown tasks, existing dependencies
+    and dependencies which would create a cycle
+    """
+    # Validate all dependencies upfront, the cycle check covers the whole chain
+    # of each dependency in a single query
+    existing_task_ids = {
+        dep_task.task_id
+        for dep_task in app.backend.get_tasks_by_ids(task_ids=list(depends_on))
+    }
+    existing_deps = set(app.backend.get_task_dependencies(task_id=task_id))
+    cycle_task_ids = set(
+        app.backend.get_cycle_creating_dependencies(
+            task_id=task_id, depends_on_task_ids=list(depends_on)
+        )
+    )
+
+    for depends_on_task_id in depends_on:
+        # Check if dependency task exists
+        if depends_on_task_id not in existing_task_ids:
+            print_to_console(
+                f"[yellow]Task {depends_on_task_id} does not exist, skipping dependency.[/]"
+            )
+            continue
+
+        # Check if dependency already exists
+        if depends_on_task_id in existing_deps:
+            print_to_console(
+                f"[yellow]Task {task_id} already depends on task {depends_on_task_id}.[/]"
+            )
+            continue
+
+        # Check if this would create a circular dependency
+        if depends_on_task_id in cycle_task_ids:
+            print_to_console(
+                f"[red]Cannot add dependency: would create circular dependency with task {depends_on_task_id}.[/]"
+            )
+            continue
+
+        # All checks passed, create the dependency
+        app.backend.create_task_dependency(
+            task_id=task_id,
+            depends_on_task_id=depends_on_task_id,
+        )
+        existing_deps.add(depends_on_task_id)
+        print_to_console(
+            f"[green]Added dependency: task {task_id} depends on task {depends_on_task_id}.[/]"
+        )
@@ -17,6 +17,7 @@ from kanban_tui.constants import (
     AUTH_FILE,
     CONFIG_FILE,
     DATABASE_FILE,
+    JIRA_CACHE_FILE,
 )
 
 
@@ -36,10 +37,27 @@ class TaskAppendModes(StrEnum):
     BOTTOM = "bottom"
 
 
+class JournalModes(StrEnum):
+    WAL = "wal"
+    DELETE = "delete"
+    TRUNCATE = "truncate"
+    PERSIST = "persist"
+
+
+class SynchronousModes(StrEnum):
+    OFF = "off"
+    NORMAL = "normal"
+    FULL = "full"
+    EXTRA = "extra"
+
+
 class BoardSettings(BaseModel):
     theme: str = Field(default="dracula")
     columns_in_view: int = Field(default=3)
     auto_refresh_interval: int = Field(default=0)
+    # columns with more tasks only mount the cards near the viewport,
+    # 0 always mounts all cards
+    virtual_column_threshold: int = Field(default=500, ge=0)
 
 
 class TaskSettings(BaseModel):
@@ -62,11 +80,57 @@ class JiraBackendSettings(BaseModel):
     auth_file_path: str = Field(default=AUTH_FILE.as_posix())
     jqls: list[JqlEntry] = Field(default_factory=list)
     active_jql: int = Field(default=1)
+    # JQL results are loaded in pages of page_size issues,
+    # with up to max_concurrent_requests pages in flight
+    page_size: int = Field(default=100, gt=0)
+    max_concurrent_requests: int = Field(default=4, gt=0)
+    # seconds the board infos shown in the board picker are reused
+    board_info_ttl: int = Field(default=60, ge=0)
+    # issues are cached in this file and only changed ones are fetched
+    # on refresh, an empty path disables the cache
+    issue_cache_path: str = Field(default=JIRA_CACHE_FILE.as_posix())
+
+
+class SqlitePerformanceSettings(BaseModel):
+    """Pragmas applied to the database file and every opened connection.
+
+    WAL journaling lets readers (TUI, CLI, MCP server) keep working while
+    another process writes, busy_timeout (ms) makes writers wait for the lock
+    instead of failing with `database is locked`. A negative cache_size is
+    in KiB, mmap_size is in bytes (0 disables memory mapping).
+    """
+
+    journal_mode: JournalModes = Field(default=JournalModes("wal"))
+    busy_timeout: int = Field(default=5000)
+    synchronous: SynchronousModes = Field(default=SynchronousModes("normal"))
+    cache_size: int = Field(default=-16000)
+    mmap_size: int = Field(default=0)
+
+
+class SqliteAuditRetentionSettings(BaseModel):
+    """Audit events older than max_age_days or beyond the newest max_rows
+    events are rolled up into daily summaries, 0 disables the limit.
+
+    With an archive_dir the compacted events are also written there as
+    gzipped JSON lines. auto_compact applies the retention in the background
+    whenever the app starts.
+    """
+
+    max_age_days: int = Field(default=0, ge=0)
+    max_rows: int = Field(default=0, ge=0)
+    archive_dir: str = Field(default="")
+    auto_compact: bool = Field(default=True)
 
 
 class SqliteBackendSettings(BaseModel):
     database_path: str = Field(default=DATABASE_FILE.as_posix())
     active_board_id: int = Field(default=1)
+    performance: SqlitePerformanceSettings = Field(
+        default_factory=SqlitePerformanceSettings
+    )
+    audit_retention: SqliteAuditRetentionSettings = Field(
+        default_factory=SqliteAuditRetentionSettings
+    )
 
 
 class ClaudeBackendSettings(BaseModel):
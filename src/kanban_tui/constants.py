@@ -27,6 +27,8 @@ DATABASE_NAME = "kanban_tui.db"
 DATA_DIR = _create_kanban_tui_dirs(xdg_data_home())
 DATABASE_FILE = DATA_DIR / DATABASE_NAME
 DEMO_DATABASE_FILE = DATA_DIR / "demo_kanban_tui.db"
+JIRA_CACHE_FILE = DATA_DIR / "jira_cache.db"
+SOCKET_FILE = DATA_DIR / "kanban_tui.sock"
 
 AUTH_NAME = "authentication.toml"
 AUTH_DIR = _create_kanban_tui_auth_dir(CONFIG_DIR)
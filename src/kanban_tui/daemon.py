@@ -0,0 +1,95 @@
+"""Thin client entry-point forwarding CLI commands to a running `ktui serve`
+
+Only depends on the standard library and `kanban_tui.constants`, so
+forwarded commands skip importing textual and the app package. Whenever
+no daemon serves the same config and database, the command runs in-process.
+"""
+
+import json
+import os
+import socket
+import sys
+from typing import Any
+
+from kanban_tui.constants import CONFIG_FILE, DATABASE_FILE, SOCKET_FILE
+
+FORWARDED_COMMANDS = {"audit", "board", "category", "column", "task"}
+# Commands reading stdin always run in-process
+IN_PROCESS_COMMANDS = {("task", "import")}
+
+
+def get_socket_path() -> str:
+    return os.getenv("KANBAN_TUI_SOCKET_FILE", SOCKET_FILE.as_posix())
+
+
+def get_config_path() -> str:
+    return os.getenv("KANBAN_TUI_CONFIG_FILE", CONFIG_FILE.as_posix())
+
+
+def get_database_path() -> str:
+    return os.getenv("KANBAN_TUI_DATABASE_FILE", DATABASE_FILE.as_posix())
+
+
+def can_forward(argv: list[str]) -> bool:
+    """Commands are forwarded if they operate on the board and cannot prompt
+
+    Interactive terminals stay in-process, so confirmation prompts keep working.
+    """
+    if not hasattr(socket, "AF_UNIX") or not argv:
+        return False
+    if argv[0] not in FORWARDED_COMMANDS or tuple(argv[:2]) in IN_PROCESS_COMMANDS:
+        return False
+    return not sys.stdin.isatty()
+
+
+def forward_to_daemon(
+    argv: list[str], socket_path: str | None = None
+) -> dict[str, Any] | None:
+    """Runs the command in the daemon listening on `socket_path`
+
+    Args:
+        argv: Command line arguments without the program name
+        socket_path: Socket of the daemon, defaults to `get_socket_path()`
+
+    Returns:
+        Dict with `exit_code`, `stdout` and `stderr` of the command, None if
+        no daemon is running or it serves a different config or database
+    """
+    request = {
+        "argv": argv,
+        "cwd": os.getcwd(),
+        "config_path": get_config_path(),
+        "database_path": get_database_path(),
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path or get_socket_path())
+            client.sendall(json.dumps(request).encode() + b"\n")
+            client.shutdown(socket.SHUT_WR)
+            chunks = []
+            while chunk := client.recv(65536):
+                chunks.append(chunk)
+    except OSError:
+        return None
+
+    try:
+        response = json.loads(b"".join(chunks))
+    except json.JSONDecodeError:
+        return None
+    if response.get("status") != "ok":
+        return None
+    return response
+
+
+def main():
+    argv = sys.argv[1:]
+    if can_forward(argv):
+        response = forward_to_daemon(argv)
+        if response is not None:
+            sys.stdout.write(response["stdout"])
+            sys.stderr.write(response["stderr"])
+            sys.exit(response["exit_code"])
+
+    from kanban_tui.cli import cli
+
+    cli()
@@ -1,4 +1,5 @@
 from kanban_tui.modal.modal_jira_url_screen import ModalBaseUrlScreen
+from contextlib import suppress
 from typing import Iterable, TYPE_CHECKING
 
 from kanban_tui.config import Backends
@@ -14,7 +15,7 @@ from textual.widget import Widget
 from textual.events import ScreenResume
 from textual.widgets import Header
 from textual.screen import Screen
-from textual.worker import get_current_worker
+from textual.worker import WorkerCancelled, get_current_worker
 
 from kanban_tui.classes.board import Board
 from kanban_tui.widgets.board_widgets import KanbanBoard
@@ -24,6 +25,7 @@ from kanban_tui.widgets.custom_widgets import KanbanTuiFooter
 class BoardScreen(Screen):
     app: "KanbanTui"
     active_board: reactive[Board | None] = reactive(None, init=False)
+    loading_tasks: reactive[bool] = reactive(False, init=False)
 
     def compose(self) -> Iterable[Widget]:
         yield KanbanBoard()
@@ -37,6 +39,14 @@ class BoardScreen(Screen):
             )
             self.query_one(KanbanBoard).border_title = border_title
 
+    def on_mount(self):
+        self.watch_loading_tasks()
+
+    def watch_loading_tasks(self):
+        kanban_board = self.query_one_optional(KanbanBoard)
+        if kanban_board is not None:
+            kanban_board.loading = self.loading_tasks
+
     async def ensure_active_board(self):
         if not self.active_board:
             await self.query_one(KanbanBoard).action_show_boards()
@@ -49,6 +59,19 @@ class BoardScreen(Screen):
         if not self.app.backend.settings.base_url:
             await self.app.push_screen_wait(ModalBaseUrlScreen())
 
+    async def show_loaded_tasks(self):
+        """Adds tasks loaded after the board was populated to the columns
+
+        Boards which are not shown are refreshed once they are resumed.
+        """
+        kanban_board = self.query_one_optional(KanbanBoard)
+        if kanban_board is None or not kanban_board.is_mounted:
+            return
+        if not self.is_current:
+            self.app.needs_refresh = True
+            return
+        await kanban_board.refresh_columns()
+
     @work(group="board-refresh", exclusive=True)
     @on(ScreenResume)
     async def load_kanban_board(self, event: ScreenResume | None = None):
@@ -75,6 +98,7 @@ class BoardScreen(Screen):
         await self.ensure_active_board()
 
         if self.app.needs_refresh:
-            self.app.update_task_list()
-            await self.query_one(KanbanBoard).refresh_columns()
+            # a newer load supersedes this one and shows its tasks instead
+            with suppress(WorkerCancelled):
+                await self.app.load_task_list().wait()
             self.app.needs_refresh = False
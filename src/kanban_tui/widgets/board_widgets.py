@@ -1,4 +1,5 @@
 from __future__ import annotations
+import asyncio
 from typing import TYPE_CHECKING, Literal
 from collections import defaultdict
 
@@ -42,11 +43,21 @@ class KanbanBoard(HorizontalScroll):
     drag_target_card: TaskCard | None = None
     drag_target_before: bool | None = None
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        # tasks loaded in the background refresh the board while modals
+        # repopulate it, only one of them may rebuild the columns at a time
+        self._columns_lock = asyncio.Lock()
+
     async def on_mount(self):
         await self.populate_board()
 
     async def populate_board(self, *args):
         """Populate the board with columns"""
+        async with self._columns_lock:
+            await self._populate_board()
+
+    async def _populate_board(self):
         await self.remove_children()
 
         for column in self.app.column_list:
@@ -66,6 +77,10 @@ class KanbanBoard(HorizontalScroll):
         self.get_first_card()
 
     async def refresh_columns(self) -> None:
+        async with self._columns_lock:
+            await self._refresh_columns()
+
+    async def _refresh_columns(self) -> None:
         visible_columns = [column for column in self.app.column_list if column.visible]
         mounted_columns = list(self.query(Column))
         focused_task_id = self.selected_task.task_id if self.selected_task else None
@@ -76,13 +91,13 @@ class KanbanBoard(HorizontalScroll):
         visible_column_ids = [column.column_id for column in visible_columns]
 
         if mounted_column_ids != visible_column_ids:
-            await self.populate_board()
+            await self._populate_board()
             return
 
         if not all(
             self._column_ready_for_refresh(column) for column in mounted_columns
         ):
-            await self.populate_board()
+            await self._populate_board()
             return
 
         tasks_by_column: dict[int, list[Task]] = defaultdict(list)
@@ -134,6 +149,10 @@ class KanbanBoard(HorizontalScroll):
         column.set_title(title)
         column.sync_width()
 
+        if column.virtual:
+            await column.sync_tasks(desired_tasks)
+            return
+
         if self._column_has_same_task_ids(column, desired_tasks):
             self._refresh_existing_cards_in_place(column, desired_tasks)
             return
@@ -154,8 +173,7 @@ class KanbanBoard(HorizontalScroll):
             card.row = row_position
             task.position = row_position
             if self.app.needs_refresh or card.task_ != task:
-                card.task_ = task
-                card.refresh(recompose=True)
+                card.update_task(task, refresh_all=self.app.needs_refresh)
             else:
                 card.task_.position = row_position
 
@@ -193,13 +211,14 @@ class KanbanBoard(HorizontalScroll):
         self.query_one(f"#taskcard_{self.selected_task.task_id}", TaskCard).focus()
 
     # Movement
-    def action_navigation(self, direction: Literal["up", "right", "down", "left"]):
+    async def action_navigation(
+        self, direction: Literal["up", "right", "down", "left"]
+    ):
         if not self.app.task_list:
             return
 
-        current_column_tasks = self.query_one(
-            f"#column_{self.selected_task.column}", Column
-        ).task_amount
+        current_column = self.query_one(f"#column_{self.selected_task.column}", Column)
+        current_column_tasks = current_column.task_amount
         row_idx = self.query_one(
             f"#taskcard_{self.selected_task.task_id}", TaskCard
         ).row
@@ -207,19 +226,15 @@ class KanbanBoard(HorizontalScroll):
             case "up":
                 match row_idx:
                     case 0:
-                        self.query_one(
-                            f"#column_{self.selected_task.column}", Column
-                        ).query(TaskCard)[current_column_tasks - 1].focus()
+                        await current_column.focus_row(current_column_tasks - 1)
                     case _:
-                        self.app.action_focus_previous()
+                        await current_column.focus_row(row_idx - 1)
             case "down":
                 match row_idx:
                     case row_idx if row_idx == (current_column_tasks - 1):
-                        self.query_one(
-                            f"#column_{self.selected_task.column}", Column
-                        ).query(TaskCard)[0].focus()
+                        await current_column.focus_row(0)
                     case _:
-                        self.app.action_focus_next()
+                        await current_column.focus_row(row_idx + 1)
             case "right":
                 column_id_list = list(self.app.visible_column_dict.keys())
                 column_index = column_id_list.index(self.selected_task.column)
@@ -227,20 +242,15 @@ class KanbanBoard(HorizontalScroll):
                     self.app.visible_column_dict
                 )
                 new_column_id = column_id_list[new_column_index]
-                new_column_tasks = self.query_one(
-                    f"#column_{new_column_id}", Column
-                ).task_amount
+                new_column = self.query_one(f"#column_{new_column_id}", Column)
+                new_column_tasks = new_column.task_amount
                 match new_column_tasks:
                     case 0:
                         self.app.action_focus_next()
                     case new_column_tasks if new_column_tasks <= row_idx:
-                        self.query_one(f"#column_{new_column_id}", Column).query(
-                            TaskCard
-                        )[new_column_tasks - 1].focus()
+                        await new_column.focus_row(new_column_tasks - 1)
                     case _:
-                        self.query_one(f"#column_{new_column_id}", Column).query(
-                            TaskCard
-                        )[row_idx].focus()
+                        await new_column.focus_row(row_idx)
             case "left":
                 column_id_list = list(self.app.visible_column_dict.keys())
                 column_index = column_id_list.index(self.selected_task.column)
@@ -248,20 +258,15 @@ class KanbanBoard(HorizontalScroll):
                     column_index + len(self.app.visible_column_dict) - 1
                 ) % len(self.app.visible_column_dict)
                 new_column_id = column_id_list[new_column_index]
-                new_column_tasks = self.query_one(
-                    f"#column_{new_column_id}", Column
-                ).task_amount
+                new_column = self.query_one(f"#column_{new_column_id}", Column)
+                new_column_tasks = new_column.task_amount
                 match new_column_tasks:
                     case 0:
                         self.app.action_focus_previous()
                     case new_column_tasks if new_column_tasks <= row_idx:
-                        self.query_one(f"#column_{new_column_id}", Column).query(
-                            TaskCard
-                        )[new_column_tasks - 1].focus()
+                        await new_column.focus_row(new_column_tasks - 1)
                     case _:
-                        self.query_one(f"#column_{new_column_id}", Column).query(
-                            TaskCard
-                        )[row_idx].focus()
+                        await new_column.focus_row(row_idx)
 
     @on(TaskCard.Focused)
     def get_current_card_position(self, event: TaskCard.Focused):
@@ -351,6 +356,7 @@ class KanbanBoard(HorizontalScroll):
             self._clear_drag_target()
             return
 
+        # virtual columns only mount the cards near the viewport
         cards = list(column.query(TaskCard))
         other_cards = [card for card in cards if card is not moving_card]
         if not other_cards:
@@ -366,13 +372,11 @@ class KanbanBoard(HorizontalScroll):
             return
 
         y = event.screen_offset.y
-        insert_index = len(other_cards)
         target_card = None
         before = False
-        for idx, card in enumerate(other_cards):
+        for card in other_cards:
             midpoint = card.region.y + (card.region.height / 2)
             if y < midpoint:
-                insert_index = idx
                 target_card = card
                 before = True
                 break
@@ -381,6 +385,11 @@ class KanbanBoard(HorizontalScroll):
             target_card = other_cards[-1]
             before = False
 
+        # position among the other tasks of the column
+        insert_index = target_card.row if before else target_card.row + 1
+        if not is_cross_column and moving_card.row < insert_index:
+            insert_index -= 1
+
         self._set_drag_target(
             target_card=target_card,
             before=before,
@@ -388,7 +397,7 @@ class KanbanBoard(HorizontalScroll):
             column_id=column_id,
         )
 
-    def _move_task_within_column(self, target_position: int) -> None:
+    async def _move_task_within_column(self, target_position: int) -> None:
         if self.app.config.backend.mode != Backends.SQLITE:
             return
 
@@ -399,8 +408,7 @@ class KanbanBoard(HorizontalScroll):
         moving_card = self.query_one(
             f"#taskcard_{self.selected_task.task_id}", TaskCard
         )
-        task_cards = list(column.query(TaskCard))
-        if len(task_cards) <= 1:
+        if column.task_amount <= 1:
             return
 
         current_position = moving_card.row
@@ -413,24 +421,9 @@ class KanbanBoard(HorizontalScroll):
         if moved_task is None:
             return
         self.selected_task = moved_task
-        self.app.update_task_list()
-
-        other_cards = [card for card in task_cards if card is not moving_card]
-        scroll = column.query_one(VerticalScroll)
-        if not other_cards:
-            return
-
-        if target_position <= 0:
-            scroll.move_child(moving_card, before=other_cards[0])
-        elif target_position >= len(other_cards):
-            scroll.move_child(moving_card, after=other_cards[-1])
-        else:
-            scroll.move_child(moving_card, before=other_cards[target_position])
-
-        for idx, card in enumerate(column.query(TaskCard)):
-            card.row = idx
-            card.task_.position = idx
+        await self.app.update_task_list_async()
 
+        await column.move_card(moving_card, target_position)
         moving_card.focus()
 
     def watch_target_column(self, old_column: int, new_column: int):
@@ -527,19 +520,20 @@ class KanbanBoard(HorizontalScroll):
             target_position=updated_position,
         )
 
-        self.app.update_task_list()
+        await self.app.update_task_list_async()
 
-        # Refresh all task cards to update dependency status immediately
         moved_task_id = self.selected_task.task_id
+        moved_card = self.query_one(f"#taskcard_{moved_task_id}", TaskCard)
+        # Update the task data from the backend to get latest dependency status
+        if updated_task := self.app.backend.get_task_by_id(moved_task_id):
+            moved_card.update_task(updated_task)
+        # Moving can finish or reopen the task, which unblocks its dependents
         for task_card in self.query(TaskCard):
-            # Update the task data from the backend to get latest dependency status
-            updated_task = self.app.backend.get_task_by_id(task_card.task_.task_id)
-            if updated_task:
-                task_card.task_ = updated_task
-                task_card.refresh(recompose=True)
+            if moved_task_id in task_card.task_.blocked_by:
+                task_card.refresh_metadata()
 
         # Restore focus to the moved task
-        self.query_one(f"#taskcard_{moved_task_id}", TaskCard).focus()
+        moved_card.focus()
 
         self.target_column = None
         self.app.app_focus = True
@@ -556,7 +550,7 @@ class KanbanBoard(HorizontalScroll):
             f"#column_{event.taskcard.task_.column}", Column
         ).remove_task(task=event.taskcard.task_)
         self.app.backend.delete_task(task_id=event.taskcard.task_.task_id)
-        self.app.update_task_list()
+        await self.app.update_task_list_async()
 
         if not self.app.task_list:
             self.get_first_card()
@@ -579,7 +573,7 @@ class KanbanBoard(HorizontalScroll):
         if self.target_column is not None:
             await self.action_confirm_move()
         elif self.drag_target_position is not None:
-            self._move_task_within_column(self.drag_target_position)
+            await self._move_task_within_column(self.drag_target_position)
 
         self._clear_drag_target()
         self.mouse_down = False
@@ -24,18 +24,24 @@ class BoardList(ListView):
         Binding(key="k", action="cursor_up", show=False),
     ]
 
-    def on_mount(self):
+    async def on_mount(self):
         self.focus()
+        await self.populate_widget(self.get_initial_index())
 
     def __init__(self) -> None:
-        board_listitems = self.get_board_list_items()
-        initial_index = self.get_initial_index()
-        super().__init__(*board_listitems, initial_index=initial_index, id="board_list")
+        super().__init__(id="board_list")
 
     async def populate_widget(self, index: int | None = None):
+        """Shows the boards with their stats, the list is in a loading state
+        while the backend queries the stats
+        """
+        self.loading = True
+        try:
+            board_infos = await self.app.backend.get_board_infos_async()
+        finally:
+            self.loading = False
         await self.clear()
-        board_listitems = self.get_board_list_items()
-        await self.extend(board_listitems)
+        await self.extend(self.get_board_list_items(board_infos))
         self.index = index
         self.refresh_bindings()
 
@@ -45,11 +51,8 @@ class BoardList(ListView):
                 return board_index
         return None
 
-    def get_board_list_items(self) -> list[BoardListItem]:
-        info_dict = {
-            board_info["board_id"]: board_info
-            for board_info in self.app.backend.get_board_infos()
-        }
+    def get_board_list_items(self, board_infos: list[dict]) -> list[BoardListItem]:
+        info_dict = {board_info["board_id"]: board_info for board_info in board_infos}
         return [
             BoardListItem(board=board, info_dict=info_dict[board.board_id])
             for board in self.app.board_list
@@ -373,11 +373,11 @@ class TaskDependencyManager(Vertical):
         self.app.backend.delete_task_dependency(
             task_id=self.current_task_id, depends_on_task_id=dep_id
         )
+        # Update task list first, table and selector are built from it
+        self.app.update_task_list()
         self.refresh_dependencies_table()
         # Refresh the selector options
         self.query_one(DependencySelector).refresh_options()
-        # Update task list to reflect dependency changes
-        self.app.update_task_list()
         # Refresh all task cards on the board to show updated dependency status
         self._refresh_board_task_cards()
 
@@ -429,13 +429,14 @@ class DependencySelector(VimSelect):
                 severity="information",
                 timeout=3,
             )
+            # Update task list first, table and options are built from it
+            self.app.update_task_list()
             # Refresh table in parent widget
             self.parent.parent.refresh_dependencies_table()
             # Reset selector and refresh options
             self.value = self.NULL
             self.refresh_options()
-            # Update task list and refresh all task cards
-            self.app.update_task_list()
+            # Refresh all task cards
             self.parent.parent._refresh_board_task_cards()
         except Exception as e:
             self.app.notify(
@@ -451,27 +452,30 @@ class DependencySelector(VimSelect):
         self.set_options(options)
 
     def get_available_tasks(self) -> list[tuple[str, int]]:
-        """Get list of tasks that can be added as dependencies."""
+        """Get list of tasks that can be added as dependencies.
+
+        Built from the tasks and columns already loaded by the app.
+        """
         if not self.current_task_id:
             return []
 
-        all_tasks = self.app.backend.get_tasks_on_active_board()
-        current_task = self.app.backend.get_task_by_id(self.current_task_id)
+        column_name_dict = self.app.column_name_dict
+        current_task = self.app.task_dict.get(self.current_task_id)
+        existing_dependencies = set(current_task.blocked_by) if current_task else set()
 
         # Filter out invalid tasks
         available_tasks = []
-        for task in all_tasks:
+        for task in self.app.task_list:
             # Skip current task
             if task.task_id == self.current_task_id:
                 continue
 
             # Skip if already a dependency
-            if current_task and task.task_id in current_task.blocked_by:
+            if task.task_id in existing_dependencies:
                 continue
 
             # Get column name for display
-            column = self.app.backend.get_column_by_id(task.column)
-            column_name = column.name if column else "Unknown"
+            column_name = column_name_dict.get(task.column, "Unknown")
 
             # Format: "#ID - Title [Column]"
             display_text = f"#{task.task_id} - {task.title[:40]} [{column_name}]"
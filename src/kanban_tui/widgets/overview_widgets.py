@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from kanban_tui.app import KanbanTui
 
 from rich.text import Text
-from textual import on
+from textual import on, work
 from textual.binding import Binding
 from textual.widget import Widget
 from textual.widgets import (
@@ -25,9 +25,14 @@ from textual.widgets._select import SelectOverlay
 from textual_plotext import PlotextPlot
 
 from kanban_tui.utils import getrgb, get_time_range
-from kanban_tui.classes.logevent import LogEvent
+from kanban_tui.classes.logevent import AuditSummary, LogEvent
 from kanban_tui.widgets.modal_task_widgets import VimSelect
 
+# audit events loaded at once, older pages are loaded while scrolling
+EVENT_PAGE_SIZE = 200
+# rows left below the cursor before the next page is loaded
+EVENT_PAGE_MARGIN = 20
+
 
 class TaskPlot(HorizontalScroll):
     app: "KanbanTui"
@@ -97,29 +102,35 @@ class TaskPlot(HorizontalScroll):
                 )
                 category_value_dict[category].update(task_counter)
 
+            plotted_categories = {
+                category_id: category_values
+                for category_id, category_values in category_value_dict.items()
+                if sum(category_values.values()) > 0
+            }
+            categories = {
+                category_id: self.app.backend.get_category_by_id(category_id)
+                for category_id in plotted_categories
+                if category_id
+            }
+
             # plot
             plt.stacked_bar(
                 list(plot_values.keys()),
                 [
                     category_values.values()
-                    for _category, category_values in category_value_dict.items()
-                    if sum(category_values.values()) > 0
+                    for category_values in plotted_categories.values()
                 ],
                 labels=[
-                    self.app.backend.get_category_by_id(category_id).name
-                    if category_id
-                    else "No Category"
-                    for category_id, category_values in category_value_dict.items()
-                    if sum(category_values.values()) > 0
+                    categories[category_id].name if category_id else "No Category"
+                    for category_id in plotted_categories
                 ],
                 color=[
                     getrgb(
-                        self.app.backend.get_category_by_id(category).color
-                        if category
+                        categories[category_id].color
+                        if category_id
                         else self.app.config.task.default_color
                     )
-                    for category, category_values in category_value_dict.items()
-                    if sum(category_values.values()) > 0
+                    for category_id in plotted_categories
                 ],
                 width=0.5,
                 yside="2",
@@ -335,14 +346,23 @@ class LogDateFilter(Vertical):
 
 class LogTable(Vertical):
     app: "KanbanTui"
-    events: reactive[list[LogEvent]] = reactive([])
+    event_count: reactive[int | None] = reactive(None)
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.events: list[LogEvent] = []
+        self.summaries: list[AuditSummary] = []
+        self.event_filter: dict = {}
+        self.all_events_loaded = False
+        self.all_summaries_loaded = False
 
     def compose(self):
         yield DataTable(cursor_type="row", zebra_stripes=True, id="datatable_logs")
 
     def on_mount(self):
         self.border_title = "Audit Log"
-        self.query_one(DataTable).add_columns(
+        table = self.query_one(DataTable)
+        table.add_columns(
             "event_time",
             "event_type",
             "object_type",
@@ -351,23 +371,94 @@ class LogTable(Vertical):
             "old",
             "new",
         )
+        self.watch(table, "scroll_y", self.load_events_near_end, init=False)
 
     def load_events(self, events: list[str], objects: list[str], time: str):
-        filter_dict = {"events": events, "objects": objects, "time": time}
-        self.events = self.app.backend.get_filtered_events(
-            filter=filter_dict,
-        )
-
-    def watch_events(self):
+        """Shows the newest page of matching events, older pages follow on scroll"""
+        self.event_filter = {"events": events, "objects": objects, "time": time}
+        self.events = []
+        self.summaries = []
+        self.all_events_loaded = False
+        self.all_summaries_loaded = False
+        self.event_count = None
         self.query_one(DataTable).clear()
+        self.load_next_page()
+        self.load_event_count()
+
+    def load_next_page(self):
+        if self.all_events_loaded:
+            self.load_next_summary_page()
+            return
+
+        page = self.app.backend.get_filtered_events(
+            filter=self.event_filter,
+            before_event_id=self.events[-1].event_id if self.events else None,
+            limit=EVENT_PAGE_SIZE,
+        )
+        self.all_events_loaded = len(page) < EVENT_PAGE_SIZE
+        self.events.extend(page)
 
-        for event in self.events:
+        table = self.query_one(DataTable)
+        for event in page:
             event_dict = event.__dict__
-            self.query_one(DataTable).add_row(
+            table.add_row(
                 *list(event_dict.values())[1:], label=list(event_dict.values())[0]
             )
+        if self.all_events_loaded:
+            self.load_next_summary_page()
 
-        self.query_one(DataTable).move_cursor(row=len(self.events))
+    def load_next_summary_page(self):
+        """Compacted events follow the raw events as one row per day and kind"""
+        if self.all_summaries_loaded:
+            return
+
+        page = self.app.backend.get_filtered_event_summaries(
+            filter=self.event_filter,
+            before_event_id=self.summaries[-1].last_event_id
+            if self.summaries
+            else None,
+            limit=EVENT_PAGE_SIZE,
+        )
+        self.all_summaries_loaded = len(page) < EVENT_PAGE_SIZE
+        self.summaries.extend(page)
+
+        table = self.query_one(DataTable)
+        for summary in page:
+            table.add_row(
+                summary.summary_date.date(),
+                summary.event_type,
+                summary.object_type,
+                f"{summary.amount} events",
+                summary.object_field,
+                "",
+                "",
+                label="Σ",
+            )
+
+    def load_events_near_end(self):
+        table = self.query_one(DataTable)
+        if (
+            table.scroll_y
+            >= table.max_scroll_y - table.scrollable_content_region.height
+        ):
+            self.load_next_page()
+
+    @on(DataTable.RowHighlighted)
+    def load_events_near_cursor(self, event: DataTable.RowHighlighted):
+        if event.cursor_row >= event.data_table.row_count - EVENT_PAGE_MARGIN:
+            self.load_next_page()
+
+    @work(exclusive=True, group="log-event-count")
+    async def load_event_count(self):
+        self.event_count = await self.app.backend.run_io(
+            self.app.backend.get_filtered_event_count, filter=self.event_filter
+        )
+
+    def watch_event_count(self):
+        if self.event_count is None:
+            self.border_title = "Audit Log"
+        else:
+            self.border_title = f"Audit Log ({self.event_count} events)"
 
 
 class OverView(Horizontal):
@@ -1,4 +1,8 @@
 from __future__ import annotations
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import cache
 from typing import TYPE_CHECKING, Literal
 
 from kanban_tui.config import MovementModes, Backends
@@ -6,13 +10,15 @@ from kanban_tui.config import MovementModes, Backends
 if TYPE_CHECKING:
     from kanban_tui.app import KanbanTui
 
+from markdown_it import MarkdownIt
+from markdown_it.token import Token
 from rich.text import Text
 from textual import on, work
 from textual.reactive import reactive
 from textual.binding import Binding
 from textual.events import Click
 from textual.app import ComposeResult
-from textual.containers import Vertical, VerticalScroll
+from textual.containers import Vertical
 from textual.widgets import Label, Markdown
 from textual.message import Message
 
@@ -22,6 +28,48 @@ from kanban_tui.utils import get_column_status_dict
 from kanban_tui.modal.modal_task_screen import ModalTaskEditScreen
 from kanban_tui.modal.modal_confirm_screen import ModalConfirmScreen
 
+# parsed descriptions kept by the markdown parser of the task cards
+MAX_CACHED_DESCRIPTIONS = 1024
+# task fields shown in the compact metadata line
+METADATA_FIELDS = ("creation_date", "due_date", "blocked_by", "blocking")
+
+
+class CachedMarkdownParser(MarkdownIt):
+    """gfm-like parser reusing the tokens of descriptions parsed before
+
+    Tokens are keyed by the hash of the description, the Markdown widget
+    only reads them, so cards with the same description share them.
+    """
+
+    def __init__(self, max_size: int = MAX_CACHED_DESCRIPTIONS) -> None:
+        super().__init__("gfm-like")
+        self.max_size = max_size
+        self._tokens: OrderedDict[bytes, list[Token]] = OrderedDict()
+        # Markdown widgets parse in executor threads
+        self._lock = threading.Lock()
+
+    def parse(self, src: str, env=None) -> list[Token]:
+        if env is not None:
+            return super().parse(src, env)
+
+        key = hashlib.blake2b(src.encode(), digest_size=16).digest()
+        with self._lock:
+            if (tokens := self._tokens.get(key)) is not None:
+                self._tokens.move_to_end(key)
+                return tokens
+
+        tokens = super().parse(src)
+        with self._lock:
+            self._tokens[key] = tokens
+            if len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+        return tokens
+
+
+@cache
+def get_markdown_parser() -> CachedMarkdownParser:
+    return CachedMarkdownParser()
+
 
 class TaskCard(Vertical):
     app: "KanbanTui"
@@ -114,21 +162,62 @@ class TaskCard(Vertical):
         self.can_focus_children = False
         super().__init__(id=f"taskcard_{task.task_id}")
         self.task_ = task
+        # only created once the description is shown
+        self.description: Markdown | None = None
 
     def compose(self) -> ComposeResult:
-        yield Label(self.task_.title, classes="label-title")
+        self.title_label = Label(self.task_.title, classes="label-title")
+        yield self.title_label
         self.metadata_label = Label(
             self.get_compact_metadata_str(), classes="label-metadata"
         )
         yield self.metadata_label
-        self.description = Markdown(
-            markdown=self.task_.description,
-        )
-        yield self.description
+        self.description = None
+        if self.app.config.task.always_expanded or self.expanded:
+            self.description = self.get_description_widget()
+            yield self.description
 
         # Handle Coloring
         self.color_task()
 
+    def update_task(self, task: Task, refresh_all: bool = False) -> None:
+        """Shows `task` by only updating the parts of the card that changed
+
+        Args:
+            task: New state of the task shown by the card
+            refresh_all: Re-applies colors, metadata and the expanded state
+                even if the task did not change, e.g. after config changes
+        """
+        old_task, self.task_ = self.task_, task
+        # compose picks up the new task
+        if not self.is_mounted:
+            return
+
+        changed_fields = {
+            field
+            for field in Task.model_fields
+            if old_task is None or getattr(old_task, field) != getattr(task, field)
+        }
+        if refresh_all or "title" in changed_fields:
+            self.title_label.update(task.title)
+        if refresh_all or changed_fields.intersection(METADATA_FIELDS):
+            self.refresh_metadata()
+        if refresh_all or "category" in changed_fields:
+            self.color_task()
+        if self.description is not None and "description" in changed_fields:
+            self.description.update(task.description)
+        if refresh_all:
+            self.watch_expanded()
+
+    def refresh_metadata(self) -> None:
+        self.metadata_label.update(self.get_compact_metadata_str())
+
+    def get_description_widget(self) -> Markdown:
+        return Markdown(
+            markdown=self.task_.description,
+            parser_factory=get_markdown_parser,
+        )
+
     def color_task(self):
         if category_id := self.task_.category:
             self.styles.background = self.app.backend.get_category_by_id(
@@ -136,13 +225,18 @@ class TaskCard(Vertical):
             ).color
         else:
             self.styles.background = self.app.config.task.default_color
-        self.description.styles.background = self.styles.background.darken(0.2)  # type: ignore
-        self.description.display = self.app.config.task.always_expanded
+        if self.description is not None:
+            self.color_description(self.description)
         self.metadata_label.display = self.app.config.task.metadata_always_expanded
 
+    def color_description(self, description: Markdown):
+        description.styles.background = self.styles.background.darken(0.2)  # type: ignore
+        description.display = self.app.config.task.always_expanded or self.expanded
+
     def on_focus(self) -> None:
         self.expanded = True
-        self.scroll_visible(animate=False)
+        # wait for the layout, expanding mounts the description on first focus
+        self.call_after_refresh(self.scroll_visible, animate=False)
         self.post_message(self.Focused(taskcard=self))
 
     def on_blur(self) -> None:
@@ -151,7 +245,13 @@ class TaskCard(Vertical):
     def watch_expanded(self):
         # Toggle focus-expanded content in one place.
         is_visible = self.app.config.task.always_expanded or self.expanded
-        self.description.display = is_visible
+        if is_visible and self.description is None:
+            # Parse and mount the description on first expansion
+            self.description = self.get_description_widget()
+            self.color_description(self.description)
+            self.mount(self.description)
+        elif self.description is not None:
+            self.description.display = is_visible
         self.metadata_label.display = (
             self.app.config.task.metadata_always_expanded or self.expanded
         )
@@ -183,18 +283,17 @@ class TaskCard(Vertical):
                     return self.app.config.task.movement_mode == MovementModes.JUMP
         return True
 
-    def action_move_task_position(self, direction: Literal["up", "down"]):
+    async def action_move_task_position(self, direction: Literal["up", "down"]):
         if self.app.config.backend.mode != Backends.SQLITE:
             return
 
         from kanban_tui.widgets.task_column import Column
 
         column = self.screen.query_one(f"#column_{self.task_.column}", Column)
-        task_cards = list(column.query(TaskCard))
         current_index = self.row
         target_index = current_index - 1 if direction == "up" else current_index + 1
 
-        if target_index < 0 or target_index >= len(task_cards):
+        if target_index < 0 or target_index >= column.task_amount:
             return
 
         moved_task = self.app.backend.move_task_position(
@@ -203,19 +302,9 @@ class TaskCard(Vertical):
         if moved_task is None:
             return
         self.task_ = moved_task
-        self.app.update_task_list()
-
-        target_card = task_cards[target_index]
-        scroll = column.query_one(VerticalScroll)
-        if direction == "up":
-            scroll.move_child(self, before=target_card)
-        else:
-            scroll.move_child(self, after=target_card)
-
-        for idx, card in enumerate(column.query(TaskCard)):
-            card.row = idx
-            card.task_.position = idx
+        await self.app.update_task_list_async()
 
+        await column.move_card(self, target_index)
         self.focus()
 
     def action_move_task(self, direction: Literal["left", "right"]):
@@ -293,8 +382,7 @@ class TaskCard(Vertical):
 
     def from_modal_update_task(self, updated_task: Task | None) -> None:
         if updated_task:
-            self.task_ = updated_task
-            self.refresh(recompose=True)
+            self.update_task(updated_task)
 
     @work()
     async def action_show_blocking_tasks(self) -> None:
@@ -1,3 +1,5 @@
+import asyncio
+import statistics
 from typing import Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -12,8 +14,26 @@ from textual.containers import VerticalScroll, Vertical
 from kanban_tui.widgets.task_card import TaskCard
 from kanban_tui.classes.task import Task
 
+# rows mounted above and below the viewport of virtual columns
+VIRTUAL_ROW_BUFFER = 10
+# height of a collapsed card incl. margin, until cards are laid out
+DEFAULT_ROW_HEIGHT = 5
+
+
+class VirtualSpacer(Widget):
+    """Takes up the space of the cards not mounted in a virtual column"""
+
 
 class Column(Vertical):
+    """Column of task cards
+
+    Columns with more than `board.virtual_column_threshold` tasks are
+    virtual, they only mount the cards of the rows `window_start` to
+    `window_end` around the viewport between two spacers and shift this
+    window while scrolling. `task_list`, `task_amount` and `TaskCard.row`
+    always refer to all tasks of the column.
+    """
+
     app: "KanbanTui"
     task_amount: reactive[int] = reactive(0)
     task_list: list[Task]
@@ -23,6 +43,14 @@ class Column(Vertical):
     ) -> None:
         self.title = title
         self.task_list = task_list or []
+        self.virtual = False
+        self.window_start = 0
+        self.window_end = 0
+        self.row_height = DEFAULT_ROW_HEIGHT
+        self._window_lock = asyncio.Lock()
+        self._follow_viewport_scheduled = False
+        # row the viewport jumps to, until the new window is laid out
+        self._pending_row: int | None = None
         super().__init__(id=f"column_{id_num}")
         self.can_focus: bool = False
         self.styles.width = f"{1 / self.app.config.board.columns_in_view * 100:.2f}%"
@@ -32,6 +60,9 @@ class Column(Vertical):
         yield VerticalScroll(id=f"vscroll_{self.id}", can_focus=False)
 
     async def on_mount(self) -> None:
+        self.watch(
+            self.query_one(VerticalScroll), "scroll_y", self._on_scroll, init=False
+        )
         await self.replace_tasks(self.task_list)
         self.border_title = "move task here"
 
@@ -60,6 +91,10 @@ class Column(Vertical):
                     Text.from_markup(f"{self.title} ({self.task_amount} Tasks)")
                 )
 
+    def should_virtualize(self, task_list: list[Task]) -> bool:
+        threshold = self.app.config.board.virtual_column_threshold
+        return 0 < threshold < len(task_list)
+
     async def place_task(self, task: Task, target_position: int | None = None) -> None:
         scroll = self.query_one(VerticalScroll)
         row = (
@@ -69,6 +104,14 @@ class Column(Vertical):
         )
 
         task.position = row
+        self.task_list = [*self.task_list[:row], task, *self.task_list[row:]]
+        if self.virtual:
+            async with self._window_lock:
+                self.task_amount += 1
+                self._update_rows()
+                await self._mount_window_around(row)
+            return
+
         card = TaskCard(task=task, row=row)
         if row == self.task_amount:
             await scroll.mount(card)
@@ -83,7 +126,23 @@ class Column(Vertical):
 
     async def replace_tasks(self, task_list: list[Task]) -> None:
         scroll = self.query_one(VerticalScroll)
+        if self.should_virtualize(task_list):
+            async with self._window_lock:
+                await scroll.remove_children()
+                self.virtual = True
+                self.task_list = task_list
+                self.task_amount = len(task_list)
+                self._update_rows()
+                self.window_start = self.window_end = 0
+                await scroll.mount(
+                    VirtualSpacer(classes="spacer-top"),
+                    VirtualSpacer(classes="spacer-bottom"),
+                )
+                await self._mount_window(*self._get_window(around_row=0))
+            return
+
         await scroll.remove_children()
+        self.virtual = False
 
         cards: list[TaskCard] = []
         for row_position, task in enumerate(task_list):
@@ -97,6 +156,22 @@ class Column(Vertical):
         self.task_amount = len(task_list)
 
     async def sync_tasks(self, task_list: list[Task]) -> None:
+        if self.virtual != self.should_virtualize(task_list):
+            await self.replace_tasks(task_list)
+            return
+
+        if self.virtual:
+            async with self._window_lock:
+                self.task_list = task_list
+                self.task_amount = len(task_list)
+                self._update_rows()
+                await self._mount_window(
+                    self.window_start,
+                    self.window_end,
+                    refresh_cards=self.app.needs_refresh,
+                )
+            return
+
         existing_cards = self.get_rendered_cards()
         existing_ids = [task_card.task_.task_id for task_card in existing_cards]
         desired_ids = [task.task_id for task in task_list]
@@ -173,10 +248,8 @@ class Column(Vertical):
         for row_position, (task_card, task) in enumerate(zip(task_cards, task_list)):
             task.position = row_position
             if self.app.needs_refresh or task_card.task_ != task:
-                task_card.task_ = task
-                task_card.refresh(recompose=True)
+                task_card.update_task(task, refresh_all=self.app.needs_refresh)
             task_card.row = row_position
-            task_card.task_.position = row_position
 
         self.task_list = task_list
         self.task_amount = len(task_list)
@@ -189,6 +262,18 @@ class Column(Vertical):
         return subset_index == len(subset_ids)
 
     async def remove_task(self, task: Task) -> None:
+        self.task_list = [
+            column_task
+            for column_task in self.task_list
+            if column_task.task_id != task.task_id
+        ]
+        if self.virtual:
+            async with self._window_lock:
+                self.task_amount -= 1
+                self._update_rows()
+                await self._mount_window(self.window_start, self.window_end)
+            return
+
         await self.query_one(f"#taskcard_{task.task_id}", TaskCard).remove()
         self.task_amount -= 1
 
@@ -196,3 +281,238 @@ class Column(Vertical):
         for row_position, task_card in enumerate(self.query(TaskCard)):
             task_card.row = row_position
             task_card.task_.position = row_position
+
+    async def move_card(self, task_card: TaskCard, target_position: int) -> None:
+        """Moves a card of this column to `target_position` and renumbers the rows
+
+        Args:
+            task_card: Moved card
+            target_position: Position of the task among the other tasks
+        """
+        moved_task = task_card.task_
+        if moved_task is None:
+            return
+
+        other_tasks = [
+            task for task in self.task_list if task.task_id != moved_task.task_id
+        ]
+        target_position = max(0, min(target_position, len(other_tasks)))
+        self.task_list = [
+            *other_tasks[:target_position],
+            moved_task,
+            *other_tasks[target_position:],
+        ]
+
+        if self.virtual:
+            async with self._window_lock:
+                self._update_rows()
+                if self.window_start <= target_position < self.window_end:
+                    await self._mount_window(self.window_start, self.window_end)
+                else:
+                    await self._mount_window_around(target_position)
+            return
+
+        other_cards = [
+            card for card in self.get_rendered_cards() if card is not task_card
+        ]
+        if other_cards:
+            scroll = self.query_one(VerticalScroll)
+            if target_position >= len(other_cards):
+                scroll.move_child(task_card, after=other_cards[-1])
+            else:
+                scroll.move_child(task_card, before=other_cards[target_position])
+        self._update_rows()
+
+    async def focus_row(self, row: int) -> None:
+        """Focuses the card of the task at `row`, virtual columns mount it first"""
+        if not self.virtual:
+            self.get_rendered_cards()[row].focus()
+            return
+
+        task_id = self.task_list[row].task_id
+        task_card = self.query_one_optional(f"#taskcard_{task_id}", TaskCard)
+        if task_card is None:
+            async with self._window_lock:
+                await self._mount_window_around(row)
+            task_card = self.query_one(f"#taskcard_{task_id}", TaskCard)
+            # the layout of the new window is not refreshed yet, centering the
+            # card now would scroll to its stale offset and shift the window
+            task_card.focus(scroll_visible=False)
+            return
+        task_card.focus()
+
+    def _update_rows(self) -> None:
+        rows = {}
+        for row_position, task in enumerate(self.task_list):
+            task.position = row_position
+            rows[task.task_id] = row_position
+        for task_card in self.get_rendered_cards():
+            card_task = task_card.task_
+            if card_task is None:
+                continue
+            # cards of removed tasks are left for _mount_window
+            if (row := rows.get(card_task.task_id)) is not None:
+                task_card.row = row
+                card_task.position = row
+
+    def _get_visible_rows(self) -> int:
+        scroll = self.query_one(VerticalScroll)
+        height = scroll.size.height or self.app.size.height
+        return height // self.row_height + 1
+
+    def _get_window(
+        self, first_row: int | None = None, around_row: int | None = None
+    ) -> tuple[int, int]:
+        """Rows to mount if the viewport starts at `first_row` or is centered on `around_row`"""
+        visible_rows = self._get_visible_rows()
+        if first_row is None:
+            first_row = (around_row or 0) - visible_rows // 2
+        first_row = max(0, min(first_row, len(self.task_list) - visible_rows))
+        return (
+            max(0, first_row - VIRTUAL_ROW_BUFFER),
+            min(len(self.task_list), first_row + visible_rows + VIRTUAL_ROW_BUFFER),
+        )
+
+    def _get_first_visible_row(self) -> int:
+        scroll_y = self.query_one(VerticalScroll).scroll_y
+        last_row = max(0, len(self.task_list) - 1)
+        task_cards = self.get_rendered_cards()
+        if not task_cards or scroll_y < task_cards[0].virtual_region_with_margin.y:
+            return min(int(scroll_y // self.row_height), last_row)
+
+        for task_card in task_cards:
+            if scroll_y < task_card.virtual_region_with_margin.bottom:
+                return task_card.row
+
+        below_cards = scroll_y - task_cards[-1].virtual_region_with_margin.bottom
+        return min(self.window_end + int(below_cards // self.row_height), last_row)
+
+    def _measure_row_height(self) -> None:
+        heights = [
+            task_card.outer_size.height + task_card.styles.margin.height
+            for task_card in self.get_rendered_cards()
+            if task_card.outer_size.height
+        ]
+        if heights:
+            self.row_height = max(1, int(statistics.median(heights)))
+
+    async def _mount_window(
+        self, start: int, end: int, refresh_cards: bool = False
+    ) -> None:
+        """Mounts the cards of the rows `start` to `end` and removes all others
+
+        Cards staying in the window are kept, only the rows entering the
+        window get new cards. Needs to hold the window lock.
+        """
+        scroll = self.query_one(VerticalScroll)
+        start = max(0, min(start, len(self.task_list)))
+        end = max(start, min(end, len(self.task_list)))
+        window_tasks = self.task_list[start:end]
+        window_ids = {task.task_id for task in window_tasks}
+
+        mounted_cards = {
+            task_card.task_.task_id: task_card
+            for task_card in self.get_rendered_cards()
+            if task_card.task_ is not None
+        }
+        leaving_cards = [
+            task_card
+            for task_id, task_card in mounted_cards.items()
+            if task_id not in window_ids
+        ]
+        if leaving_cards:
+            # otherwise focus moves to a neighbour of the removed card,
+            # which scrolls the viewport back to the old window
+            if self.screen.focused in leaving_cards:
+                self.screen.set_focus(None)
+            await scroll.remove_children(leaving_cards)
+
+        top_spacer, bottom_spacer = scroll.query(VirtualSpacer)
+        previous: Widget = top_spacer
+        new_cards: list[TaskCard] = []
+        mounts = []
+        for row_position, task in enumerate(window_tasks, start=start):
+            task.position = row_position
+            task_card = mounted_cards.get(task.task_id)
+            if task_card is None:
+                new_cards.append(TaskCard(task=task, row=row_position))
+                continue
+
+            if new_cards:
+                mounts.append(scroll.mount(*new_cards, after=previous))
+                previous = new_cards[-1]
+                new_cards = []
+            if scroll.children.index(task_card) != scroll.children.index(previous) + 1:
+                scroll.move_child(task_card, after=previous)
+            task_card.row = row_position
+            if refresh_cards or task_card.task_ != task:
+                task_card.update_task(task, refresh_all=refresh_cards)
+            previous = task_card
+        if new_cards:
+            mounts.append(scroll.mount(*new_cards, after=previous))
+        for mount in mounts:
+            await mount
+
+        self.window_start, self.window_end = start, end
+        top_spacer.styles.height = start * self.row_height
+        bottom_spacer.styles.height = (len(self.task_list) - end) * self.row_height
+
+    async def _mount_window_around(self, row: int) -> None:
+        """Mounts the rows around `row` and scrolls to it once laid out
+
+        Until then the offsets of the new cards are unknown, so the viewport
+        must not shift the window back. Needs to hold the window lock.
+        """
+        await self._mount_window(*self._get_window(around_row=row))
+        self._pending_row = row
+        scroll = self.query_one(VerticalScroll)
+        scroll.scroll_to(
+            y=row * self.row_height - scroll.size.height // 2,
+            animate=False,
+            immediate=True,
+        )
+        self.call_after_refresh(self._scroll_to_pending_row)
+
+    def _scroll_to_pending_row(self) -> None:
+        row, self._pending_row = self._pending_row, None
+        if row is None or row >= len(self.task_list):
+            return
+        task_id = self.task_list[row].task_id
+        if task_card := self.query_one_optional(f"#taskcard_{task_id}", TaskCard):
+            self.query_one(VerticalScroll).scroll_to_center(
+                task_card, animate=False, immediate=True
+            )
+        self._on_scroll()
+
+    def _on_scroll(self) -> None:
+        if self.virtual and not self._follow_viewport_scheduled:
+            self._follow_viewport_scheduled = True
+            self.call_after_refresh(self.follow_viewport)
+
+    async def follow_viewport(self) -> None:
+        """Shifts the window of virtual columns once the viewport nears its edges"""
+        self._follow_viewport_scheduled = False
+        if not self.virtual or self._pending_row is not None:
+            return
+
+        async with self._window_lock:
+            self._measure_row_height()
+            first_row = self._get_first_visible_row()
+            last_row = first_row + self._get_visible_rows()
+            margin = VIRTUAL_ROW_BUFFER // 2
+            needs_rows_above = (
+                self.window_start > 0 and first_row - self.window_start < margin
+            )
+            needs_rows_below = (
+                self.window_end < len(self.task_list)
+                and self.window_end - last_row < margin
+            )
+            if not (needs_rows_above or needs_rows_below):
+                return
+
+            focused = self.screen.focused
+            await self._mount_window(*self._get_window(first_row=first_row))
+
+        # the focused card was scrolled out of the window
+        if isinstance(focused, TaskCard) and not focused.is_attached:
+            await self.focus_row(first_row)
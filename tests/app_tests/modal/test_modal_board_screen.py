@@ -1,3 +1,6 @@
+import asyncio
+import threading
+
 import pytest
 from kanban_tui.app import KanbanTui
 from textual.widgets import Input, Button, Static, Label
@@ -8,6 +11,7 @@ from kanban_tui.modal.modal_board_screen import (
     ModalNewBoardScreen,
 )
 
+from kanban_tui.widgets.modal_board_widgets import BoardList, BoardListItem
 from kanban_tui.widgets.task_card import TaskCard
 from rich.emoji import Emoji
 
@@ -293,3 +297,32 @@ async def test_modal_board_copy_board(test_app: KanbanTui):
         assert isinstance(pilot.app.screen, BoardScreen)
         assert pilot.app.active_board.name == "Kanban Board_copy"
         assert len(pilot.app.board_list) == 2
+
+
+async def test_modal_board_list_loads_stats_in_background(
+    test_app: KanbanTui, monkeypatch
+):
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        backend_busy = threading.Event()
+        get_board_infos = pilot.app.backend.get_board_infos
+
+        def slow_get_board_infos():
+            backend_busy.wait(timeout=5)
+            return get_board_infos()
+
+        monkeypatch.setattr(pilot.app.backend, "get_board_infos", slow_get_board_infos)
+        pilot.app.push_screen(ModalBoardOverviewScreen())
+        while not pilot.app.screen.query(BoardList):
+            await asyncio.sleep(0.01)
+        board_list = pilot.app.screen.query_one(BoardList)
+        await asyncio.sleep(0.1)
+        assert board_list.loading
+        assert not board_list.query(BoardListItem)
+
+        backend_busy.set()
+        while board_list.loading:
+            await pilot.pause()
+        await pilot.pause()
+        board_item = board_list.query_one(BoardListItem)
+        assert board_item.amount_tasks == 5
+        assert board_list.index == 0
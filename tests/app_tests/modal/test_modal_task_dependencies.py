@@ -62,6 +62,34 @@ async def test_dependency_selector_available_tasks(test_app: KanbanTui):
         assert current_task_id not in task_ids
 
 
+async def test_dependency_selector_uses_loaded_tasks(test_app: KanbanTui, monkeypatch):
+    """Test that dependency options are built without querying the backend."""
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        await pilot.press("e")
+        await pilot.pause()
+
+        def fail(*args, **kwargs):
+            raise AssertionError("backend was queried")
+
+        for method in (
+            "get_tasks_on_active_board",
+            "get_task_by_id",
+            "get_column_by_id",
+        ):
+            monkeypatch.setattr(pilot.app.backend, method, fail)
+
+        selector = pilot.app.screen.query_one(DependencySelector)
+        available_tasks = selector.get_available_tasks()
+
+        assert len(available_tasks) == len(pilot.app.task_list) - 1
+        column_names = pilot.app.column_name_dict
+        for task in pilot.app.task_list[1:]:
+            assert (
+                f"#{task.task_id} - {task.title[:40]} [{column_names[task.column]}]",
+                task.task_id,
+            ) in available_tasks
+
+
 async def test_add_dependency_via_selector(test_app: KanbanTui):
     """Test adding a dependency through the dropdown selector."""
     async with test_app.run_test(size=APP_SIZE) as pilot:
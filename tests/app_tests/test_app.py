@@ -1,5 +1,7 @@
 from pathlib import Path
 
+import pytest
+
 from kanban_tui.app import KanbanTui
 from kanban_tui.backends.sqlite.backend import SqliteBackend
 from kanban_tui.config import Backends
@@ -7,6 +9,7 @@ from kanban_tui.modal.modal_auth_screen import ModalAuthScreen
 from kanban_tui.screens.board_screen import BoardScreen
 from kanban_tui.widgets.board_widgets import KanbanBoard
 from kanban_tui.modal.modal_board_screen import ModalBoardOverviewScreen
+from tests.worker_helpers import wait_for_workers
 
 APP_SIZE = (150, 50)
 
@@ -115,6 +118,42 @@ async def test_app_refresh(
         assert len(pilot.app.task_list) == 4
 
 
+async def test_app_compacts_audits_on_mount(test_app: KanbanTui):
+    test_app.config.backend.sqlite_settings.audit_retention.max_rows = 4
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        await wait_for_workers(pilot.app)
+        assert len(pilot.app.backend.get_filtered_events(filter={})) == 4
+        assert pilot.app.backend.get_filtered_event_count(filter={}) == 16
+
+
+async def test_app_compaction_keeps_changes_not_refreshed_yet(test_app: KanbanTui):
+    test_app.config.backend.sqlite_settings.audit_retention.max_rows = 1
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        await wait_for_workers(pilot.app)
+        pilot.app.backend.delete_task(task_id=1)
+        pilot.app.backend.delete_task(task_id=2)
+        pilot.app.compact_audits()
+        await wait_for_workers(pilot.app)
+
+        changes = pilot.app.backend.get_changes_since(pilot.app.last_event_id)
+        assert [(event.event_type, event.object_id) for event in changes] == [
+            ("DELETE", 1),
+            ("DELETE", 2),
+        ]
+
+
+async def test_app_auto_refresh_after_external_compaction(test_app: KanbanTui):
+    test_app.config.board.auto_refresh_interval = 15
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        pilot.app.backend.delete_task(task_id=1)
+        pilot.app.backend.delete_task(task_id=2)
+        pilot.app.backend.compact_audits(max_rows=1)
+
+        pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
+        assert [task.task_id for task in pilot.app.task_list] == [3, 4, 5]
+
+
 async def test_app_auto_refresh_updates_board(test_app: KanbanTui):
     test_app.config.board.auto_refresh_interval = 15
     async with test_app.run_test(size=APP_SIZE) as pilot:
@@ -122,7 +161,89 @@ async def test_app_auto_refresh_updates_board(test_app: KanbanTui):
         assert len(pilot.app.task_list) == 5
 
         pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
+        assert len(pilot.app.task_list) == 4
+
+
+async def test_app_auto_refresh_skips_idle_board(test_app: KanbanTui, monkeypatch):
+    test_app.config.board.auto_refresh_interval = 15
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        loaded = []
+        for loader in ("reload_board", "load_task_list"):
+            original = getattr(pilot.app, loader)
+            monkeypatch.setattr(
+                pilot.app,
+                loader,
+                lambda original=original, loader=loader: (
+                    loaded.append(loader) or original()
+                ),
+            )
+
+        pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
+        assert loaded == []
+
+        # task changes only fetch the changed tasks
+        pilot.app.backend.delete_task(task_id=1)
+        pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
         assert len(pilot.app.task_list) == 4
+        assert loaded == []
+
+        # column changes reload the whole board
+        loaded.clear()
+        pilot.app.backend.update_column_name(column_id=1, new_name="Backlog")
+        pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
+        assert "reload_board" in loaded
+        assert pilot.app.column_list[0].name == "Backlog"
+
+
+async def test_app_auto_refresh_fetches_changed_tasks(test_app: KanbanTui, monkeypatch):
+    test_app.config.board.auto_refresh_interval = 15
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        backend = pilot.app.backend
+        fetched_ids = []
+        get_tasks_by_ids = backend.get_tasks_by_ids
+        monkeypatch.setattr(
+            backend,
+            "get_tasks_by_ids",
+            lambda task_ids: fetched_ids.extend(task_ids) or get_tasks_by_ids(task_ids),
+        )
+        monkeypatch.setattr(
+            backend,
+            "get_tasks_on_active_board",
+            lambda: pytest.fail("the whole board was reloaded"),
+        )
+
+        backend.delete_task(task_id=1)
+        backend.update_task_entry(
+            task_id=2,
+            title="Renamed",
+            description="Hallo",
+            category=3,
+            due_date=None,
+        )
+        moved_task = backend.get_task_by_id(task_id=3)
+        moved_task.column = 2
+        backend.update_task_status(new_task=moved_task, target_position=0)
+        new_task = backend.create_new_task(title="New", description="", column=3)
+
+        pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
+        assert fetched_ids == [1, 2, 3, new_task.task_id]
+
+        expected = [
+            (task.task_id, task.title, task.column)
+            for task in get_tasks_by_ids([2, 3, 4, 5, new_task.task_id])
+        ]
+        assert sorted(
+            (task.task_id, task.title, task.column) for task in pilot.app.task_list
+        ) == sorted(expected)
+        assert [task.task_id for task in pilot.app.task_list if task.column == 2] == [
+            3,
+            4,
+        ]
 
 
 async def test_app_auto_refresh_noop_off_board(test_app: KanbanTui):
@@ -137,6 +258,7 @@ async def test_app_auto_refresh_noop_off_board(test_app: KanbanTui):
 
         await pilot.press("ctrl+j")
         pilot.app.handle_auto_refresh_tick()
+        await wait_for_workers(pilot.app)
         assert len(pilot.app.task_list) == 4
 
 
@@ -1,11 +1,21 @@
+import asyncio
 import sys
+import threading
+from datetime import datetime
+from types import SimpleNamespace
 
 import pytest
 
 from kanban_tui.app import KanbanTui
-from textual.widgets import Input, Button, Label
+from kanban_tui.backends.sqlite import backend as sqlite_backend
+from kanban_tui.backends.sqlite.database import create_connection
+from textual.color import Color
+from textual.containers import VerticalScroll
+from textual.geometry import Offset
+from textual.widgets import Input, Button, Label, Markdown
 from kanban_tui.config import Backends, MovementModes
 from kanban_tui.screens.board_screen import BoardScreen
+from kanban_tui.screens.settings_screen import SettingsScreen
 from kanban_tui.widgets.board_widgets import KanbanBoard
 from kanban_tui.modal.modal_task_screen import ModalTaskEditScreen
 from kanban_tui.modal.modal_board_screen import (
@@ -14,8 +24,9 @@ from kanban_tui.modal.modal_board_screen import (
 )
 
 from kanban_tui.widgets.modal_task_widgets import VimSelect
-from kanban_tui.widgets.task_card import TaskCard
+from kanban_tui.widgets.task_card import CachedMarkdownParser, TaskCard
 from kanban_tui.widgets.task_column import Column
+from tests.worker_helpers import wait_for_workers
 
 APP_SIZE = (150, 50)
 
@@ -77,6 +88,45 @@ async def test_task_metadata_hidden_until_focus_when_disabled(test_app: KanbanTu
         assert "no dependencies" in second_metadata.content.plain
 
 
+async def test_task_description_parsed_on_first_focus(test_app: KanbanTui):
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        task_cards = list(pilot.app.screen.query(TaskCard).results())
+        first_card = task_cards[0]
+        second_card = task_cards[1]
+
+        assert first_card.description is not None
+        assert first_card.description.display
+        assert second_card.description is None
+        assert not second_card.query(Markdown)
+
+        await pilot.press("j")
+        assert second_card.description is not None
+        assert second_card.description.display
+        assert not first_card.description.display
+
+        await pilot.press("k")
+        assert first_card.description.display
+        assert not second_card.description.display
+
+
+async def test_task_description_always_expanded(test_app: KanbanTui):
+    test_app.config.task.always_expanded = True
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        task_cards = list(pilot.app.screen.query(TaskCard).results())
+        assert all(task_card.description.display for task_card in task_cards)
+
+
+def test_markdown_parser_reuses_tokens():
+    parser = CachedMarkdownParser(max_size=2)
+    tokens = parser.parse("# Hallo")
+    assert parser.parse("# Hallo") is tokens
+
+    parser.parse("first")
+    parser.parse("second")
+    assert parser.parse("# Hallo") is not tokens
+    assert parser.parse("# Hallo") == tokens
+
+
 async def test_kanbanboard_board_view(no_task_app: KanbanTui):
     async with no_task_app.run_test(size=APP_SIZE) as pilot:
         # open modal to show Boards
@@ -333,6 +383,36 @@ async def test_refresh_columns_preserves_unchanged_column_widgets(test_app: Kanb
         assert done_column_after.task_amount == 0
 
 
+async def test_refresh_columns_updates_changed_cards_in_place(test_app: KanbanTui):
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        board = pilot.app.screen.query_one(KanbanBoard)
+        first_card, second_card = list(
+            pilot.app.screen.query_one("#column_1", Column).query(TaskCard).results()
+        )[:2]
+        title_label = first_card.title_label
+        first_description = first_card.description
+        second_metadata = second_card.metadata_label.content
+
+        pilot.app.backend.update_task_entry(
+            task_id=first_card.task_.task_id,
+            title="Renamed",
+            description="Changed",
+            category=2,
+            due_date=None,
+        )
+        pilot.app.update_task_list()
+        await board.refresh_columns()
+        await pilot.pause()
+
+        assert first_card.is_attached
+        assert first_card.title_label is title_label
+        assert title_label.content == "Renamed"
+        assert first_card.description is first_description
+        assert first_description.source == "Changed"
+        assert first_card.styles.background == Color.parse("#00FF00")
+        assert second_card.metadata_label.content is second_metadata
+
+
 async def test_replace_tasks_bulk_mount_preserves_order(no_task_app: KanbanTui):
     no_task_app.backend.create_new_category(name="red", color="#FF0000")
     no_task_app.backend.create_new_category(name="green", color="#00FF00")
@@ -486,3 +566,193 @@ async def test_custom_footer_backend_switcher(test_app: KanbanTui):
     async with test_app.run_test(size=APP_SIZE) as pilot:
         assert not pilot.app.screen.query_one(VimSelect).display
         assert pilot.app.screen.query_one(VimSelect).value == f"✔  {Backends.SQLITE}"
+
+
+async def test_board_renders_without_category_queries(test_app: KanbanTui, monkeypatch):
+    with create_connection(database=test_app.backend.database_path) as con:
+        con.executemany(
+            """
+            INSERT INTO tasks (title, column, category, description, creation_date, sort_key)
+            VALUES (?, ?, ?, '', ?, ?)
+            """,
+            (
+                (f"Task {i}", i % 3 + 1, i % 3 + 1, datetime.now(), i + 5)
+                for i in range(495)
+            ),
+        )
+        con.commit()
+    # categories are loaded once when filling the cache
+    assert len(test_app.backend.category_map) == 3
+
+    category_queries = []
+    monkeypatch.setattr(
+        sqlite_backend,
+        "get_all_categories_db",
+        lambda *args, **kwargs: category_queries.append(kwargs),
+    )
+
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        assert len(list(pilot.app.screen.query(TaskCard).results())) == 500
+        assert category_queries == []
+
+
+async def test_board_switch_loads_tasks_in_background(test_app: KanbanTui, monkeypatch):
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        pilot.app.backend.create_new_board(name="Empty Board", icon="Vampire")
+        pilot.app.update_board_list()
+
+        backend_entered = threading.Event()
+        backend_busy = threading.Event()
+        get_tasks = pilot.app.backend.get_tasks_on_active_board
+
+        def slow_get_tasks():
+            backend_entered.set()
+            backend_busy.wait()
+            return get_tasks()
+
+        monkeypatch.setattr(
+            pilot.app.backend, "get_tasks_on_active_board", slow_get_tasks
+        )
+        try:
+            pilot.app.active_board = pilot.app.board_list[1]
+            assert await asyncio.to_thread(backend_entered.wait, 10)
+
+            kanban_board = pilot.app.screen.query_one(KanbanBoard)
+            assert kanban_board.loading
+            # the app keeps handling input while the backend is busy
+            await pilot.press("ctrl+l")
+            assert isinstance(pilot.app.screen, SettingsScreen)
+            await pilot.press("ctrl+j")
+            assert isinstance(pilot.app.screen, BoardScreen)
+        finally:
+            backend_busy.set()
+
+        await wait_for_workers(pilot.app)
+        await pilot.pause()
+        assert not kanban_board.loading
+        assert pilot.app.task_list == []
+        assert not pilot.app.screen.query(TaskCard)
+
+
+async def test_board_switch_loads_columns_off_the_event_loop(
+    test_app: KanbanTui, monkeypatch
+):
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        pilot.app.backend.create_new_board(name="Empty Board", icon="Vampire")
+        pilot.app.update_board_list()
+        await wait_for_workers(pilot.app)
+
+        loading_threads = []
+        for loader in ("get_columns", "get_boards"):
+            original = getattr(pilot.app.backend, loader)
+            monkeypatch.setattr(
+                pilot.app.backend,
+                loader,
+                lambda original=original: (
+                    loading_threads.append(threading.current_thread()) or original()
+                ),
+            )
+
+        pilot.app.active_board = pilot.app.board_list[1]
+        await wait_for_workers(pilot.app)
+        assert [column.board_id for column in pilot.app.column_list] == [2] * 4
+        assert loading_threads
+        assert threading.main_thread() not in loading_threads
+
+
+@pytest.fixture
+def virtual_column_app(no_task_app: KanbanTui) -> KanbanTui:
+    no_task_app.config.board.virtual_column_threshold = 50
+    no_task_app.backend.create_new_tasks(
+        [{"title": f"Task_ready_{idx}", "column": 1} for idx in range(200)]
+    )
+    return no_task_app
+
+
+async def _scroll_column_to_end(pilot, column: Column) -> None:
+    column.query_one(VerticalScroll).scroll_end(animate=False)
+    for _ in range(10):
+        await pilot.pause()
+        if column.window_end == column.task_amount:
+            break
+
+
+async def test_virtual_column_mounts_cards_near_viewport(
+    virtual_column_app: KanbanTui,
+):
+    async with virtual_column_app.run_test(size=APP_SIZE) as pilot:
+        column = pilot.app.screen.query_one("#column_1", Column)
+        ready_task_ids = [task.task_id for task in pilot.app.task_list]
+
+        assert column.virtual
+        assert column.task_amount == 200
+        rendered_cards = column.get_rendered_cards()
+        assert len(rendered_cards) < 50
+        assert [card.task_.task_id for card in rendered_cards] == ready_task_ids[
+            : len(rendered_cards)
+        ]
+
+        await _scroll_column_to_end(pilot, column)
+        rendered_cards = column.get_rendered_cards()
+        assert len(rendered_cards) < 50
+        assert rendered_cards[-1].row == 199
+        assert [card.task_.task_id for card in rendered_cards] == ready_task_ids[
+            rendered_cards[0].row :
+        ]
+
+
+async def test_virtual_column_navigation_wraps_to_unmounted_cards(
+    virtual_column_app: KanbanTui,
+):
+    async with virtual_column_app.run_test(size=APP_SIZE) as pilot:
+        ready_task_ids = [task.task_id for task in pilot.app.task_list]
+        assert pilot.app.focused.row == 0
+
+        await pilot.press("k")
+        assert pilot.app.focused.row == 199
+        assert pilot.app.focused.task_.task_id == ready_task_ids[-1]
+
+        await pilot.press("j")
+        assert pilot.app.focused.row == 0
+        await pilot.press("j")
+        assert pilot.app.focused.row == 1
+        assert pilot.app.focused.task_.task_id == ready_task_ids[1]
+
+
+async def test_virtual_column_move_card_position(virtual_column_app: KanbanTui):
+    async with virtual_column_app.run_test(size=APP_SIZE) as pilot:
+        column = pilot.app.screen.query_one("#column_1", Column)
+        first_task_id, second_task_id = [task.task_id for task in column.task_list[:2]]
+
+        await pilot.press("J")
+        assert pilot.app.focused.task_.task_id == first_task_id
+        assert pilot.app.focused.row == 1
+
+        expected_ids = [task.task_id for task in pilot.app.task_list]
+        assert expected_ids[:2] == [second_task_id, first_task_id]
+        assert [task.task_id for task in column.task_list] == expected_ids
+        assert [card.task_.task_id for card in column.get_rendered_cards()] == (
+            expected_ids[: len(column.get_rendered_cards())]
+        )
+
+
+async def test_virtual_column_drag_target_uses_task_positions(
+    virtual_column_app: KanbanTui,
+):
+    async with virtual_column_app.run_test(size=APP_SIZE) as pilot:
+        board = pilot.app.screen.query_one(KanbanBoard)
+        column = pilot.app.screen.query_one("#column_1", Column)
+        await _scroll_column_to_end(pilot, column)
+
+        rendered_cards = column.get_rendered_cards()
+        moving_card, target_card = rendered_cards[0], rendered_cards[5]
+        board.selected_task = moving_card.task_
+        event = SimpleNamespace(screen_offset=Offset(0, target_card.region.y))
+        board._update_drag_reorder_target(
+            column=column, event=event, column_id=1, is_cross_column=False
+        )
+
+        assert board.drag_target_card is target_card
+        assert board.drag_target_before
+        # position among the other tasks, the moving card is above the target
+        assert board.drag_target_position == target_card.row - 1
@@ -0,0 +1,96 @@
+"""Integration tests for the Jira backend in the TUI app."""
+
+import asyncio
+import os
+from datetime import date, timedelta
+
+import pytest
+
+from kanban_tui.app import KanbanTui
+from kanban_tui.backends.auth import ApiKeyEntry, AuthSettings
+from kanban_tui.config import Backends, JqlEntry, Settings, init_config
+from kanban_tui.modal.modal_board_screen import ModalBoardOverviewScreen
+from kanban_tui.widgets.modal_board_widgets import BoardListItem
+from kanban_tui.widgets.task_card import TaskCard
+from tests.worker_helpers import wait_for_worker_group, wait_for_workers
+
+APP_SIZE = (150, 50)
+
+
+@pytest.fixture
+def jira_app(
+    test_file_location,
+    test_config_path,
+    test_database_path,
+    test_auth_path,
+    fake_jira_server,
+):
+    os.environ["KANBAN_TUI_CONFIG_FILE"] = test_config_path
+    os.environ["KANBAN_TUI_AUTH_FILE"] = test_auth_path
+    init_config(config_path=test_config_path, database=test_database_path)
+    AuthSettings(jira=ApiKeyEntry(api_key="token")).save(test_auth_path)
+
+    config = Settings()
+    config.backend.mode = Backends.JIRA
+    config.backend.jira_settings.base_url = fake_jira_server.url
+    config.backend.jira_settings.page_size = 25
+    config.backend.jira_settings.issue_cache_path = (
+        test_file_location / "jira_cache.db"
+    ).as_posix()
+    config.backend.jira_settings.jqls = [
+        JqlEntry(
+            id=1,
+            name="KTUI",
+            jql="project = KTUI",
+            column_mapping={"To Do": 1, "In Progress": 2, "Done": 3},
+        )
+    ]
+    config.save(test_config_path)
+
+    app = KanbanTui(config_path=test_config_path, database_path=test_database_path)
+    yield app
+    app.backend.close()
+
+
+async def test_jira_board_fills_in_while_pages_arrive(jira_app, fake_jira_server):
+    link = {"id": "1", "type": {"name": "Blocks"}}
+    fake_jira_server.issues[0]["fields"]["issuelinks"] = [
+        {**link, "outwardIssue": {"id": "120", "key": "KTUI-120"}}
+    ]
+    fake_jira_server.issues[119]["fields"]["issuelinks"] = [
+        {**link, "inwardIssue": {"id": "1", "key": "KTUI-1"}}
+    ]
+    fake_jira_server.following_pages.clear()
+    async with jira_app.run_test(size=APP_SIZE) as pilot:
+        # first page is shown while the remaining pages are held back
+        try:
+            await wait_for_worker_group(jira_app, "task-list")
+            assert await asyncio.to_thread(
+                fake_jira_server.following_page_held.wait, 10
+            )
+            assert len(jira_app.task_list) == 25
+            assert len(jira_app.screen.query(TaskCard)) == 25
+        finally:
+            # the app can only shut down once the held pages are released
+            fake_jira_server.following_pages.set()
+
+        await wait_for_workers(jira_app)
+        await pilot.pause()
+        assert [task.task_id for task in jira_app.task_list] == list(range(1, 121))
+        assert len(jira_app.screen.query(TaskCard)) == 120
+        # the link to the last page replaced the task of the first page
+        assert jira_app.task_list[0].blocking == [120]
+
+
+async def test_jira_board_picker_shows_board_stats(jira_app, fake_jira_server):
+    due_date = date.today() + timedelta(days=2)
+    fake_jira_server.issues[10]["fields"]["duedate"] = due_date.isoformat()
+    async with jira_app.run_test(size=APP_SIZE) as pilot:
+        await wait_for_workers(jira_app)
+        await pilot.press("B")
+        assert isinstance(jira_app.screen, ModalBoardOverviewScreen)
+
+        board_item = jira_app.screen.query_one(BoardListItem)
+        assert board_item.amount_tasks == 120
+        assert board_item.amount_columns == 3
+        assert board_item.next_due == 2
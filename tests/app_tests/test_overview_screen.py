@@ -2,7 +2,9 @@ import pytest
 
 from kanban_tui.app import KanbanTui
 from kanban_tui.screens.overview_screen import OverViewScreen
-from kanban_tui.widgets.overview_widgets import LogFilterButton
+from kanban_tui.widgets import overview_widgets
+from kanban_tui.widgets.overview_widgets import LogFilterButton, LogTable
+from tests.worker_helpers import wait_for_workers
 
 APP_SIZE = (150, 50)
 
@@ -36,6 +38,53 @@ async def test_overview_view(test_app: KanbanTui, test_database_path):
         assert pilot.app.screen.query_one("#datatable_logs").row_count == 13
 
 
+async def test_overview_log_loads_pages(
+    test_app: KanbanTui, test_database_path, monkeypatch
+):
+    monkeypatch.setattr(overview_widgets, "EVENT_PAGE_SIZE", 5)
+    monkeypatch.setattr(overview_widgets, "EVENT_PAGE_MARGIN", 2)
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        await pilot.press("ctrl+k")
+        await pilot.pause()
+        await wait_for_workers(pilot.app)
+
+        log_table = pilot.app.screen.query_one(LogTable)
+        data_table = pilot.app.screen.query_one("#datatable_logs")
+        assert data_table.row_count == 5
+        assert log_table.border_title == "Audit Log (13 events)"
+        # newest event first
+        assert log_table.events[0].event_id > log_table.events[-1].event_id
+
+        await pilot.press("L")
+        for _ in range(4):
+            await pilot.press("j")
+        assert data_table.row_count == 10
+
+        for _ in range(10):
+            await pilot.press("j")
+        assert data_table.row_count == 13
+        assert log_table.all_events_loaded
+
+
+async def test_overview_log_shows_compacted_events(
+    test_app: KanbanTui, test_database_path
+):
+    test_app.backend.compact_audits(max_rows=5)
+    async with test_app.run_test(size=APP_SIZE) as pilot:
+        await pilot.press("ctrl+k")
+        await pilot.pause()
+        await wait_for_workers(pilot.app)
+
+        log_table = pilot.app.screen.query_one(LogTable)
+        data_table = pilot.app.screen.query_one("#datatable_logs")
+        assert log_table.all_events_loaded
+        assert log_table.all_summaries_loaded
+        assert log_table.summaries
+        assert data_table.row_count == len(log_table.events) + len(log_table.summaries)
+        # compacted events are still counted
+        assert log_table.border_title == "Audit Log (13 events)"
+
+
 async def test_overview_tab_switch(test_app: KanbanTui, test_database_path):
     async with test_app.run_test(size=APP_SIZE) as pilot:
         await pilot.press("ctrl+k")
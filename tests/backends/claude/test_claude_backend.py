@@ -169,3 +169,88 @@ def test_claude_backend_empty_directory(tmp_path, test_app: KanbanTui, monkeypat
     # Should raise exception when no boards exist
     with pytest.raises(Exception, match="No Claude task sessions found"):
         _ = backend.active_board
+
+
+def test_claude_backend_reparses_only_changed_files(temp_claude_tasks, monkeypatch):
+    """Test that unchanged task files are served from the task index."""
+    tasks_path, session_id = temp_claude_tasks
+    session_path = tasks_path / session_id
+
+    settings = ClaudeBackendSettings(
+        tasks_base_path=str(tasks_path), active_session_id=session_id
+    )
+    backend = ClaudeBackend(settings)
+
+    parsed_files = []
+    original_read = backend._read_task_file
+    monkeypatch.setattr(
+        backend,
+        "_read_task_file",
+        lambda task_file: (
+            parsed_files.append(task_file.name) or original_read(task_file)
+        ),
+    )
+
+    assert len(backend.get_tasks_on_active_board()) == 3
+    assert sorted(parsed_files) == ["1.json", "2.json", "3.json"]
+
+    # No changes, nothing parsed
+    parsed_files.clear()
+    tasks = backend.get_tasks_on_active_board()
+    assert parsed_files == []
+
+    # Returned tasks are copies of the indexed ones
+    tasks[0].column = 3
+    tasks[0].blocked_by.append(99)
+    tasks[0].metadata["changed"] = True
+    indexed_task = backend.get_tasks_on_active_board()[0]
+    assert indexed_task.column == 2
+    assert 99 not in indexed_task.blocked_by
+    assert "changed" not in indexed_task.metadata
+
+    # Changed, added and removed files
+    task_2 = json.loads((session_path / "2.json").read_text())
+    task_2["status"] = "completed"
+    (session_path / "2.json").write_text(json.dumps(task_2))
+    task_2["id"] = "4"
+    (session_path / "4.json").write_text(json.dumps(task_2))
+    (session_path / "3.json").unlink()
+
+    tasks = backend.get_tasks_on_active_board()
+    assert sorted(parsed_files) == ["2.json", "4.json"]
+    assert [(task.task_id, task.column) for task in tasks] == [(1, 2), (2, 3), (4, 3)]
+
+
+def test_claude_backend_memoizes_board_registry(temp_claude_tasks, monkeypatch):
+    """Test that sessions are only scanned again after they changed."""
+    tasks_path, session_id = temp_claude_tasks
+
+    settings = ClaudeBackendSettings(
+        tasks_base_path=str(tasks_path), active_session_id=session_id
+    )
+    backend = ClaudeBackend(settings)
+
+    scans = []
+    original_scan = backend._scan_boards
+    monkeypatch.setattr(
+        backend, "_scan_boards", lambda: scans.append(1) or original_scan()
+    )
+
+    tasks = backend.get_tasks_on_active_board()
+    assert all(task.metadata["session_id"] == session_id for task in tasks)
+    assert backend.active_board.name == session_id
+    assert len(scans) == 1
+
+    # New sessions are detected
+    (tasks_path / "another-session").mkdir()
+    assert [board.name for board in backend.get_boards()] == [
+        "another-session",
+        session_id,
+    ]
+    assert backend.active_board.name == session_id
+    assert len(scans) == 2
+
+    # Explicit invalidation
+    backend.clear_cache()
+    backend.get_boards()
+    assert len(scans) == 3
@@ -1,8 +1,21 @@
 import os
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+from atlassian import Jira
+
+from kanban_tui.backends.jira import issue_cache as issue_cache_module
+from kanban_tui.backends.jira import jira_api
 from kanban_tui.backends.jira.backend import JiraBackend
-from kanban_tui.config import Settings
+from kanban_tui.backends.jira.jira_api import (
+    ISSUE_FIELDS,
+    get_jql_total,
+    iter_jql_pages,
+)
+from kanban_tui.config import JqlEntry, Settings
+from tests.fake_jira_server import make_issue
 
 
 def test_init_backend(test_jira_config: Settings, test_auth_path):
@@ -11,3 +24,240 @@ def test_init_backend(test_jira_config: Settings, test_auth_path):
     assert backend.settings.base_url == "http://localhost:8080"
     assert backend.settings.auth_file_path == test_auth_path
     assert Path(test_auth_path).exists()
+
+
+def test_get_tasks_by_ids_batches_requests(test_jira_backend, fake_jira_server):
+    task_ids = [105, 3, 77, 3, *range(10, 70)]
+    tasks = test_jira_backend.get_tasks_by_ids(task_ids)
+
+    assert [task.task_id for task in tasks] == task_ids
+    assert tasks[0].title == "KTUI-105\nIssue 105"
+    assert tasks[0].column == 1
+    # 63 distinct ids in two `id in (...)` chunks
+    assert len(fake_jira_server.requests) == 2
+    for _, params in fake_jira_server.requests:
+        assert params["jql"].startswith("id in (")
+        assert "issuelinks" in params["fields"].split(",")
+        assert "comment" not in params["fields"].split(",")
+
+
+def test_get_tasks_by_ids_logs_failed_chunks(
+    test_jira_backend, fake_jira_server, monkeypatch, caplog, capsys
+):
+    get_jql_async = jira_api.get_jql_async
+
+    async def failing_second_chunk(auth, jql, **kwargs):
+        if "69" in jql:
+            raise ConnectionError("connection reset")
+        return await get_jql_async(auth, jql, **kwargs)
+
+    monkeypatch.setattr(jira_api, "get_jql_async", failing_second_chunk)
+    tasks = test_jira_backend.get_tasks_by_ids(list(range(10, 70)))
+
+    assert [task.task_id for task in tasks] == list(range(10, 60))
+    assert "Could not fetch issues [60, 61" in caplog.text
+    assert "connection reset" in caplog.text
+    assert capsys.readouterr().out == ""
+
+
+def test_get_tasks_by_ids_skips_unknown_ids(test_jira_backend, fake_jira_server):
+    tasks = test_jira_backend.get_tasks_by_ids([1, 999, 2])
+
+    assert [task.task_id for task in tasks] == [1, 2]
+    assert len(fake_jira_server.requests) == 1
+    assert test_jira_backend.get_task_by_id(999) is None
+
+
+def test_get_tasks_by_board_id_loads_all_pages(test_jira_backend, fake_jira_server):
+    test_jira_backend.settings.page_size = 25
+    tasks = test_jira_backend.get_tasks_by_board_id(board_id=1)
+
+    assert [task.task_id for task in tasks] == list(range(1, 121))
+    assert {task.column for task in tasks} == {1, 2, 3}
+    start_ats = sorted(
+        int(params["startAt"]) for _, params in fake_jira_server.requests
+    )
+    assert start_ats == [0, 25, 50, 75, 100]
+    for _, params in fake_jira_server.requests:
+        assert params["fields"].split(",") == ISSUE_FIELDS
+
+
+def test_iter_task_pages_follows_capped_page_size(test_jira_backend, fake_jira_server):
+    fake_jira_server.max_results_limit = 50
+    pages = list(test_jira_backend.iter_task_pages_by_board_id(board_id=1))
+
+    assert [len(page) for page in pages] == [50, 50, 20]
+
+
+def test_iter_task_pages_resolves_links_to_later_pages(
+    test_jira_backend, fake_jira_server
+):
+    link = {"id": "1", "type": {"name": "Blocks"}}
+    fake_jira_server.issues[0]["fields"]["issuelinks"] = [
+        {**link, "outwardIssue": {"id": "120", "key": "KTUI-120"}}
+    ]
+    fake_jira_server.issues[119]["fields"]["issuelinks"] = [
+        {**link, "inwardIssue": {"id": "1", "key": "KTUI-1"}}
+    ]
+    test_jira_backend.settings.page_size = 50
+    pages = test_jira_backend.iter_task_pages_by_board_id(board_id=1)
+
+    first_page = next(pages)
+    assert first_page[0].blocking == []
+    last_page = list(pages)[-1]
+    # received tasks stay unchanged, the last page repeats the linking task
+    assert first_page[0].blocking == []
+    assert [task.task_id for task in last_page] == [*range(101, 121), 1]
+    assert last_page[-2].blocked_by == [1]
+    assert last_page[-1].blocking == [120]
+
+    tasks = test_jira_backend.get_tasks_by_board_id(board_id=1)
+    assert [task.task_id for task in tasks] == list(range(1, 121))
+    assert tasks[0].blocking == [120]
+    assert tasks[-1].blocked_by == [1]
+
+
+def test_iter_jql_pages_with_next_page_token(fake_jira_server):
+    auth = Jira(url=fake_jira_server.url, token="", cloud=True)
+    pages = list(iter_jql_pages(auth, "project = KTUI", page_size=40))
+
+    assert [len(page) for page in pages] == [40, 40, 40]
+    assert [params.get("nextPageToken") for _, params in fake_jira_server.requests] == [
+        None,
+        "40",
+        "80",
+    ]
+
+
+@pytest.fixture
+def two_board_jira_backend(test_jira_backend, fake_jira_server):
+    fake_jira_server.issues[40]["fields"]["duedate"] = "2026-05-02"
+    fake_jira_server.issues[80]["fields"]["duedate"] = "2026-04-20"
+    test_jira_backend.settings.jqls.append(
+        JqlEntry(
+            id=2,
+            name="Sorted",
+            jql="project = KTUI ORDER BY created DESC",
+            column_mapping={"To Do": 1, "Done": 2},
+        )
+    )
+    return test_jira_backend
+
+
+def test_get_board_infos_queries_only_stats(two_board_jira_backend, fake_jira_server):
+    board_infos = two_board_jira_backend.get_board_infos()
+
+    assert board_infos == [
+        {
+            "board_id": 1,
+            "amount_tasks": 120,
+            "amount_columns": 3,
+            "next_due": "2026-04-20",
+        },
+        {
+            "board_id": 2,
+            "amount_tasks": 120,
+            "amount_columns": 2,
+            "next_due": "2026-04-20",
+        },
+    ]
+    # one total and one due date query per board, no issue lists
+    assert len(fake_jira_server.requests) == 4
+    for _, params in fake_jira_server.requests:
+        assert int(params["maxResults"]) <= 1
+        assert params["jql"].count("ORDER BY") <= 1
+
+
+def test_get_board_infos_cached_until_ttl(two_board_jira_backend, fake_jira_server):
+    two_board_jira_backend.get_board_infos()
+    two_board_jira_backend.get_board_infos()
+    assert len(fake_jira_server.requests) == 4
+
+    two_board_jira_backend.clear_cache()
+    two_board_jira_backend.get_board_infos()
+    assert len(fake_jira_server.requests) == 8
+
+    two_board_jira_backend.settings.board_info_ttl = 0
+    two_board_jira_backend.get_board_infos()
+    assert len(fake_jira_server.requests) == 12
+
+
+def test_get_jql_total_on_cloud(fake_jira_server):
+    auth = Jira(url=fake_jira_server.url, token="", cloud=True)
+
+    assert get_jql_total(auth, "project = KTUI") == 120
+    assert fake_jira_server.requests[0][0].endswith("/search/approximate-count")
+
+
+def test_refresh_fetches_only_changed_issues(test_jira_backend, fake_jira_server):
+    link = {"id": "1", "type": {"name": "Blocks"}}
+    fake_jira_server.issues[0]["fields"]["issuelinks"] = [
+        {**link, "outwardIssue": {"id": "2", "key": "KTUI-2"}}
+    ]
+    fake_jira_server.issues[1]["fields"]["issuelinks"] = [
+        {**link, "inwardIssue": {"id": "1", "key": "KTUI-1"}}
+    ]
+    test_jira_backend.get_tasks_by_board_id(board_id=1)
+
+    # issue 5 changed, issue 6 left the query, issue 121 entered it unchanged
+    fake_jira_server.issues[4]["fields"]["summary"] = "Changed"
+    fake_jira_server.issues[4]["fields"]["updated"] = datetime.now().isoformat()
+    fake_jira_server.issues.pop(5)
+    fake_jira_server.issues.append(make_issue(121))
+    fake_jira_server.requests.clear()
+
+    tasks = test_jira_backend.get_tasks_by_board_id(board_id=1)
+
+    assert [task.task_id for task in tasks] == [*range(1, 6), *range(7, 122)]
+    assert tasks[4].title == "KTUI-5\nChanged"
+    assert tasks[0].blocking == [2]
+    assert tasks[1].blocked_by == [1]
+
+    full_field_requests = [
+        params
+        for _, params in fake_jira_server.requests
+        if params["fields"] != "updated"
+    ]
+    assert len(full_field_requests) == 2
+    assert full_field_requests[0]["jql"].startswith(
+        '(project = KTUI) AND updated >= "-'
+    )
+    assert full_field_requests[1]["jql"] == "id in (121)"
+
+
+def test_issue_cache_is_kept_per_query(test_jira_backend, fake_jira_server):
+    test_jira_backend.get_tasks_by_board_id(board_id=1)
+    cache = test_jira_backend.issue_cache
+
+    assert cache.load("project = OTHER") is None
+    _, issues = cache.load("project = KTUI")
+    assert [issue["id"] for issue in issues] == [str(i) for i in range(1, 121)]
+    assert set(issues[0]["fields"]) == set(ISSUE_FIELDS)
+
+    test_jira_backend.settings.issue_cache_path = ""
+    assert test_jira_backend.issue_cache is None
+
+
+def test_issue_cache_created_once(test_jira_backend, fake_jira_server, monkeypatch):
+    cache = test_jira_backend.issue_cache
+    assert test_jira_backend.issue_cache is cache
+    test_jira_backend.get_tasks_by_board_id(board_id=1)
+
+    statements = []
+    create_connection = issue_cache_module.create_connection
+
+    @contextmanager
+    def traced_connection(database):
+        with create_connection(database=database) as con:
+            con.set_trace_callback(statements.append)
+            yield con
+
+    monkeypatch.setattr(issue_cache_module, "create_connection", traced_connection)
+    test_jira_backend.get_tasks_by_board_id(board_id=1)
+    assert test_jira_backend.issue_cache is cache
+    assert statements
+    assert not any("CREATE TABLE" in statement for statement in statements)
+
+    # a changed base url gets its own cache
+    test_jira_backend.settings.base_url = "http://localhost:8081"
+    assert test_jira_backend.issue_cache is not cache
@@ -1,26 +1,46 @@
+import gzip
+import json
 import sqlite3
 from pathlib import Path
 
 import pytest
 
 from kanban_tui.backends.sqlite.database import (
+    TASK_SORT_KEY_GAP,
     create_new_category_db,
     create_new_task_db,
+    create_new_tasks_db,
     get_all_categories_db,
     get_category_by_id_db,
     get_all_columns_on_board_db,
     init_new_db,
     create_connection,
+    open_connection_pool,
+    close_connection_pool,
+    compact_audits_db,
+    row_fields,
     task_factory,
     board_factory,
     logevent_factory,
     board_info_factory,
     column_factory,
     create_new_board_db,
+    create_task_dependency_db,
+    delete_task_db,
+    get_blocked_by_closure_db,
+    get_cycle_creating_dependencies_db,
+    would_create_cycle,
     get_all_boards_db,
+    get_filtered_event_count_db,
+    get_filtered_event_summaries_db,
+    get_filtered_events_db,
+    get_all_tasks_on_board_db,
+    get_task_by_id_db,
+    get_tasks_by_ids_db,
     get_task_by_column_db,
     move_task_position_db,
     update_task_status_db,
+    update_tasks_status_db,
 )
 from kanban_tui.config import TaskAppendModes
 from kanban_tui.classes.task import Task
@@ -76,6 +96,35 @@ def test_logevent_factory(test_app, test_database_path):
         assert row.event_type == "CREATE"
 
 
+def test_factories_match_validated_models(test_app, test_database_path):
+    with create_connection(database=test_database_path) as con:
+        for factory, model, table in (
+            (task_factory, Task, "tasks"),
+            (column_factory, Column, "columns"),
+            (board_factory, Board, "boards"),
+            (logevent_factory, LogEvent, "audits"),
+        ):
+            con.row_factory = factory
+            for row in con.execute(f"SELECT * FROM {table}").fetchall():
+                # trusted rows must survive a validation round trip unchanged
+                assert model.model_validate(row.model_dump()) == row
+
+    tasks = get_all_tasks_on_board_db(board_id=1, database=test_database_path)
+    assert tasks == [Task.model_validate(task.model_dump()) for task in tasks]
+
+
+def test_row_fields_cached_per_cursor(test_app, test_database_path):
+    with create_connection(database=test_database_path) as con:
+        cursor = con.execute("SELECT task_id, title FROM tasks")
+        fields = row_fields(cursor)
+        assert fields == ("task_id", "title")
+        assert row_fields(cursor) is fields
+
+        # layout changes when the cursor executes another statement
+        cursor.execute("SELECT name FROM columns")
+        assert row_fields(cursor) == ("name",)
+
+
 def test_board_info_factory(test_app, test_database_path):
     info_str = """
     SELECT
@@ -393,3 +442,448 @@ def test_update_task_status_inserts_at_target_position(test_database_path):
         task_a1.task_id,
         task_b2.task_id,
     ]
+
+
+def test_connection_pool_reuses_connection(test_database_path):
+    init_new_db(database=test_database_path)
+    open_connection_pool(database=test_database_path)
+    try:
+        with create_connection(database=test_database_path) as con:
+            con.row_factory = task_factory
+            first_con = con
+        with create_connection(database=test_database_path) as con:
+            assert con is first_con
+            # row factory and open transactions do not leak between callers
+            assert con.row_factory is None
+            assert not con.in_transaction
+    finally:
+        close_connection_pool(database=test_database_path)
+
+    with create_connection(database=test_database_path) as con:
+        assert con is not first_con
+
+
+def test_connection_pool_rolls_back_failed_transaction(test_database_path):
+    init_new_db(database=test_database_path)
+    open_connection_pool(database=test_database_path)
+    try:
+        with (
+            pytest.raises(sqlite3.IntegrityError),
+            create_connection(database=test_database_path) as con,
+        ):
+            con.execute("INSERT INTO categories VALUES (NULL, 'red', '#FF0000')")
+            con.execute("INSERT INTO categories VALUES (NULL, '', '#FF0000')")
+
+        assert get_all_categories_db(database=test_database_path) == []
+    finally:
+        close_connection_pool(database=test_database_path)
+
+
+def test_connection_pool_nested_use_keeps_open_transaction(test_database_path):
+    init_new_db(database=test_database_path)
+    open_connection_pool(database=test_database_path)
+    try:
+        with create_connection(database=test_database_path) as con:
+            con.row_factory = task_factory
+            con.execute("INSERT INTO categories VALUES (NULL, 'red', '#FF0000')")
+
+            # helper running inside the caller's transaction
+            with create_connection(database=test_database_path) as inner_con:
+                assert inner_con is con
+                assert inner_con.row_factory is None
+                assert (
+                    inner_con.execute("SELECT COUNT(*) FROM categories").fetchone()[0]
+                    == 1
+                )
+
+            assert con.in_transaction
+            assert con.row_factory is task_factory
+            con.commit()
+
+        with create_connection(database=test_database_path) as con:
+            assert con.row_factory is None
+        assert [
+            category.name
+            for category in get_all_categories_db(database=test_database_path)
+        ] == ["red"]
+    finally:
+        close_connection_pool(database=test_database_path)
+
+
+def test_connection_pool_shared_between_users(test_database_path):
+    init_new_db(database=test_database_path)
+    pool = open_connection_pool(database=test_database_path)
+    assert open_connection_pool(database=test_database_path) is pool
+
+    close_connection_pool(database=test_database_path)
+    with create_connection(database=test_database_path) as con:
+        assert con is pool.get_connection()
+
+    close_connection_pool(database=test_database_path)
+    assert open_connection_pool(database=test_database_path) is not pool
+    close_connection_pool(database=test_database_path)
+
+
+def test_task_loaders_collect_dependencies(test_app, test_database_path):
+    # task 4 on board 1 depends on 1 and 2, task 5 depends on 4
+    # task 6 on a second board depends on task 1
+    other_board = create_new_board_db(
+        name="Other Board", icon=":books:", database=test_database_path
+    )
+    other_column = get_all_columns_on_board_db(
+        board_id=other_board.board_id, database=test_database_path
+    )[0].column_id
+    create_new_task_db(
+        title="Other Task", column=other_column, database=test_database_path
+    )
+    for task_id, depends_on_task_id in [(4, 2), (4, 1), (5, 4), (6, 1)]:
+        create_task_dependency_db(
+            task_id=task_id,
+            depends_on_task_id=depends_on_task_id,
+            database=test_database_path,
+        )
+
+    board_tasks = {
+        task.task_id: task
+        for task in get_all_tasks_on_board_db(board_id=1, database=test_database_path)
+    }
+    assert board_tasks[1].blocking == [4, 6]
+    assert board_tasks[2].blocking == [4]
+    assert board_tasks[3].blocked_by == board_tasks[3].blocking == []
+    assert board_tasks[4].blocked_by == [1, 2]
+    assert board_tasks[4].blocking == [5]
+    assert board_tasks[5].blocked_by == [4]
+
+    tasks_by_ids = get_tasks_by_ids_db(task_ids=[6, 4], database=test_database_path)
+    assert [task.task_id for task in tasks_by_ids] == [6, 4]
+    assert tasks_by_ids[0].blocked_by == [1]
+    assert tasks_by_ids[1].blocked_by == [1, 2]
+    assert tasks_by_ids[1].blocking == [5]
+
+    column_tasks = get_task_by_column_db(column_id=1, database=test_database_path)
+    assert [task.blocking for task in column_tasks] == [[4, 6], [4], []]
+
+    # single task loaders keep returning the same lists
+    assert get_task_by_id_db(task_id=4, database=test_database_path) == board_tasks[4]
+
+
+def test_dependency_closure_follows_deep_chains(test_app, test_database_path):
+    # chain of 300 tasks, each task depends on the task created before it
+    chain = [
+        create_new_task_db(
+            title=f"Chain {i}", column=1, database=test_database_path
+        ).task_id
+        for i in range(300)
+    ]
+    with create_connection(database=test_database_path) as con:
+        con.executemany(
+            "INSERT INTO dependencies VALUES (NULL, ?, ?)",
+            zip(chain[1:], chain[:-1]),
+        )
+        # side branch, task 2 also blocks the middle of the chain
+        con.execute("INSERT INTO dependencies VALUES (NULL, ?, 2)", (chain[150],))
+        con.commit()
+
+    assert (
+        get_blocked_by_closure_db(task_id=chain[0], database=test_database_path) == []
+    )
+    assert get_blocked_by_closure_db(
+        task_id=chain[-1], database=test_database_path
+    ) == sorted([2, *chain[:-1]])
+
+    assert would_create_cycle(chain[0], chain[-1], database=test_database_path)
+    assert would_create_cycle(2, chain[-1], database=test_database_path)
+    assert would_create_cycle(chain[0], chain[0], database=test_database_path)
+    assert not would_create_cycle(chain[-1], chain[0], database=test_database_path)
+    assert not would_create_cycle(chain[0], 2, database=test_database_path)
+
+    assert get_cycle_creating_dependencies_db(
+        task_id=chain[100],
+        depends_on_task_ids=[chain[50], chain[100], chain[200], 2, 3],
+        database=test_database_path,
+    ) == [chain[100], chain[200]]
+
+
+def test_dependency_closure_terminates_on_existing_cycles(test_app, test_database_path):
+    # cycle 1 -> 2 -> 3 -> 1 inserted without the cycle check
+    with create_connection(database=test_database_path) as con:
+        con.executemany(
+            "INSERT INTO dependencies VALUES (NULL, ?, ?)", [(1, 2), (2, 3), (3, 1)]
+        )
+        con.commit()
+
+    assert get_blocked_by_closure_db(task_id=1, database=test_database_path) == [
+        1,
+        2,
+        3,
+    ]
+    assert would_create_cycle(4, 1, database=test_database_path) is False
+    assert would_create_cycle(1, 3, database=test_database_path)
+
+
+def test_create_new_tasks_is_atomic(test_app, test_database_path):
+    new_tasks = create_new_tasks_db(
+        tasks=[
+            {"title": "Bulk 1", "column": 1, "blocked_by": [1, 1, 2]},
+            {"title": "Bulk 2", "column": 2, "metadata": {"source": "import"}},
+        ],
+        database=test_database_path,
+    )
+    assert [task.task_id for task in new_tasks] == [6, 7]
+    assert new_tasks[0].blocked_by == [1, 2]
+    assert new_tasks[1].metadata == {"source": "import"}
+
+    # an unknown dependency rolls back all tasks of the batch
+    with pytest.raises(sqlite3.IntegrityError):
+        create_new_tasks_db(
+            tasks=[
+                {"title": "Bulk 3", "column": 1},
+                {"title": "Bulk 4", "column": 1, "blocked_by": [99]},
+            ],
+            database=test_database_path,
+        )
+    assert len(get_all_tasks_on_board_db(board_id=1, database=test_database_path)) == 7
+
+
+def test_create_new_tasks_with_non_contiguous_ids(test_app, test_database_path):
+    # a trigger inserting extra rows leaves gaps between the new task ids
+    with create_connection(database=test_database_path) as con:
+        con.execute(
+            """
+            CREATE TRIGGER spawn_side_task AFTER INSERT ON tasks
+            WHEN NEW.title = 'Bulk 1'
+            BEGIN
+                INSERT INTO tasks (title, column, creation_date, sort_key)
+                VALUES ('Side', NEW.column, NEW.creation_date, -1);
+            END
+            """
+        )
+        con.commit()
+
+    new_tasks = create_new_tasks_db(
+        tasks=[
+            {"title": "Bulk 1", "column": 1, "blocked_by": [1]},
+            {"title": "Bulk 2", "column": 1, "blocked_by": [2]},
+        ],
+        database=test_database_path,
+    )
+    assert [task.title for task in new_tasks] == ["Bulk 1", "Bulk 2"]
+    assert [task.task_id for task in new_tasks] == [6, 8]
+    assert [task.blocked_by for task in new_tasks] == [[1], [2]]
+
+
+def test_get_tasks_by_ids_positions_match_column_order(test_app, test_database_path):
+    create_new_task_db(title="Task 6", column=1, database=test_database_path)
+    move_task_position_db(task_id=6, target_position=0, database=test_database_path)
+
+    column_positions = {
+        task.task_id: task.position
+        for column_id in (1, 2, 3)
+        for task in get_task_by_column_db(
+            column_id=column_id, database=test_database_path
+        )
+    }
+    tasks = get_tasks_by_ids_db(task_ids=[5, 3, 6, 1], database=test_database_path)
+    assert [task.task_id for task in tasks] == [5, 3, 6, 1]
+    assert [task.position for task in tasks] == [
+        column_positions[task_id] for task_id in (5, 3, 6, 1)
+    ]
+    assert tasks[2].position == 0
+
+
+def test_update_tasks_status_renumbers_affected_columns(test_app, test_database_path):
+    tasks = get_tasks_by_ids_db(task_ids=[2, 4, 1], database=test_database_path)
+    for task in tasks:
+        task.column = 3
+    tasks[1].description = "not written by status updates"
+
+    moved_tasks = update_tasks_status_db(
+        tasks=tasks, append_mode=TaskAppendModes.BOTTOM, database=test_database_path
+    )
+    assert [task.task_id for task in moved_tasks] == [2, 4, 1]
+    assert moved_tasks[1].description == "Hallo"
+
+    positions = {
+        column_id: [
+            (task.task_id, task.position)
+            for task in get_task_by_column_db(
+                column_id=column_id, database=test_database_path
+            )
+        ]
+        for column_id in (1, 2, 3)
+    }
+    assert positions == {
+        1: [(3, 0)],
+        2: [],
+        3: [(5, 0), (2, 1), (4, 2), (1, 3)],
+    }
+
+
+def _sort_keys(database: str, column_id: int) -> dict[int, int]:
+    with create_connection(database=database) as con:
+        return dict(
+            con.execute(
+                "SELECT task_id, sort_key FROM tasks WHERE column = ?", (column_id,)
+            ).fetchall()
+        )
+
+
+def test_task_moves_only_write_the_moved_task(test_app, test_database_path):
+    keys_column_1 = _sort_keys(test_database_path, 1)
+    keys_column_2 = _sort_keys(test_database_path, 2)
+
+    moved_task = move_task_position_db(
+        task_id=3, target_position=1, database=test_database_path
+    )
+    assert moved_task.position == 1
+    assert [
+        (task.task_id, task.position)
+        for task in get_task_by_column_db(column_id=1, database=test_database_path)
+    ] == [(1, 0), (3, 1), (2, 2)]
+    new_keys = _sort_keys(test_database_path, 1)
+    assert {
+        task_id for task_id in new_keys if new_keys[task_id] != keys_column_1[task_id]
+    } == {3}
+
+    task = get_task_by_id_db(task_id=1, database=test_database_path)
+    task.column = 2
+    moved_task = update_task_status_db(
+        task=task, target_position=1, database=test_database_path
+    )
+    assert moved_task.position == 1
+    assert _sort_keys(test_database_path, 2) == {
+        **keys_column_2,
+        1: keys_column_2[4] + TASK_SORT_KEY_GAP,
+    }
+
+    delete_task_db(task_id=3, database=test_database_path)
+    assert [
+        (task.task_id, task.position)
+        for task in get_task_by_column_db(column_id=1, database=test_database_path)
+    ] == [(2, 0)]
+
+
+def test_task_moves_rebalance_exhausted_gaps(test_app, test_database_path):
+    # Keep putting tasks between the first two tasks until the gap is used up
+    for task_id in range(6, 46):
+        create_new_task_db(
+            title=f"Task {task_id}", column=1, database=test_database_path
+        )
+        move_task_position_db(
+            task_id=task_id, target_position=1, database=test_database_path
+        )
+
+    tasks = get_task_by_column_db(column_id=1, database=test_database_path)
+    assert [task.task_id for task in tasks] == [1, *range(45, 5, -1), 2, 3]
+    assert [task.position for task in tasks] == list(range(len(tasks)))
+    keys = [_sort_keys(test_database_path, 1)[task.task_id] for task in tasks]
+    assert keys == sorted(set(keys))
+
+
+def test_filtered_events_pages(test_app, test_database_path):
+    all_events = get_filtered_events_db(database=test_database_path)
+    event_ids = [event.event_id for event in all_events]
+    assert event_ids == sorted(event_ids, reverse=True)
+
+    pages = []
+    before_event_id = None
+    while page := get_filtered_events_db(
+        database=test_database_path, before_event_id=before_event_id, limit=5
+    ):
+        pages.append(page)
+        before_event_id = page[-1].event_id
+    assert [len(page) for page in pages] == [5, 5, 5, 1]
+    assert [event for page in pages for event in page] == all_events
+
+
+def test_filtered_event_count(test_app, test_database_path):
+    task_filter = {
+        "events": ["CREATE", "UPDATE", "DELETE"],
+        "objects": ["task"],
+        "time": "1970-01-01 00:00:00",
+    }
+    task_events = get_filtered_events_db(
+        database=test_database_path, filter=task_filter, limit=2
+    )
+    assert [event.object_type for event in task_events] == ["task", "task"]
+    assert (
+        get_filtered_event_count_db(database=test_database_path, filter=task_filter)
+        == 5
+    )
+    # includes the category events
+    assert get_filtered_event_count_db(database=test_database_path) == 16
+
+
+def test_compact_audits_by_rows(test_app, test_database_path, tmp_path):
+    all_events = get_filtered_events_db(database=test_database_path)
+    compaction = compact_audits_db(
+        max_rows=4,
+        archive_dir=tmp_path.as_posix(),
+        batch_size=5,
+        database=test_database_path,
+    )
+    assert compaction.compacted_events == 12
+    assert len(compaction.archive_files) == 3
+
+    assert get_filtered_events_db(database=test_database_path) == all_events[:4]
+    summaries = get_filtered_event_summaries_db(database=test_database_path)
+    assert sum(summary.amount for summary in summaries) == 12
+    # compacted events are still counted
+    assert get_filtered_event_count_db(database=test_database_path) == 16
+
+    archived_ids = []
+    for archive_file in compaction.archive_files:
+        with gzip.open(archive_file, "rt", encoding="utf-8") as archive:
+            archived_ids.extend(json.loads(line)["event_id"] for line in archive)
+    assert archived_ids == sorted(event.event_id for event in all_events[4:])
+
+    # nothing left to compact
+    assert (
+        compact_audits_db(max_rows=4, database=test_database_path).compacted_events == 0
+    )
+
+
+def test_compact_audits_keeps_events_after_max_event_id(test_app, test_database_path):
+    all_events = get_filtered_events_db(database=test_database_path)
+    max_event_id = all_events[8].event_id
+
+    compaction = compact_audits_db(
+        max_rows=4, max_event_id=max_event_id, database=test_database_path
+    )
+    # events are returned newest first
+    assert compaction.compacted_events == 8
+    assert get_filtered_events_db(database=test_database_path) == all_events[:8]
+
+
+def test_compact_audits_by_age_keeps_latest_event(test_app, test_database_path):
+    with create_connection(database=test_database_path) as con:
+        con.execute("UPDATE audits SET event_timestamp = '2020-01-01 12:00:00'")
+        con.commit()
+    latest_event_id = test_app.backend.get_latest_event_id()
+
+    compaction = compact_audits_db(max_age_days=30, database=test_database_path)
+    assert compaction.compacted_events == 15
+    assert compaction.archive_files == []
+
+    remaining_events = get_filtered_events_db(database=test_database_path)
+    assert [event.event_id for event in remaining_events] == [latest_event_id]
+
+    summaries = get_filtered_event_summaries_db(database=test_database_path)
+    assert {summary.summary_date.date().isoformat() for summary in summaries} == {
+        "2020-01-01"
+    }
+    task_filter = {
+        "events": ["CREATE", "UPDATE", "DELETE"],
+        "objects": ["task"],
+        "time": "1970-01-01 00:00:00",
+    }
+    assert (
+        get_filtered_event_count_db(database=test_database_path, filter=task_filter)
+        == 5
+    )
+    # summaries are filtered by their date
+    task_filter["time"] = "2021-01-01 00:00:00"
+    assert (
+        get_filtered_event_summaries_db(database=test_database_path, filter=task_filter)
+        == []
+    )
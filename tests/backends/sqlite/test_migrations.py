@@ -1,7 +1,122 @@
-from kanban_tui.backends.sqlite.database import get_schema_version
+from kanban_tui.backends.sqlite.database import (
+    create_connection,
+    get_schema_version,
+    init_new_db,
+    run_migrations,
+)
 from kanban_tui.backends.sqlite.migrations import CURRENT_SCHEMA_VERSION
 
 
 def test_migration_schema_version_latest(test_app, test_database_path):
     database_schema_version = get_schema_version(test_database_path)
     assert database_schema_version == CURRENT_SCHEMA_VERSION
+
+
+def test_migration_v4_to_v5_creates_indexes(test_database_path):
+    init_new_db(database=test_database_path)
+    index_query = "SELECT name FROM sqlite_master WHERE type = 'index'"
+    with create_connection(database=test_database_path) as con:
+        indexes = {row[0] for row in con.execute(index_query).fetchall()}
+        assert {
+            "idx_tasks_column_sort_key",
+            "idx_columns_board_id_position",
+            "idx_dependencies_depends_on_task_id",
+            "idx_audits_event_timestamp",
+        } <= indexes
+
+        # Downgrade to v4
+        for index in indexes:
+            if index.startswith("idx_"):
+                con.execute(f"DROP INDEX {index}")
+        con.execute("ALTER TABLE tasks RENAME COLUMN sort_key TO position")
+        con.execute("DELETE FROM schema_versions WHERE version >= 5")
+        con.commit()
+
+    assert get_schema_version(test_database_path) == 4
+    run_migrations(test_database_path)
+    assert get_schema_version(test_database_path) == CURRENT_SCHEMA_VERSION
+
+    with create_connection(database=test_database_path) as con:
+        assert indexes == {row[0] for row in con.execute(index_query).fetchall()}
+
+
+def test_migration_v5_to_v6_audits_board_changes(test_app, test_database_path):
+    backend = test_app.backend
+    latest_event_id = backend.get_latest_event_id()
+
+    backend.update_task_entry(
+        task_id=1, title="Task_ready_0", description="Hallo", category=2, due_date=None
+    )
+    backend.create_task_dependency(task_id=2, depends_on_task_id=1)
+    backend.update_column_visibility(column_id=4, visible=True)
+    backend.update_category(category_id=1, name="red", color="#AA0000")
+
+    changes = [
+        (event.object_type, event.object_id, event.object_field)
+        for event in backend.get_changes_since(latest_event_id)
+    ]
+    assert changes == [
+        ("task", 1, "category"),
+        ("task", 2, "blocked_by"),
+        ("column", 4, "visible"),
+        ("category", 1, "color"),
+    ]
+
+
+def test_migration_v6_to_v7_spreads_task_sort_keys(test_app, test_database_path):
+    # Downgrade to v6 with dense positions, task 2 placed before task 1
+    with create_connection(database=test_database_path) as con:
+        con.execute("DROP INDEX idx_tasks_column_sort_key")
+        con.execute("ALTER TABLE tasks RENAME COLUMN sort_key TO position")
+        con.execute(
+            """
+            CREATE INDEX idx_tasks_column_position ON tasks("column", position)
+            """
+        )
+        con.execute(
+            "UPDATE tasks SET position = CASE task_id WHEN 1 THEN 1 WHEN 2 THEN 0 "
+            "WHEN 3 THEN 2 ELSE 0 END"
+        )
+        con.execute("DELETE FROM schema_versions WHERE version >= 7")
+        con.commit()
+    assert get_schema_version(test_database_path) == 6
+
+    run_migrations(test_database_path)
+    assert get_schema_version(test_database_path) == CURRENT_SCHEMA_VERSION
+
+    with create_connection(database=test_database_path) as con:
+        sort_keys = con.execute(
+            "SELECT task_id, sort_key FROM tasks WHERE column = 1 ORDER BY sort_key"
+        ).fetchall()
+        indexes = {
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+            )
+        }
+    assert sort_keys == [(2, 0), (1, 65536), (3, 131072)]
+    assert "idx_tasks_column_sort_key" in indexes
+    assert "idx_tasks_column_position" not in indexes
+
+    tasks = test_app.backend.get_tasks_by_column(column_id=1)
+    assert [(task.task_id, task.position) for task in tasks] == [(2, 0), (1, 1), (3, 2)]
+
+
+def test_migration_v7_to_v8_creates_audit_summaries(test_app, test_database_path):
+    with create_connection(database=test_database_path) as con:
+        con.execute("DROP TABLE audit_summaries")
+        con.execute("DELETE FROM schema_versions WHERE version >= 8")
+        con.commit()
+    assert get_schema_version(test_database_path) == 7
+
+    run_migrations(test_database_path)
+    assert get_schema_version(test_database_path) == CURRENT_SCHEMA_VERSION
+
+    with create_connection(database=test_database_path) as con:
+        tables = {
+            row[0]
+            for row in con.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
+    assert "audit_summaries" in tables
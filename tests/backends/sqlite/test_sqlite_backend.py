@@ -1,5 +1,9 @@
-from kanban_tui.config import Settings
+import threading
+
+from kanban_tui.config import JournalModes, Settings, SynchronousModes
+from kanban_tui.backends.sqlite import backend as sqlite_backend
 from kanban_tui.backends.sqlite.backend import SqliteBackend
+from kanban_tui.backends.sqlite.database import _CONNECTION_POOLS, create_connection
 
 
 def test_sqlite_backend(test_config: Settings, test_app):
@@ -7,3 +11,214 @@ def test_sqlite_backend(test_config: Settings, test_app):
     boards = SqliteBackend(settings).get_boards()
 
     assert len(boards) == 1
+
+
+def test_sqlite_backend_close_releases_pool(test_config: Settings):
+    settings = test_config.backend.sqlite_settings
+    backend = SqliteBackend(settings)
+    assert settings.database_path in _CONNECTION_POOLS
+
+    backend.close()
+    backend.close()
+    assert settings.database_path not in _CONNECTION_POOLS
+    assert len(backend.get_boards()) == 0
+
+
+def test_sqlite_backend_applies_performance_profile(test_config: Settings):
+    settings = test_config.backend.sqlite_settings
+    settings.performance.busy_timeout = 1234
+    settings.performance.synchronous = SynchronousModes.FULL
+    backend = SqliteBackend(settings)
+
+    with create_connection(database=settings.database_path) as con:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert con.execute("PRAGMA busy_timeout").fetchone()[0] == 1234
+        # FULL == 2
+        assert con.execute("PRAGMA synchronous").fetchone()[0] == 2
+        assert con.execute("PRAGMA cache_size").fetchone()[0] == -16000
+    backend.close()
+
+
+def test_migration_runner_switches_journal_mode(test_config: Settings):
+    settings = test_config.backend.sqlite_settings
+    settings.performance.journal_mode = JournalModes.DELETE
+    SqliteBackend(settings).close()
+    with create_connection(database=settings.database_path) as con:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "delete"
+
+    # existing database is switched on the next start
+    settings.performance.journal_mode = JournalModes.WAL
+    SqliteBackend(settings).close()
+    with create_connection(database=settings.database_path) as con:
+        assert con.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+
+def test_category_map_invalidated_on_changes(test_config: Settings, monkeypatch):
+    settings = test_config.backend.sqlite_settings
+    backend = SqliteBackend(settings)
+    red = backend.create_new_category(name="red", color="#FF0000")
+
+    loads = []
+    original_loader = sqlite_backend.get_all_categories_db
+    monkeypatch.setattr(
+        sqlite_backend,
+        "get_all_categories_db",
+        lambda database: loads.append(database) or original_loader(database=database),
+    )
+
+    assert backend.get_category_by_id(red.category_id) == red
+    assert backend.get_category_by_id(red.category_id) == red
+    assert backend.get_all_categories() == [red]
+    assert backend.get_all_categories() == [red]
+    assert len(loads) == 1
+
+    backend.update_category(red.category_id, name="dark red", color="#8B0000")
+    assert backend.get_category_by_id(red.category_id).name == "dark red"
+    assert len(loads) == 2
+
+    blue = backend.create_new_category(name="blue", color="#0000FF")
+    assert backend.category_map.keys() == {red.category_id, blue.category_id}
+    assert len(loads) == 3
+
+    backend.delete_category(blue.category_id)
+    assert backend.get_category_by_id(blue.category_id) is None
+    backend.close()
+
+
+def test_missing_category_reloads_once(test_config: Settings, monkeypatch):
+    settings = test_config.backend.sqlite_settings
+    backend = SqliteBackend(settings)
+    other_backend = SqliteBackend(settings)
+    assert backend.category_map == {}
+
+    loads = []
+    original_loader = sqlite_backend.get_all_categories_db
+    monkeypatch.setattr(
+        sqlite_backend,
+        "get_all_categories_db",
+        lambda database: loads.append(database) or original_loader(database=database),
+    )
+
+    # e.g. one lookup per card of tasks referencing a deleted category
+    for _ in range(5):
+        assert backend.get_category_by_id(42) is None
+    assert len(loads) == 1
+
+    # other unknown ids still trigger a reload
+    green = other_backend.create_new_category(name="green", color="#00FF00")
+    assert backend.get_category_by_id(green.category_id) == green
+    assert len(loads) == 2
+
+    # misses are retried after the cache is cleared on the next refresh
+    backend.clear_cache()
+    assert backend.get_category_by_id(42) is None
+    assert len(loads) == 3
+    other_backend.close()
+    backend.close()
+
+
+def test_clear_cache_waits_for_running_category_load(
+    test_config: Settings, monkeypatch
+):
+    settings = test_config.backend.sqlite_settings
+    backend = SqliteBackend(settings)
+    other_backend = SqliteBackend(settings)
+
+    loading = threading.Event()
+    release = threading.Event()
+    original_loader = sqlite_backend.get_all_categories_db
+
+    def slow_loader(database):
+        categories = original_loader(database=database)
+        loading.set()
+        release.wait(timeout=5)
+        return categories
+
+    monkeypatch.setattr(sqlite_backend, "get_all_categories_db", slow_loader)
+    # e.g. the I/O thread filling the cache while the app clears it
+    loader = threading.Thread(target=lambda: backend.category_map)
+    loader.start()
+    assert loading.wait(timeout=5)
+
+    green = other_backend.create_new_category(name="green", color="#00FF00")
+    clearer = threading.Thread(target=backend.clear_cache)
+    clearer.start()
+    clearer.join(timeout=0.2)
+    release.set()
+    loader.join()
+    clearer.join()
+
+    # the stale load did not outlive the clear
+    assert green.category_id in backend.category_map
+    other_backend.close()
+    backend.close()
+
+
+def test_category_created_by_other_process_is_found(test_config: Settings):
+    settings = test_config.backend.sqlite_settings
+    backend = SqliteBackend(settings)
+    other_backend = SqliteBackend(settings)
+    assert backend.category_map == {}
+
+    green = other_backend.create_new_category(name="green", color="#00FF00")
+    assert backend.get_category_by_id(green.category_id) == green
+    other_backend.close()
+    backend.close()
+
+
+def test_get_changes_since(test_config: Settings):
+    settings = test_config.backend.sqlite_settings
+    backend = SqliteBackend(settings)
+    assert backend.get_latest_event_id() == 0
+    assert backend.get_changes_since(0) == []
+
+    backend.create_new_board(name="Board", icon=":sparkles:")
+    latest_event_id = backend.get_latest_event_id()
+    assert latest_event_id > 0
+    assert backend.get_changes_since(latest_event_id) == []
+
+    task = backend.create_new_task(title="Task", description="", column=1)
+    backend.delete_task(task.task_id)
+    changes = backend.get_changes_since(latest_event_id)
+    assert [(event.event_type, event.object_id) for event in changes] == [
+        ("CREATE", task.task_id),
+        ("DELETE", task.task_id),
+    ]
+    assert changes[-1].event_id == backend.get_latest_event_id()
+
+    # changes compacted before they were picked up can not be told
+    backend.create_new_task(title="Other task", description="", column=1)
+    backend.compact_audits(max_rows=1)
+    assert backend.get_changes_since(latest_event_id) is None
+    assert backend.get_changes_since(backend.get_latest_event_id()) == []
+    backend.close()
+
+
+async def test_async_queries_run_on_io_thread(test_config: Settings, test_app):
+    backend = SqliteBackend(test_config.backend.sqlite_settings)
+    boards = backend.get_boards()
+    active_board = backend.active_board
+    columns = backend.get_columns()
+    tasks = backend.get_tasks_on_active_board()
+
+    threads = set()
+    get_boards = backend.get_boards
+
+    def recording_get_boards():
+        threads.add(threading.current_thread())
+        return get_boards()
+
+    backend.get_boards = recording_get_boards  # type: ignore[method-assign]
+
+    assert await backend.get_boards_async() == boards
+    assert await backend.get_active_board_async() == active_board
+    assert await backend.get_columns_async() == columns
+    assert await backend.get_tasks_on_active_board_async() == tasks
+    assert threads and threading.main_thread() not in threads
+
+    pages = backend.iter_task_pages_on_active_board()
+    assert await backend.get_next_task_page_async(pages) == tasks
+    assert await backend.get_next_task_page_async(pages) is None
+
+    backend.close()
+    assert backend._io_executor is None
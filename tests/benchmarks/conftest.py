@@ -0,0 +1,19 @@
+import time
+from collections.abc import Callable
+
+import pytest
+
+
+@pytest.fixture
+def measure() -> Callable[..., float]:
+    """Returns the best wall time in seconds out of `repeat` runs"""
+
+    def _measure(func: Callable, *args, repeat: int = 5, **kwargs) -> float:
+        timings = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func(*args, **kwargs)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+
+    return _measure
@@ -0,0 +1,56 @@
+import datetime
+
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    create_connection,
+    get_filtered_event_count_db,
+    get_filtered_events_db,
+    init_new_db,
+)
+
+AMOUNT_EVENTS = 200_000
+PAGE_SIZE = 200
+LOG_FILTER = {
+    "events": ["CREATE", "UPDATE", "DELETE"],
+    "objects": ["board", "column", "task"],
+    "time": datetime.datetime(1970, 1, 1),
+}
+
+
+def _load_first_page(database: str):
+    get_filtered_events_db(database=database, filter=LOG_FILTER, limit=PAGE_SIZE)
+
+
+@pytest.mark.benchmark
+def test_audit_log_first_page(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    start = datetime.datetime(2020, 1, 1)
+    with create_connection(database=test_database_path) as con:
+        con.executemany(
+            """
+            INSERT INTO audits (event_timestamp, event_type, object_type, object_id, object_field)
+            VALUES (?, 'UPDATE', 'task', ?, 'title')
+            """,
+            (
+                (start + datetime.timedelta(minutes=i), i % 1000)
+                for i in range(AMOUNT_EVENTS)
+            ),
+        )
+        con.commit()
+
+    full = measure(
+        get_filtered_events_db, database=test_database_path, filter=LOG_FILTER, repeat=3
+    )
+    first_page = measure(_load_first_page, test_database_path, repeat=3)
+    count = measure(
+        get_filtered_event_count_db,
+        database=test_database_path,
+        filter=LOG_FILTER,
+        repeat=3,
+    )
+    print(
+        f"\n{AMOUNT_EVENTS} audit events: all={full * 1000:.1f}ms "
+        f"first page={first_page * 1000:.1f}ms count={count * 1000:.1f}ms"
+    )
+    assert first_page < full
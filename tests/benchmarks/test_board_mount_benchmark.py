@@ -0,0 +1,53 @@
+import time
+
+import pytest
+from textual.widgets import Markdown
+
+from kanban_tui.app import KanbanTui
+from tests.worker_helpers import wait_for_workers
+
+AMOUNT_TASKS = 40
+APP_SIZE = (150, 50)
+DESCRIPTION = "\n".join(
+    f"## Step {idx}\n\n- [ ] check `item_{idx}`\n- **bold** and _italic_ text\n"
+    for idx in range(10)
+)
+
+
+async def _mount_board(app: KanbanTui) -> tuple[float, int]:
+    start = time.perf_counter()
+    async with app.run_test(size=APP_SIZE) as pilot:
+        await wait_for_workers(app)
+        await pilot.pause()
+        elapsed = time.perf_counter() - start
+        return elapsed, len(app.screen.query(Markdown))
+
+
+@pytest.mark.benchmark
+async def test_board_mount_with_long_descriptions(
+    no_task_app: KanbanTui, test_config_path, test_database_path
+):
+    no_task_app.backend.create_new_tasks(
+        [
+            {"title": f"Task {idx}", "column": idx % 3 + 1, "description": DESCRIPTION}
+            for idx in range(AMOUNT_TASKS)
+        ]
+    )
+
+    no_task_app.config.task.always_expanded = True
+    expanded, expanded_descriptions = await _mount_board(no_task_app)
+
+    lazy_app = KanbanTui(config_path=test_config_path, database_path=test_database_path)
+    lazy_app.config.task.always_expanded = False
+    lazy, lazy_descriptions = await _mount_board(lazy_app)
+    lazy_app.backend.close()
+
+    print(
+        f"\n{AMOUNT_TASKS} tasks with long descriptions: "
+        f"always expanded={expanded * 1000:.0f}ms ({expanded_descriptions} parsed) "
+        f"lazy={lazy * 1000:.0f}ms ({lazy_descriptions} parsed)"
+    )
+    assert expanded_descriptions == AMOUNT_TASKS
+    # only the focused card shows its description
+    assert lazy_descriptions == 1
+    assert lazy < expanded
@@ -0,0 +1,52 @@
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    create_new_board_db,
+    create_new_task_db,
+    create_new_tasks_db,
+    create_task_dependency_db,
+    get_all_tasks_on_board_db,
+    init_new_db,
+)
+
+AMOUNT_TASKS = 500
+
+
+def _create_one_by_one(database: str):
+    previous = create_new_task_db(title="Task 0", column=1, database=database)
+    for i in range(1, AMOUNT_TASKS):
+        new_task = create_new_task_db(title=f"Task {i}", column=1, database=database)
+        create_task_dependency_db(
+            task_id=new_task.task_id,
+            depends_on_task_id=previous.task_id,
+            database=database,
+        )
+
+
+def _create_bulk(database: str):
+    # every task depends on the first task created by the one by one run
+    create_new_tasks_db(
+        tasks=[
+            {"title": f"Task {i}", "column": 1, "blocked_by": [1]}
+            for i in range(AMOUNT_TASKS)
+        ],
+        database=database,
+    )
+
+
+@pytest.mark.benchmark
+def test_bulk_task_creation(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    create_new_board_db(name="Bulk", icon=":rocket:", database=test_database_path)
+
+    one_by_one = measure(_create_one_by_one, test_database_path, repeat=1)
+    bulk = measure(_create_bulk, test_database_path, repeat=1)
+    tasks = get_all_tasks_on_board_db(board_id=1, database=test_database_path)
+    assert len(tasks) == 2 * AMOUNT_TASKS
+    assert [task.position for task in tasks] == list(range(2 * AMOUNT_TASKS))
+
+    print(
+        f"\n{AMOUNT_TASKS} tasks with dependency: one_by_one={one_by_one * 1000:.1f}ms "
+        f"bulk={bulk * 1000:.1f}ms"
+    )
+    assert bulk < one_by_one
@@ -0,0 +1,70 @@
+import datetime
+
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    create_connection,
+    create_new_board_db,
+    get_task_by_column_db,
+    init_new_db,
+    update_task_status_db,
+    update_tasks_status_db,
+)
+from kanban_tui.config import TaskAppendModes
+
+AMOUNT_TASKS = 2_000
+AMOUNT_MOVED = 500
+
+
+def _move_one_by_one(database: str, target_column: int):
+    for task in get_task_by_column_db(column_id=1, database=database)[:AMOUNT_MOVED]:
+        task.column = target_column
+        update_task_status_db(
+            task=task, append_mode=TaskAppendModes.BOTTOM, database=database
+        )
+
+
+def _move_bulk(database: str, target_column: int):
+    tasks = get_task_by_column_db(column_id=1, database=database)[:AMOUNT_MOVED]
+    for task in tasks:
+        task.column = target_column
+    update_tasks_status_db(
+        tasks=tasks, append_mode=TaskAppendModes.BOTTOM, database=database
+    )
+
+
+@pytest.mark.benchmark
+def test_bulk_task_move(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    create_new_board_db(name="Moves", icon=":rocket:", database=test_database_path)
+    now = datetime.datetime.now().replace(microsecond=0)
+    with create_connection(database=test_database_path) as con:
+        con.executemany(
+            """
+            INSERT INTO tasks (title, column, description, creation_date, sort_key)
+            VALUES (?, 1, '', ?, ?)
+            """,
+            ((f"Task {i}", now, i) for i in range(AMOUNT_TASKS)),
+        )
+        con.commit()
+
+    one_by_one = measure(_move_one_by_one, test_database_path, 2, repeat=1)
+    bulk = measure(_move_bulk, test_database_path, 3, repeat=1)
+    for column_id, amount in [(1, AMOUNT_TASKS - 2 * AMOUNT_MOVED), (2, AMOUNT_MOVED)]:
+        positions = [
+            task.position
+            for task in get_task_by_column_db(
+                column_id=column_id, database=test_database_path
+            )
+        ]
+        assert positions == list(range(amount))
+    assert [
+        task.title
+        for task in get_task_by_column_db(column_id=3, database=test_database_path)
+    ] == [f"Task {i}" for i in range(AMOUNT_MOVED, 2 * AMOUNT_MOVED)]
+
+    print(
+        f"\n{AMOUNT_MOVED} of {AMOUNT_TASKS} tasks moved: "
+        f"one_by_one={one_by_one * 1000:.1f}ms bulk={bulk * 1000:.1f}ms"
+    )
+    assert bulk < one_by_one
@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from kanban_tui.backends.claude.backend import ClaudeBackend
+from kanban_tui.config import ClaudeBackendSettings
+
+AMOUNT_TASKS = 2_000
+
+
+@pytest.mark.benchmark
+def test_claude_session_reload(tmp_path, measure):
+    session_path = tmp_path / "session"
+    session_path.mkdir()
+    for task_id in range(1, AMOUNT_TASKS + 1):
+        (session_path / f"{task_id}.json").write_text(
+            json.dumps(
+                {
+                    "id": str(task_id),
+                    "subject": f"Task {task_id}",
+                    "description": "Some description " * 20,
+                    "activeForm": f"Working on task {task_id}",
+                    "status": "pending",
+                    "blocks": [],
+                    "blockedBy": [str(task_id - 1)] if task_id > 1 else [],
+                }
+            )
+        )
+
+    settings = ClaudeBackendSettings(
+        tasks_base_path=tmp_path.as_posix(), active_session_id="session"
+    )
+
+    def full_scan():
+        # a fresh backend has to parse every file
+        ClaudeBackend(settings).get_tasks_on_active_board()
+
+    backend = ClaudeBackend(settings)
+    backend.get_tasks_on_active_board()
+
+    cold = measure(full_scan, repeat=3)
+    indexed = measure(backend.get_tasks_on_active_board, repeat=3)
+    print(
+        f"\n{AMOUNT_TASKS} task files: full_scan={cold * 1000:.1f}ms "
+        f"indexed={indexed * 1000:.1f}ms"
+    )
+    assert indexed < cold
@@ -0,0 +1,53 @@
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    close_connection_pool,
+    create_new_board_db,
+    create_new_task_db,
+    get_all_columns_on_board_db,
+    get_all_tasks_on_board_db,
+    get_category_by_id_db,
+    init_new_db,
+    open_connection_pool,
+)
+
+CALLS = 500
+
+
+def _board_refresh(board_id: int, database: str):
+    for _ in range(CALLS):
+        get_all_columns_on_board_db(board_id=board_id, database=database)
+        get_category_by_id_db(category_id=1, database=database)
+
+
+@pytest.mark.benchmark
+def test_pooled_connection_vs_fresh_connection(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    board = create_new_board_db(
+        name="Benchmark", icon=":zap:", database=test_database_path
+    )
+    column_id = get_all_columns_on_board_db(
+        board_id=board.board_id, database=test_database_path
+    )[0].column_id
+    for i in range(100):
+        create_new_task_db(
+            title=f"Task {i}", column=column_id, database=test_database_path
+        )
+
+    fresh = measure(_board_refresh, board.board_id, test_database_path)
+
+    open_connection_pool(database=test_database_path)
+    try:
+        pooled = measure(_board_refresh, board.board_id, test_database_path)
+        tasks = get_all_tasks_on_board_db(
+            board_id=board.board_id, database=test_database_path
+        )
+    finally:
+        close_connection_pool(database=test_database_path)
+
+    print(
+        f"\n{2 * CALLS} queries: fresh={fresh * 1000:.1f}ms pooled={pooled * 1000:.1f}ms"
+        f" speedup={fresh / pooled:.1f}x"
+    )
+    assert len(tasks) == 100
+    assert pooled < fresh
@@ -0,0 +1,82 @@
+import datetime
+
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    TASK_POSITION_WINDOW_STR,
+    create_connection,
+    create_new_board_db,
+    get_all_tasks_on_board_db,
+    init_new_db,
+    task_factory,
+)
+
+AMOUNT_TASKS = 10_000
+
+# Board query before dependencies were collected in a single pass
+CORRELATED_QUERY_STR = f"""
+SELECT
+    t.*,
+    {TASK_POSITION_WINDOW_STR},
+    COALESCE(
+        (SELECT json_group_array(d.depends_on_task_id)
+         FROM dependencies d
+         WHERE d.task_id = t.task_id),
+        '[]'
+    ) as blocked_by,
+    COALESCE(
+        (SELECT json_group_array(d.task_id)
+         FROM dependencies d
+         WHERE d.depends_on_task_id = t.task_id),
+        '[]'
+    ) as blocking
+FROM columns c
+INNER JOIN tasks t ON t.column = c.column_id
+WHERE c.board_id = :board_id
+ORDER BY c.position, t.sort_key, t.task_id
+;
+"""
+
+
+def _load_correlated(database: str) -> list:
+    with create_connection(database=database) as con:
+        con.row_factory = task_factory
+        return con.execute(CORRELATED_QUERY_STR, {"board_id": 1}).fetchall()
+
+
+@pytest.mark.benchmark
+def test_dependency_heavy_board_load(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    create_new_board_db(name="Deps", icon=":link:", database=test_database_path)
+    now = datetime.datetime.now().replace(microsecond=0)
+    with create_connection(database=test_database_path) as con:
+        con.executemany(
+            """
+            INSERT INTO tasks (title, column, description, creation_date, sort_key)
+            VALUES (?, 1, '', ?, ?)
+            """,
+            ((f"Task {i}", now, i) for i in range(AMOUNT_TASKS)),
+        )
+        # every task depends on the three tasks created before it
+        con.executemany(
+            "INSERT INTO dependencies VALUES (NULL, ?, ?)",
+            (
+                (task_id, task_id - offset)
+                for task_id in range(4, AMOUNT_TASKS + 1)
+                for offset in (1, 2, 3)
+            ),
+        )
+        con.commit()
+
+    assert _load_correlated(test_database_path) == get_all_tasks_on_board_db(
+        board_id=1, database=test_database_path
+    )
+
+    correlated = measure(_load_correlated, test_database_path, repeat=3)
+    single_pass = measure(
+        get_all_tasks_on_board_db, board_id=1, database=test_database_path, repeat=3
+    )
+    print(
+        f"\n{AMOUNT_TASKS} tasks: correlated={correlated * 1000:.1f}ms "
+        f"single_pass={single_pass * 1000:.1f}ms"
+    )
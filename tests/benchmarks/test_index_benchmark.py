@@ -0,0 +1,87 @@
+import datetime
+
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    create_connection,
+    create_new_board_db,
+    get_all_tasks_on_board_db,
+    get_filtered_events_db,
+    get_task_by_column_db,
+    init_new_db,
+    update_task_status_db,
+)
+
+INDEXES = [
+    "idx_tasks_column_sort_key",
+    "idx_columns_board_id_position",
+    "idx_dependencies_depends_on_task_id",
+    "idx_audits_event_timestamp",
+]
+SMALL_BOARD_TASKS = 50
+
+
+def _fill_database(database: str, amount_tasks: int):
+    """Board 1 holds `amount_tasks` tasks in its Archive, board 2 stays small"""
+    init_new_db(database=database)
+    create_new_board_db(name="Huge", icon=":whale:", database=database)
+    create_new_board_db(name="Small", icon=":mouse:", database=database)
+    now = datetime.datetime.now().replace(microsecond=0)
+    insert_str = """
+    INSERT INTO tasks (title, column, description, creation_date, sort_key)
+    VALUES (?, ?, '', ?, ?)
+    """
+    with create_connection(database=database) as con:
+        con.executemany(
+            insert_str,
+            ((f"Archived {i}", 4, now, i) for i in range(amount_tasks)),
+        )
+        con.executemany(
+            insert_str,
+            ((f"Small {i}", 5, now, i) for i in range(SMALL_BOARD_TASKS)),
+        )
+        con.executemany(
+            "INSERT INTO dependencies VALUES (NULL, ?, ?)",
+            ((i, i + 1) for i in range(1, amount_tasks, 2)),
+        )
+        # Only recent events should match the log filter
+        con.execute("UPDATE audits SET event_timestamp = '2020-01-01 00:00:00'")
+        con.commit()
+
+
+def _hot_paths(database: str):
+    get_all_tasks_on_board_db(board_id=2, database=database)
+    get_task_by_column_db(column_id=5, database=database)
+    task = get_all_tasks_on_board_db(board_id=2, database=database)[0]
+    task.column = 6 if task.column == 5 else 5
+    update_task_status_db(task=task, database=database)
+    get_filtered_events_db(
+        database=database,
+        filter={
+            "events": ["CREATE", "UPDATE", "DELETE"],
+            "objects": ["task", "board", "column"],
+            "time": datetime.datetime(2025, 1, 1),
+        },
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("amount_tasks", [1_000, 10_000, 100_000])
+def test_index_scaling(tmp_path, measure, amount_tasks):
+    database = (tmp_path / f"bench_{amount_tasks}.db").as_posix()
+    _fill_database(database, amount_tasks)
+
+    indexed = measure(_hot_paths, database)
+
+    with create_connection(database=database) as con:
+        for index in INDEXES:
+            con.execute(f"DROP INDEX {index}")
+        con.commit()
+    full_scan = measure(_hot_paths, database)
+
+    print(
+        f"\n{amount_tasks:>7} tasks: indexed={indexed * 1000:.1f}ms "
+        f"full_scan={full_scan * 1000:.1f}ms"
+    )
+    if amount_tasks >= 10_000:
+        assert indexed < full_scan
@@ -0,0 +1,42 @@
+import pytest
+
+from kanban_tui.backends.jira.jira_api import authenticate_to_jira, get_jql
+from tests.fake_jira_server import FakeJiraServer, make_issue
+
+AMOUNT_ISSUES = 200
+LATENCY = 0.02
+
+
+def _fetch_one_by_one(auth, issue_ids: list[int]) -> list[dict]:
+    # Fetch before batching, one full issue request per id
+    issues = []
+    for issue_id in issue_ids:
+        issues.extend(get_jql(auth, f'id = "{issue_id}"').get("issues", []))
+    return issues
+
+
+@pytest.mark.benchmark
+def test_get_tasks_by_ids(test_jira_backend, measure):
+    server = FakeJiraServer(
+        issues=[make_issue(issue_id) for issue_id in range(1, AMOUNT_ISSUES + 1)],
+        latency=LATENCY,
+    ).start()
+    test_jira_backend.auth = authenticate_to_jira(server.url, "", "")
+    test_jira_backend.settings.issue_cache_path = ""
+    issue_ids = list(range(1, AMOUNT_ISSUES + 1))
+
+    try:
+        assert len(test_jira_backend.get_tasks_by_ids(issue_ids)) == AMOUNT_ISSUES
+
+        sequential = measure(
+            _fetch_one_by_one, test_jira_backend.auth, issue_ids, repeat=1
+        )
+        batched = measure(test_jira_backend.get_tasks_by_ids, issue_ids, repeat=3)
+    finally:
+        server.stop()
+
+    print(
+        f"\n{AMOUNT_ISSUES} issues @ {LATENCY * 1000:.0f}ms latency: "
+        f"sequential={sequential * 1000:.1f}ms batched={batched * 1000:.1f}ms"
+    )
+    assert batched < sequential
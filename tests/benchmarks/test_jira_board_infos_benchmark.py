@@ -0,0 +1,61 @@
+import pytest
+
+from kanban_tui.backends.jira.jira_api import authenticate_to_jira
+from kanban_tui.config import JqlEntry
+from tests.fake_jira_server import FakeJiraServer, make_issue
+
+AMOUNT_BOARDS = 4
+AMOUNT_ISSUES = 2_000
+LATENCY = 0.02
+
+
+def _board_infos_from_tasks(backend) -> list[dict]:
+    # Board infos before the stats queries, every board loaded one after another
+    board_infos = []
+    for board in backend.get_boards():
+        board_tasks = backend.get_tasks_by_board_id(board_id=board.board_id)
+        board_infos.append(
+            {
+                "board_id": board.board_id,
+                "amount_tasks": len(board_tasks),
+                "next_due": min(
+                    (t.due_date for t in board_tasks if t.due_date), default=None
+                ),
+            }
+        )
+    return board_infos
+
+
+def _uncached_board_infos(backend) -> list[dict]:
+    backend.clear_cache()
+    return backend.get_board_infos()
+
+
+@pytest.mark.benchmark
+def test_board_infos(test_jira_backend, measure):
+    server = FakeJiraServer(
+        issues=[make_issue(issue_id) for issue_id in range(1, AMOUNT_ISSUES + 1)],
+        latency=LATENCY,
+        max_results_limit=100,
+    ).start()
+    test_jira_backend.auth = authenticate_to_jira(server.url, "", "")
+    test_jira_backend.settings.issue_cache_path = ""
+    test_jira_backend.settings.jqls = [
+        JqlEntry(id=board_id, name=f"Board {board_id}", jql=f"project = B{board_id}")
+        for board_id in range(1, AMOUNT_BOARDS + 1)
+    ]
+
+    try:
+        full_load = measure(_board_infos_from_tasks, test_jira_backend, repeat=1)
+        stats = measure(_uncached_board_infos, test_jira_backend, repeat=3)
+        cached = measure(test_jira_backend.get_board_infos, repeat=3)
+    finally:
+        server.stop()
+
+    print(
+        f"\n{AMOUNT_BOARDS} boards x {AMOUNT_ISSUES} issues @ {LATENCY * 1000:.0f}ms: "
+        f"full_load={full_load * 1000:.1f}ms stats={stats * 1000:.1f}ms "
+        f"cached={cached * 1000:.3f}ms"
+    )
+    assert stats < full_load
+    assert cached < stats
@@ -0,0 +1,54 @@
+from datetime import datetime
+
+import pytest
+
+from kanban_tui.backends.jira.jira_api import authenticate_to_jira
+from tests.fake_jira_server import FakeJiraServer, make_issue
+
+AMOUNT_ISSUES = 5_000
+AMOUNT_CHANGED = 20
+LATENCY = 0.02
+
+
+def _traffic(server: FakeJiraServer, func, *args) -> tuple[int, int]:
+    server.requests.clear()
+    server.bytes_sent = 0
+    func(*args)
+    return len(server.requests), server.bytes_sent
+
+
+@pytest.mark.benchmark
+def test_refresh_large_jql_board(test_jira_backend, measure):
+    server = FakeJiraServer(
+        issues=[make_issue(issue_id) for issue_id in range(1, AMOUNT_ISSUES + 1)],
+        latency=LATENCY,
+    ).start()
+    test_jira_backend.auth = authenticate_to_jira(server.url, "", "")
+    test_jira_backend.settings.page_size = 100
+    for issue in server.issues[:AMOUNT_CHANGED]:
+        issue["fields"]["updated"] = datetime.now().isoformat()
+
+    try:
+        full_requests, full_bytes = _traffic(
+            server, test_jira_backend.get_tasks_by_board_id, 1
+        )
+        cached_requests, cached_bytes = _traffic(
+            server, test_jira_backend.get_tasks_by_board_id, 1
+        )
+
+        cached = measure(test_jira_backend.get_tasks_by_board_id, 1, repeat=3)
+        test_jira_backend.settings.issue_cache_path = ""
+        full_load = measure(test_jira_backend.get_tasks_by_board_id, 1, repeat=3)
+    finally:
+        server.stop()
+
+    print(
+        f"\n{AMOUNT_ISSUES} issues, {AMOUNT_CHANGED} changed @ {LATENCY * 1000:.0f}ms: "
+        f"full_load={full_load * 1000:.1f}ms "
+        f"({full_requests} requests, {full_bytes / 1e6:.1f}MB) "
+        f"cached_refresh={cached * 1000:.1f}ms "
+        f"({cached_requests} requests, {cached_bytes / 1e6:.2f}MB)"
+    )
+    assert cached < full_load
+    # the id/updated listing of all issues is left
+    assert cached_bytes * 4 < full_bytes
@@ -0,0 +1,47 @@
+import pytest
+
+from kanban_tui.backends.jira.jira_api import authenticate_to_jira
+from tests.fake_jira_server import FakeJiraServer, make_issue
+
+AMOUNT_ISSUES = 5_000
+PAGE_SIZE = 100
+LATENCY = 0.02
+
+
+def _first_page(backend) -> list:
+    pages = backend.iter_task_pages_by_board_id(board_id=1)
+    page = next(pages)
+    pages.close()
+    return page
+
+
+@pytest.mark.benchmark
+def test_load_large_jql_board(test_jira_backend, measure):
+    server = FakeJiraServer(
+        issues=[make_issue(issue_id) for issue_id in range(1, AMOUNT_ISSUES + 1)],
+        latency=LATENCY,
+        max_results_limit=PAGE_SIZE,
+    ).start()
+    test_jira_backend.auth = authenticate_to_jira(server.url, "", "")
+    test_jira_backend.settings.issue_cache_path = ""
+    test_jira_backend.settings.page_size = PAGE_SIZE
+
+    try:
+        test_jira_backend.settings.max_concurrent_requests = 1
+        assert len(test_jira_backend.get_tasks_by_board_id(1)) == AMOUNT_ISSUES
+        sequential = measure(test_jira_backend.get_tasks_by_board_id, 1, repeat=1)
+
+        test_jira_backend.settings.max_concurrent_requests = 4
+        assert len(test_jira_backend.get_tasks_by_board_id(1)) == AMOUNT_ISSUES
+        concurrent = measure(test_jira_backend.get_tasks_by_board_id, 1, repeat=3)
+        first_page = measure(_first_page, test_jira_backend, repeat=3)
+    finally:
+        server.stop()
+
+    print(
+        f"\n{AMOUNT_ISSUES} issues in pages of {PAGE_SIZE} @ {LATENCY * 1000:.0f}ms: "
+        f"sequential={sequential * 1000:.1f}ms concurrent={concurrent * 1000:.1f}ms "
+        f"first_page={first_page * 1000:.1f}ms"
+    )
+    assert concurrent < sequential
+    assert first_page < concurrent
@@ -0,0 +1,64 @@
+import datetime
+import json
+
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    create_connection,
+    create_new_board_db,
+    init_new_db,
+    task_factory,
+)
+from kanban_tui.classes.task import Task
+
+AMOUNT_TASKS = 50_000
+
+BOARD_QUERY_STR = """
+SELECT t.* FROM columns c
+INNER JOIN tasks t ON t.column = c.column_id
+WHERE c.board_id = 1
+ORDER BY c.position, t.sort_key, t.task_id
+;
+"""
+
+
+def _validating_factory(cursor, row):
+    # Row factory before trusted construction, validates every row
+    fields = [column[0] for column in cursor.description]
+    data = dict(zip(fields, row))
+    data["metadata"] = json.loads(data["metadata"]) if data["metadata"] else {}
+    return Task(**data)
+
+
+def _load_tasks(database: str, factory) -> list[Task]:
+    with create_connection(database=database) as con:
+        con.row_factory = factory
+        return con.execute(BOARD_QUERY_STR).fetchall()
+
+
+@pytest.mark.benchmark
+def test_materialize_tasks(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    create_new_board_db(name="Big", icon=":rocket:", database=test_database_path)
+    now = datetime.datetime.now().replace(microsecond=0)
+    with create_connection(database=test_database_path) as con:
+        con.executemany(
+            """
+            INSERT INTO tasks (title, column, description, creation_date, due_date, sort_key)
+            VALUES (?, ?, 'description', ?, ?, ?)
+            """,
+            ((f"Task {i}", i % 4 + 1, now, now, i // 4) for i in range(AMOUNT_TASKS)),
+        )
+        con.commit()
+
+    trusted_tasks = _load_tasks(test_database_path, task_factory)
+    assert len(trusted_tasks) == AMOUNT_TASKS
+    assert trusted_tasks == _load_tasks(test_database_path, _validating_factory)
+
+    validated = measure(_load_tasks, test_database_path, _validating_factory, repeat=3)
+    trusted = measure(_load_tasks, test_database_path, task_factory, repeat=3)
+    print(
+        f"\n{AMOUNT_TASKS} tasks: validated={validated * 1000:.1f}ms "
+        f"trusted={trusted * 1000:.1f}ms"
+    )
+    assert trusted < validated
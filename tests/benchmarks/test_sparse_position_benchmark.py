@@ -0,0 +1,122 @@
+import datetime
+
+import pytest
+
+from kanban_tui.backends.sqlite.database import (
+    TASK_SORT_KEY_GAP,
+    create_connection,
+    create_new_board_db,
+    get_task_by_column_db,
+    init_new_db,
+    move_task_position_db,
+)
+
+AMOUNT_TASKS = 10_000
+
+# Moves before tasks were ordered by sparse keys, every task between the old
+# and the new position is renumbered
+DENSE_MOVE_UP_STR = """
+UPDATE tasks
+SET dense_position = dense_position + 1
+WHERE column = :column
+  AND dense_position >= :target_position
+  AND dense_position < :current_position
+;
+"""
+DENSE_MOVE_DOWN_STR = """
+UPDATE tasks
+SET dense_position = dense_position - 1
+WHERE column = :column
+  AND dense_position > :current_position
+  AND dense_position <= :target_position
+;
+"""
+
+
+def _dense_moves(database: str, task_id: int) -> int:
+    """Moves the task to the top of its column and back, returns written rows"""
+    with create_connection(database=database) as con:
+        column, current_position = con.execute(
+            "SELECT column, dense_position FROM tasks WHERE task_id = ?", (task_id,)
+        ).fetchone()
+        for move_str, target_position in [
+            (DENSE_MOVE_UP_STR, 0),
+            (DENSE_MOVE_DOWN_STR, current_position),
+        ]:
+            con.execute(
+                move_str,
+                {
+                    "column": column,
+                    "current_position": current_position,
+                    "target_position": target_position,
+                },
+            )
+            con.execute(
+                "UPDATE tasks SET dense_position = ? WHERE task_id = ?",
+                (target_position, task_id),
+            )
+            current_position = target_position
+        con.commit()
+        return con.total_changes
+
+
+def _sort_keys(database: str) -> dict[int, int]:
+    with create_connection(database=database) as con:
+        return dict(con.execute("SELECT task_id, sort_key FROM tasks").fetchall())
+
+
+def _sparse_moves(database: str, task_id: int):
+    move_task_position_db(task_id=task_id, target_position=0, database=database)
+    move_task_position_db(
+        task_id=task_id, target_position=AMOUNT_TASKS - 1, database=database
+    )
+
+
+@pytest.mark.benchmark
+def test_move_in_long_column(test_database_path, measure):
+    init_new_db(database=test_database_path)
+    create_new_board_db(
+        name="Archive", icon=":file_cabinet:", database=test_database_path
+    )
+    now = datetime.datetime.now().replace(microsecond=0)
+    with create_connection(database=test_database_path) as con:
+        con.execute("ALTER TABLE tasks ADD COLUMN dense_position INTEGER")
+        con.executemany(
+            """
+            INSERT INTO tasks (title, column, description, creation_date, sort_key, dense_position)
+            VALUES (?, 4, '', ?, ?, ?)
+            """,
+            ((f"Task {i}", now, i * TASK_SORT_KEY_GAP, i) for i in range(AMOUNT_TASKS)),
+        )
+        con.commit()
+    last_task_id = AMOUNT_TASKS
+
+    dense_changes = _dense_moves(test_database_path, last_task_id)
+    sort_keys_before = _sort_keys(test_database_path)
+    move_task_position_db(
+        task_id=last_task_id, target_position=0, database=test_database_path
+    )
+    sort_keys_after = _sort_keys(test_database_path)
+    move_task_position_db(
+        task_id=last_task_id,
+        target_position=AMOUNT_TASKS - 1,
+        database=test_database_path,
+    )
+    sparse_changes = sum(
+        sort_keys_before[task_id] != sort_keys_after[task_id]
+        for task_id in sort_keys_before
+    )
+    assert dense_changes == 2 * AMOUNT_TASKS
+    assert sparse_changes == 1
+    tasks = get_task_by_column_db(column_id=4, database=test_database_path)
+    assert tasks[-1].task_id == last_task_id
+    assert [task.position for task in tasks] == list(range(AMOUNT_TASKS))
+
+    dense = measure(_dense_moves, test_database_path, last_task_id)
+    sparse = measure(_sparse_moves, test_database_path, last_task_id)
+    print(
+        f"\n{AMOUNT_TASKS} tasks column, move to top and back: "
+        f"dense={dense * 1000:.1f}ms ({dense_changes} rows) "
+        f"sparse={sparse * 1000:.1f}ms ({2 * sparse_changes} rows)"
+    )
+    assert sparse < dense
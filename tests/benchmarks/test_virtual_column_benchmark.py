@@ -0,0 +1,46 @@
+import time
+
+import pytest
+
+from kanban_tui.app import KanbanTui
+from kanban_tui.widgets.task_card import TaskCard
+from tests.worker_helpers import wait_for_workers
+
+AMOUNT_TASKS = 2_000
+APP_SIZE = (150, 50)
+
+
+async def _mount_board(app: KanbanTui) -> tuple[float, int]:
+    start = time.perf_counter()
+    async with app.run_test(size=APP_SIZE) as pilot:
+        await wait_for_workers(app)
+        await pilot.pause()
+        elapsed = time.perf_counter() - start
+        return elapsed, len(app.screen.query(TaskCard))
+
+
+@pytest.mark.benchmark
+async def test_virtual_column_mount(
+    no_task_app: KanbanTui, test_config_path, test_database_path
+):
+    no_task_app.backend.create_new_tasks(
+        [{"title": f"Task {idx}", "column": 3} for idx in range(AMOUNT_TASKS)]
+    )
+
+    no_task_app.config.board.virtual_column_threshold = 0
+    full, full_cards = await _mount_board(no_task_app)
+
+    virtual_app = KanbanTui(
+        config_path=test_config_path, database_path=test_database_path
+    )
+    virtual_app.config.board.virtual_column_threshold = 500
+    virtual, virtual_cards = await _mount_board(virtual_app)
+    virtual_app.backend.close()
+
+    print(
+        f"\n{AMOUNT_TASKS} tasks in one column: all cards={full * 1000:.0f}ms "
+        f"({full_cards} cards) virtual={virtual * 1000:.0f}ms ({virtual_cards} cards)"
+    )
+    assert full_cards == AMOUNT_TASKS
+    assert virtual_cards < 100
+    assert virtual < full
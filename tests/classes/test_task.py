@@ -69,3 +69,46 @@ def test_move_Task():
     assert test_task_moved.start_date is None
     assert test_task_moved.finish_date is None
     assert test_task_moved.column == 1
+
+
+def test_Task_from_trusted():
+    task_data = {
+        "task_id": 1337,
+        "title": "Test_Task",
+        "column": 1,
+        "position": 0,
+        "creation_date": datetime.now(),
+        "start_date": None,
+        "finish_date": None,
+        "category": None,
+        "due_date": datetime.now() + timedelta(days=7),
+        "description": "",
+        "blocked_by": [],
+        "blocking": [2],
+        "metadata": {},
+    }
+    trusted_task = Task.from_trusted(dict(task_data))
+
+    assert trusted_task == Task(**task_data)
+    assert trusted_task.days_left == 8
+    assert trusted_task.has_dependents
+    assert trusted_task.model_fields_set == set(task_data)
+    # behaves like a validated model
+    assert trusted_task.model_dump() == Task(**task_data).model_dump()
+    assert trusted_task.model_copy(update={"title": "Copy"}).title == "Copy"
+    assert trusted_task.model_extra is None
+
+
+def test_Task_from_trusted_validates_incomplete_data():
+    # missing fields fall back to regular validation and fill defaults
+    trusted_task = Task.from_trusted(
+        {
+            "task_id": "1337",
+            "title": "Test_Task",
+            "column": 1,
+            "creation_date": datetime.now(),
+        }
+    )
+
+    assert trusted_task.task_id == 1337
+    assert trusted_task.blocked_by == []
@@ -0,0 +1,54 @@
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from kanban_tui.cli import cli
+from kanban_tui.config import Backends
+
+
+def test_audit_wrong_backend(test_app, test_jira_config):
+    test_app.config.backend.mode = Backends.JIRA
+    test_app.backend = test_app.get_backend()
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, args=["audit", "compact"], obj=test_app)
+        assert result.exit_code == 2
+        assert (
+            f"Please change the backend to `{Backends.SQLITE}` before using the `audit` command."
+            in result.output
+        )
+
+
+def test_audit_compact_nothing_to_do(test_app):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, args=["audit", "compact"], obj=test_app)
+        assert result.exit_code == 0
+        assert result.output == "No audit events exceed the retention limits.\n"
+
+
+def test_audit_compact_max_rows(test_app):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            args=["audit", "compact", "--max-rows", "6", "--archive-dir", "archive"],
+            obj=test_app,
+        )
+        assert result.exit_code == 0
+        assert "Compacted 10 audit events into daily summaries." in result.output
+        assert len(list(Path("archive").glob("audits_*.jsonl.gz"))) == 1
+
+    assert len(test_app.backend.get_filtered_events(filter={})) == 6
+    assert test_app.backend.get_filtered_event_count(filter={}) == 16
+
+
+def test_audit_compact_uses_config(test_app):
+    test_app.config.backend.sqlite_settings.audit_retention.max_rows = 10
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, args=["audit", "compact"], obj=test_app)
+        assert result.exit_code == 0
+        assert "Compacted 6 audit events into daily summaries." in result.output
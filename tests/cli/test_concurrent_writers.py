@@ -0,0 +1,60 @@
+import os
+import subprocess
+import sys
+import textwrap
+
+from kanban_tui.app import KanbanTui
+
+WRITERS = 4
+TASKS_PER_WRITER = 10
+
+WRITER_SCRIPT = textwrap.dedent(
+    """
+    import sys
+    from kanban_tui.cli import cli
+
+    writer = sys.argv[1]
+    for i in range(int(sys.argv[2])):
+        cli.main(
+            ["task", "create", f"writer_{writer}_{i}", "--column", "1"],
+            standalone_mode=False,
+        )
+        cli.main(["task", "move", f"{i + 1}", "2"], standalone_mode=False)
+    """
+)
+
+
+def test_concurrent_cli_writers_on_open_board(
+    test_app: KanbanTui, test_config_path, test_database_path
+):
+    env = {
+        **os.environ,
+        "KANBAN_TUI_CONFIG_FILE": test_config_path,
+        "KANBAN_TUI_DATABASE_FILE": test_database_path,
+    }
+    writers = [
+        subprocess.Popen(
+            [sys.executable, "-c", WRITER_SCRIPT, str(writer), str(TASKS_PER_WRITER)],
+            env=env,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+        for writer in range(WRITERS)
+    ]
+
+    # keep reading the board while the writers are running
+    while any(writer.poll() is None for writer in writers):
+        assert test_app.backend.get_tasks_on_active_board()
+
+    for writer in writers:
+        _, stderr = writer.communicate()
+        assert writer.returncode == 0, stderr
+        assert "database is locked" not in stderr
+
+    tasks = test_app.backend.get_tasks_on_active_board()
+    assert len(tasks) == 5 + WRITERS * TASKS_PER_WRITER
+
+    for column in test_app.backend.get_columns():
+        positions = [task.position for task in tasks if task.column == column.column_id]
+        assert sorted(positions) == list(range(len(positions)))
@@ -0,0 +1,136 @@
+import os
+import stat
+import sys
+import threading
+
+import click
+import pytest
+from click.testing import CliRunner
+
+from kanban_tui.cli import cli
+from kanban_tui.cli.serve_commands import KanbanTuiDaemon
+from kanban_tui.daemon import can_forward, forward_to_daemon
+
+
+@pytest.fixture
+def daemon_socket(test_app, test_config_path, test_database_path, tmp_path):
+    socket_path = (tmp_path / "ktui.sock").as_posix()
+    daemon = KanbanTuiDaemon(
+        socket_path=socket_path,
+        command=cli,
+        config_path=test_config_path,
+        database_path=test_database_path,
+    )
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    yield socket_path
+    daemon.shutdown()
+    daemon.server_close()
+
+
+def test_forwarded_command_matches_in_process(test_app, daemon_socket):
+    in_process = CliRunner().invoke(cli, args=["task", "list", "--json"], obj=test_app)
+
+    response = forward_to_daemon(["task", "list", "--json"], socket_path=daemon_socket)
+    assert response is not None
+    assert response["exit_code"] == 0
+    assert response["stdout"] == in_process.output
+
+
+def test_forwarded_command_changes_database(test_app, daemon_socket):
+    response = forward_to_daemon(
+        ["task", "create", "Forwarded", "--column", "2"], socket_path=daemon_socket
+    )
+    assert response is not None
+    assert response["exit_code"] == 0
+    assert "Forwarded" in [
+        task.title for task in test_app.backend.get_tasks_on_active_board()
+    ]
+
+
+def test_forwarded_command_sees_changes_of_other_processes(test_app, daemon_socket):
+    # loads the categories into the cache of the daemon backend
+    response = forward_to_daemon(
+        ["category", "update", "99", "--name", "missing"], socket_path=daemon_socket
+    )
+    assert response is not None
+    assert "There is no category with category_id = 99" in response["stdout"]
+
+    test_app.backend.update_category(category_id=1, name="renamed", color="#FF0000")
+
+    response = forward_to_daemon(
+        ["category", "update", "1", "--color", "#0000FF"], socket_path=daemon_socket
+    )
+    assert response is not None
+    assert response["exit_code"] == 0
+    category = test_app.backend.get_category_by_id(category_id=1)
+    assert (category.name, category.color) == ("renamed", "#0000FF")
+
+
+def test_daemon_socket_is_private(daemon_socket):
+    # bound with a restrictive umask, no chmod after the socket exists
+    assert stat.S_IMODE(os.stat(daemon_socket).st_mode) == 0o600
+
+
+@pytest.mark.parametrize(
+    "code, expected",
+    [(None, 0), (0, 0), (3, 3), ("failed", 1)],
+)
+def test_forwarded_system_exit_code(
+    test_app, test_config_path, test_database_path, tmp_path, code, expected
+):
+    @click.command()
+    def exits():
+        sys.exit(code)
+
+    daemon = KanbanTuiDaemon(
+        socket_path=(tmp_path / "ktui.sock").as_posix(),
+        command=exits,
+        config_path=test_config_path,
+        database_path=test_database_path,
+    )
+    try:
+        exit_code, _, _ = daemon.run_command([], cwd=tmp_path.as_posix())
+    finally:
+        daemon.server_close()
+    assert exit_code == expected
+
+
+def test_forwarded_usage_error(daemon_socket):
+    response = forward_to_daemon(["task", "move"], socket_path=daemon_socket)
+    assert response is not None
+    assert response["exit_code"] == 2
+    assert "Usage: ktui task move" in response["stderr"]
+
+
+def test_forwarded_prompt_aborts(test_app, daemon_socket):
+    response = forward_to_daemon(["task", "delete", "1"], socket_path=daemon_socket)
+    assert response is not None
+    assert response["exit_code"] == 1
+    assert "Aborted!" in response["stderr"]
+    assert test_app.backend.get_task_by_id(task_id=1) is not None
+
+
+def test_forward_without_daemon(test_app, tmp_path):
+    socket_path = (tmp_path / "missing.sock").as_posix()
+    assert forward_to_daemon(["task", "list"], socket_path=socket_path) is None
+
+
+def test_forward_to_daemon_of_other_database(daemon_socket, monkeypatch, tmp_path):
+    monkeypatch.setenv("KANBAN_TUI_DATABASE_FILE", (tmp_path / "other.db").as_posix())
+    assert forward_to_daemon(["task", "list"], socket_path=daemon_socket) is None
+
+
+@pytest.mark.parametrize(
+    "argv, expected",
+    [
+        (["task", "list"], True),
+        (["board", "list"], True),
+        (["task", "import", "tasks.json"], False),
+        (["info"], False),
+        ([], False),
+    ],
+)
+def test_can_forward(argv, expected, monkeypatch):
+    monkeypatch.setattr("sys.stdin.isatty", lambda: False)
+    assert can_forward(argv) == expected
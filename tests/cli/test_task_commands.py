@@ -1,3 +1,5 @@
+import sqlite3
+
 import pytest
 from datetime import datetime
 from freezegun import freeze_time
@@ -1732,3 +1734,244 @@ def test_task_update_dependencies_persist_across_updates(test_app):
         task = test_app.backend.get_task_by_id(task_id=1)
         assert sorted(task.blocked_by) == [2, 3]
         assert task.title == "New Title"
+
+
+def test_task_import_json_array(test_app):
+    runner = CliRunner()
+    tasks_json = """[
+        {"title": "Imported 1", "description": "First", "column": 2},
+        {"title": "Imported 2", "due_date": "2026-01-01"},
+        {"title": "Imported 3", "column": 2}
+    ]"""
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli, args=["task", "import"], input=tasks_json, obj=test_app
+        )
+        assert result.exit_code == 0
+        assert result.output == "Created 3 tasks with task_ids = [6, 7, 8].\n"
+
+    tasks = {
+        task.task_id: task for task in test_app.backend.get_tasks_on_active_board()
+    }
+    assert len(tasks) == 8
+    assert tasks[6].description == "First"
+    assert tasks[7].column == 1
+    assert tasks[7].due_date == datetime(2026, 1, 1)
+    # appended after the existing tasks of the column
+    column_2_positions = [
+        task.position for task in test_app.backend.get_tasks_by_column(column_id=2)
+    ]
+    assert column_2_positions == list(range(len(column_2_positions)))
+    assert [tasks[6].position, tasks[8].position] == column_2_positions[-2:]
+
+
+def test_task_import_ndjson_with_dependencies(test_app):
+    runner = CliRunner()
+    # blank lines between the objects are skipped
+    tasks_ndjson = (
+        '{"title": "Imported 1", "depends_on": [1, 2]}\n'
+        "\n"
+        '{"title": "Imported 2", "depends_on": [3, 99, 3]}'
+    )
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            args=["task", "import", "--column", "2"],
+            input=tasks_ndjson,
+            obj=test_app,
+        )
+        assert result.exit_code == 0
+        assert result.output == (
+            "Task 99 does not exist, skipping dependency.\n"
+            "Created 2 tasks with task_ids = [6, 7].\n"
+        )
+
+    new_tasks = test_app.backend.get_tasks_by_ids([6, 7])
+    assert [task.column for task in new_tasks] == [2, 2]
+    assert new_tasks[0].blocked_by == [1, 2]
+    assert new_tasks[1].blocked_by == [3]
+    assert test_app.backend.get_task_by_id(3).blocking == [7]
+
+
+def test_task_import_json_output(test_app):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            args=["task", "import", "--json"],
+            input='{"title": "Imported"}',
+            obj=test_app,
+        )
+        assert result.exit_code == 0
+        assert '"task_id": 6' in result.output
+        assert '"title": "Imported"' in result.output
+
+
+@pytest.mark.parametrize(
+    "tasks_input,message",
+    [
+        ('[{"title": "Missing bracket"}', "Could not read tasks to import"),
+        ('{"description": "No title"}', "Could not read tasks to import"),
+        (
+            '{"title": "Wrong column", "column": 42}',
+            "Task 1 `Wrong column`: column 42 does not exist.",
+        ),
+        (
+            '{"title": "Column zero", "column": 0}',
+            "Task 1 `Column zero`: column 0 does not exist.",
+        ),
+        (
+            '{"title": "Fine"}\n{"title": "Wrong category", "category": 42}',
+            "Task 2 `Wrong category`: category 42 does not exist.",
+        ),
+        ("", "No tasks to import."),
+    ],
+)
+def test_task_import_invalid_input(test_app, tasks_input: str, message: str):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli, args=["task", "import"], input=tasks_input, obj=test_app
+        )
+        assert result.exit_code == 0
+        assert message in result.output
+    assert len(test_app.backend.get_tasks_on_active_board()) == 5
+
+
+def test_task_import_without_visible_column(test_app):
+    for column in test_app.backend.get_columns():
+        test_app.backend.update_column_visibility(
+            column_id=column.column_id, visible=False
+        )
+
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            args=["task", "import"],
+            input='{"title": "Nowhere"}\n{"title": "Given column", "column": 2}',
+            obj=test_app,
+        )
+        assert result.exit_code == 0
+        assert (
+            "Task 1 `Nowhere`: no column given and the active board has no visible "
+            "column." in result.output
+        )
+        assert "Task 2" not in result.output
+        assert "No tasks imported." in result.output
+    assert len(test_app.backend.get_tasks_on_active_board()) == 5
+
+
+def test_task_import_column_of_other_board(test_app):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        # create 2nd board first
+        runner.invoke(
+            cli,
+            args=["board", "create", "'CLI Test'", "--icon", ":books:"],
+            obj=test_app,
+        )
+        result = runner.invoke(
+            cli,
+            args=["task", "import"],
+            input='{"title": "Other board", "column": 6}',
+            obj=test_app,
+        )
+        assert result.exit_code == 0
+    assert test_app.backend.get_tasks_by_column(column_id=6)[-1].title == "Other board"
+
+
+def test_task_import_reports_backend_errors(test_app, monkeypatch):
+    def failing_create(tasks):
+        raise sqlite3.IntegrityError("CHECK constraint failed")
+
+    monkeypatch.setattr(test_app.backend, "create_new_tasks", failing_create)
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli, args=["task", "import"], input='{"title": "Fails"}', obj=test_app
+        )
+        assert result.exit_code == 0
+        assert (
+            "Could not import tasks, no tasks imported: CHECK constraint failed"
+            in result.output
+        )
+
+
+def test_task_move_ids(test_app):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli, args=["task", "move", "--ids", "3,1", "2"], obj=test_app
+        )
+        assert result.exit_code == 0
+        assert result.output == "Moved 2 tasks with task_ids = [3, 1] to column 2.\n"
+
+    # moved tasks are put on top in the given order, gaps are closed
+    column_2_tasks = test_app.backend.get_tasks_by_column(column_id=2)
+    assert [(t.task_id, t.position) for t in column_2_tasks] == [(3, 0), (1, 1), (4, 2)]
+    assert all(t.start_date is not None for t in column_2_tasks[:2])
+    column_1_tasks = test_app.backend.get_tasks_by_column(column_id=1)
+    assert [(t.task_id, t.position) for t in column_1_tasks] == [(2, 0)]
+
+
+def test_task_move_from_column_with_category(test_app):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli,
+            args=["task", "move", "--from-column", "1", "--category", "1", "3"],
+            obj=test_app,
+        )
+        assert result.exit_code == 0
+        assert result.output == "Moved 1 tasks with task_ids = [1] to column 3.\n"
+
+    moved_task = test_app.backend.get_task_by_id(task_id=1)
+    assert moved_task.column == 3
+    assert moved_task.finished
+    assert [t.task_id for t in test_app.backend.get_tasks_by_column(column_id=1)] == [
+        2,
+        3,
+    ]
+
+
+def test_task_move_ids_skips_missing_and_blocked_tasks(test_app):
+    test_app.backend.create_task_dependency(task_id=1, depends_on_task_id=4)
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(
+            cli, args=["task", "move", "--ids", "1,9,4,2", "2"], obj=test_app
+        )
+        assert result.exit_code == 0
+        assert result.output == (
+            "There is no task with task_id = 9.\n"
+            "Task with task_id = 4 is already in column 2.\n"
+            "Cannot move task with task_id = 1: Task is blocked by unfinished "
+            "dependencies: #4 'Task_doing_0'\n"
+            "Moved 1 tasks with task_ids = [2] to column 2.\n"
+        )
+    assert test_app.backend.get_task_by_id(task_id=1).column == 1
+
+
+@pytest.mark.parametrize(
+    "args",
+    [
+        ["--ids", "1,2", "1", "2"],
+        ["--ids", "1,2"],
+        ["--ids", "a,b", "2"],
+        ["--category", "1", "1", "2"],
+        ["1"],
+    ],
+)
+def test_task_move_invalid_arguments(test_app, args: list[str]):
+    runner = CliRunner()
+    with runner.isolated_filesystem():
+        result = runner.invoke(cli, args=["task", "move", *args], obj=test_app)
+        assert result.exit_code == 2
+    assert [t.column for t in test_app.backend.get_tasks_on_active_board()] == [
+        1,
+        1,
+        1,
+        2,
+        3,
+    ]
@@ -7,8 +7,32 @@ import pytest
 from freezegun import freeze_time
 
 from kanban_tui.constants import AUTH_NAME, CONFIG_NAME, DATABASE_NAME
-from kanban_tui.config import Settings, init_config
+from kanban_tui.config import JqlEntry, Settings, init_config
 from kanban_tui.app import KanbanTui
+from kanban_tui.backends.jira.backend import JiraBackend
+from tests.fake_jira_server import FakeJiraServer, make_issue
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--benchmark",
+        action="store_true",
+        default=False,
+        help="run benchmarks marked with @pytest.mark.benchmark",
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "benchmark: opt-in performance benchmark")
+
+
+def pytest_collection_modifyitems(config, items):
+    if config.getoption("--benchmark"):
+        return
+    skip_benchmark = pytest.mark.skip(reason="needs --benchmark option to run")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip_benchmark)
 
 
 # Paths
@@ -50,16 +74,48 @@ def test_config(
 
 @pytest.fixture
 def test_jira_config(
-    test_config_path, test_auth_path
+    test_file_location: Path, test_config_path, test_auth_path
 ) -> Generator[Settings, None, None]:
     config_path = Path(__file__).parent / "sample-configs/jira_backend.toml"
     os.environ["KANBAN_TUI_CONFIG_FILE"] = config_path.as_posix()
 
     cfg = Settings()
     cfg.backend.jira_settings.auth_file_path = test_auth_path
+    cfg.backend.jira_settings.issue_cache_path = (
+        test_file_location / "jira_cache.db"
+    ).as_posix()
     yield cfg
 
 
+@pytest.fixture
+def fake_jira_server() -> Generator[FakeJiraServer, None, None]:
+    issues = [
+        make_issue(issue_id, status=["To Do", "In Progress", "Done"][issue_id % 3])
+        for issue_id in range(1, 121)
+    ]
+    server = FakeJiraServer(issues=issues).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def test_jira_backend(
+    test_jira_config: Settings, test_auth_path, fake_jira_server: FakeJiraServer
+) -> Generator[JiraBackend, None, None]:
+    os.environ["KANBAN_TUI_AUTH_FILE"] = test_auth_path
+    settings = test_jira_config.backend.jira_settings
+    settings.base_url = fake_jira_server.url
+    settings.jqls = [
+        JqlEntry(
+            id=1,
+            name="KTUI",
+            jql="project = KTUI",
+            column_mapping={"To Do": 1, "In Progress": 2, "Done": 3},
+        )
+    ]
+    yield JiraBackend(settings=settings)
+
+
 @pytest.fixture
 def test_auth_file():
     config_path = Path(__file__).parent / "sample-configs/sample_auth.toml"
@@ -70,7 +126,9 @@ def test_auth_file():
 def empty_app(
     test_config_path, test_database_path, test_config
 ) -> Generator[KanbanTui, None, None]:
-    yield KanbanTui(config_path=test_config_path, database_path=test_database_path)
+    app = KanbanTui(config_path=test_config_path, database_path=test_database_path)
+    yield app
+    app.backend.close()
 
 
 @pytest.fixture
@@ -85,6 +143,7 @@ def no_task_app(
             icon=":sparkles:",
         )
     yield app
+    app.backend.close()
 
 
 # Create Testapp and inject test tasks
@@ -0,0 +1,256 @@
+"""Local fake of the Jira search API for tests and benchmarks
+
+Serves `GET /rest/api/2/search` (startAt pages) and the cloud endpoint
+`GET /rest/api/3/search/jql` (nextPageToken pages) for a fixed set of
+generated issues, as well as the cloud issue count. It understands the JQL
+subset the Jira backend sends: `id in (...)`, `id = "..."`,
+`duedate IS NOT EMPTY`, `updated >= "-<minutes>m"` and `ORDER BY duedate`,
+anything else matches every issue.
+"""
+
+import json
+import re
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlparse
+
+STATUSES = {
+    "To Do": "To Do",
+    "In Progress": "In Progress",
+    "Done": "Done",
+}
+ID_IN_PATTERN = re.compile(r"\bid\s+in\s*\(([^)]*)\)", re.IGNORECASE)
+ID_EQUALS_PATTERN = re.compile(r"\bid\s*=\s*\"?(\d+)\"?", re.IGNORECASE)
+DUEDATE_NOT_EMPTY_PATTERN = re.compile(r"\bduedate\s+IS\s+NOT\s+EMPTY", re.IGNORECASE)
+UPDATED_SINCE_PATTERN = re.compile(r"\bupdated\s*>=\s*\"-(\d+)m\"", re.IGNORECASE)
+ORDER_BY_DUEDATE_PATTERN = re.compile(r"\bORDER\s+BY\s+duedate\b", re.IGNORECASE)
+
+
+def make_issue(
+    issue_id: int,
+    status: str = "To Do",
+    links: list[dict[str, Any]] | None = None,
+    due_date: str | None = None,
+) -> dict[str, Any]:
+    """Builds a Jira issue payload with all fields the backend reads"""
+    created = datetime(2025, 1, 1) + timedelta(minutes=issue_id)
+    return {
+        "id": str(issue_id),
+        "key": f"KTUI-{issue_id}",
+        "self": f"http://jira/rest/api/2/issue/{issue_id}",
+        "fields": {
+            "summary": f"Issue {issue_id}",
+            "description": f"Description of issue {issue_id}",
+            "status": {
+                "id": str(list(STATUSES).index(status) + 1),
+                "name": status,
+                "statusCategory": {"name": STATUSES[status]},
+            },
+            "assignee": {"displayName": "Jane Doe", "emailAddress": "jane@doe.com"},
+            "reporter": {"displayName": "John Doe"},
+            "priority": {"id": "3", "name": "Medium"},
+            "issuetype": {"id": "1", "name": "Task"},
+            "created": created.isoformat(),
+            "updated": created.isoformat(),
+            "duedate": due_date,
+            "labels": ["kanban"],
+            "components": [{"name": "tui"}],
+            "issuelinks": links or [],
+            "resolution": None,
+            "resolutiondate": None,
+            # Fields the backend never reads, should not be requested
+            "comment": {"comments": [{"body": "x" * 500} for _ in range(5)]},
+            "attachment": [],
+            "worklog": {"worklogs": []},
+        },
+    }
+
+
+class FakeJiraServer:
+    """Threaded HTTP server answering JQL searches from `issues`
+
+    All handled requests are recorded in `requests` as (path, params) tuples
+    and the response body sizes are summed up in `bytes_sent`. `latency`
+    delays each response to simulate network round trips and
+    `max_results_limit` caps the page size like Jira's system limit.
+    Clearing `following_pages` holds back all pages after the first one
+    until it is set again, `following_page_held` is set once a page is held.
+    """
+
+    def __init__(
+        self,
+        issues: list[dict[str, Any]],
+        latency: float = 0.0,
+        max_results_limit: int = 1000,
+    ):
+        self.issues = issues
+        self.latency = latency
+        self.max_results_limit = max_results_limit
+        self.requests: list[tuple[str, dict[str, str]]] = []
+        self.bytes_sent = 0
+        self.following_pages = threading.Event()
+        self.following_pages.set()
+        self.following_page_held = threading.Event()
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeJiraServer":
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.following_pages.set()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def search(self, params: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        jql = params.get("jql", "")
+        matches, unknown_ids = self._filter_issues(jql)
+        if unknown_ids and params.get("validateQuery") != "warn":
+            return 400, {
+                "errorMessages": [
+                    f"An issue with key '{issue_id}' does not exist for field 'id'."
+                    for issue_id in unknown_ids
+                ]
+            }
+
+        start_at = int(params.get("startAt", 0))
+        max_results = min(int(params.get("maxResults", 50)), self.max_results_limit)
+        fields = params.get("fields", "*all")
+        page = matches[start_at : start_at + max_results]
+        return 200, {
+            "startAt": start_at,
+            "maxResults": max_results,
+            "total": len(matches),
+            "issues": [self._project(issue, fields) for issue in page],
+            "warningMessages": [
+                f"An issue with key '{issue_id}' does not exist for field 'id'."
+                for issue_id in unknown_ids
+            ],
+        }
+
+    def search_with_token(self, params: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        matches, _ = self._filter_issues(params.get("jql", ""))
+        start_at = int(params.get("nextPageToken", 0))
+        max_results = min(int(params.get("maxResults", 50)), self.max_results_limit)
+        fields = params.get("fields", "*all")
+        page = matches[start_at : start_at + max_results]
+        next_start = start_at + len(page)
+        is_last = next_start >= len(matches)
+        payload: dict[str, Any] = {
+            "issues": [self._project(issue, fields) for issue in page],
+            "isLast": is_last,
+        }
+        if not is_last:
+            payload["nextPageToken"] = str(next_start)
+        return 200, payload
+
+    def count(self, params: dict[str, str]) -> tuple[int, dict[str, Any]]:
+        matches, _ = self._filter_issues(params.get("jql", ""))
+        return 200, {"count": len(matches)}
+
+    def _filter_issues(self, jql: str) -> tuple[list[dict[str, Any]], list[str]]:
+        if match := ID_IN_PATTERN.search(jql):
+            requested = [part.strip() for part in match.group(1).split(",")]
+        elif match := ID_EQUALS_PATTERN.search(jql):
+            requested = [match.group(1)]
+        else:
+            issues = list(self.issues)
+            if DUEDATE_NOT_EMPTY_PATTERN.search(jql):
+                issues = [issue for issue in issues if issue["fields"]["duedate"]]
+            if match := UPDATED_SINCE_PATTERN.search(jql):
+                since = datetime.now() - timedelta(minutes=int(match.group(1)))
+                issues = [
+                    issue
+                    for issue in issues
+                    if datetime.fromisoformat(issue["fields"]["updated"]) >= since
+                ]
+            if ORDER_BY_DUEDATE_PATTERN.search(jql):
+                issues.sort(key=lambda issue: issue["fields"]["duedate"] or "9999")
+            return issues, []
+
+        issues_by_id = {issue["id"]: issue for issue in self.issues}
+        return (
+            [issues_by_id[i] for i in requested if i in issues_by_id],
+            [i for i in requested if i not in issues_by_id],
+        )
+
+    @staticmethod
+    def _project(issue: dict[str, Any], fields: str) -> dict[str, Any]:
+        if "*all" in fields.split(","):
+            return issue
+        requested = set(fields.split(","))
+        return {
+            **issue,
+            "fields": {
+                name: value
+                for name, value in issue["fields"].items()
+                if name in requested
+            },
+        }
+
+    def _handler_class(self) -> type[BaseHTTPRequestHandler]:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                url = urlparse(self.path)
+                length = int(self.headers.get("Content-Length", 0))
+                params = json.loads(self.rfile.read(length) or b"{}")
+                with server._lock:
+                    server.requests.append((url.path, params))
+                if server.latency:
+                    time.sleep(server.latency)
+
+                if url.path.rstrip("/").endswith("/search/approximate-count"):
+                    self._respond(*server.count(params))
+                else:
+                    self._respond(404, {"errorMessages": ["Not found"]})
+
+            def do_GET(self):
+                url = urlparse(self.path)
+                params = {
+                    key: values[-1] for key, values in parse_qs(url.query).items()
+                }
+                with server._lock:
+                    server.requests.append((url.path, params))
+                if server.latency:
+                    time.sleep(server.latency)
+                if int(params.get("startAt", 0)) or "nextPageToken" in params:
+                    if not server.following_pages.is_set():
+                        server.following_page_held.set()
+                    # released by the test or by stopping the server
+                    server.following_pages.wait()
+
+                if url.path.rstrip("/") == "/rest/api/2/search":
+                    status, payload = server.search(params)
+                elif url.path.rstrip("/") == "/rest/api/3/search/jql":
+                    status, payload = server.search_with_token(params)
+                else:
+                    status, payload = 404, {"errorMessages": ["Not found"]}
+                self._respond(status, payload)
+
+            def _respond(self, status: int, payload: dict[str, Any]):
+                body = json.dumps(payload).encode()
+                with server._lock:
+                    server.bytes_sent += len(body)
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
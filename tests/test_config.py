@@ -3,7 +3,7 @@ from pathlib import Path
 
 from kanban_tui.backends.jira.backend import JiraBackend
 from kanban_tui.config import Settings, TaskAppendModes, init_config
-from kanban_tui.constants import AUTH_FILE
+from kanban_tui.constants import AUTH_FILE, JIRA_CACHE_FILE
 
 
 def test_read_sample_theme_from_env() -> None:
@@ -77,6 +77,7 @@ def test_default_config(test_config: Settings, test_database_path: str) -> None:
             "theme": "dracula",
             "columns_in_view": 3,
             "auto_refresh_interval": 0,
+            "virtual_column_threshold": 500,
         },
         "task": {
             "always_expanded": False,
@@ -90,6 +91,19 @@ def test_default_config(test_config: Settings, test_database_path: str) -> None:
             "sqlite_settings": {
                 "database_path": test_database_path,
                 "active_board_id": 1,
+                "performance": {
+                    "journal_mode": "wal",
+                    "busy_timeout": 5000,
+                    "synchronous": "normal",
+                    "cache_size": -16000,
+                    "mmap_size": 0,
+                },
+                "audit_retention": {
+                    "max_age_days": 0,
+                    "max_rows": 0,
+                    "archive_dir": "",
+                    "auto_compact": True,
+                },
             },
             "claude_settings": {
                 "active_session_id": "",
@@ -100,6 +114,10 @@ def test_default_config(test_config: Settings, test_database_path: str) -> None:
                 "auth_file_path": AUTH_FILE.as_posix(),
                 "jqls": [],
                 "active_jql": 1,
+                "page_size": 100,
+                "max_concurrent_requests": 4,
+                "board_info_ttl": 60,
+                "issue_cache_path": JIRA_CACHE_FILE.as_posix(),
             },
         },
     }
@@ -0,0 +1,21 @@
+"""Helpers for app tests running backend calls in workers"""
+
+from textual.app import App
+
+
+async def wait_for_workers(app: App) -> None:
+    """Waits until no worker of the app runs anymore
+
+    Workers often start follow-up workers, e.g. an auto refresh tick starting
+    a task reload, so waiting once for the running workers is not enough.
+    """
+    while any(not worker.is_finished for worker in app.workers):
+        await app.workers.wait_for_complete()
+
+
+async def wait_for_worker_group(app: App, group: str) -> None:
+    """Waits until the workers of one group finished, others keep running"""
+    workers = [worker for worker in app.workers if worker.group == group]
+    # an empty list would wait for all workers
+    if workers:
+        await app.workers.wait_for_complete(workers)